@@ -914,16 +914,14 @@ def diff(
         format_diff_as_json,
         format_diff_as_markdown,
         format_diff_as_table,
-        load_scan_from_file,
+        load_scans_parallel,
     )
 
     try:
         # Load both scan files
         console.print(f"[cyan]Loading scan 1: {scan1}[/cyan]")
-        result1 = load_scan_from_file(scan1)
-
         console.print(f"[cyan]Loading scan 2: {scan2}[/cyan]")
-        result2 = load_scan_from_file(scan2)
+        result1, result2 = load_scans_parallel(scan1, scan2)
 
         # Compare scans
         console.print("[cyan]Comparing scans...[/cyan]")
@@ -12,6 +12,22 @@ import re
 from ai_bom.config import API_KEY_PATTERNS, KNOWN_AI_ENDPOINTS
 
 
+def _as_group(pattern: re.Pattern[str]) -> str:
+    """Wrap a pattern's source in a group that keeps its case-insensitivity.
+
+    A leading ``(?i)`` is only legal at the start of a whole expression, so
+    it becomes a scoped ``(?i:...)`` group inside the alternation.
+    """
+    if pattern.flags & re.IGNORECASE:
+        return f"(?i:{pattern.pattern.removeprefix('(?i)')})"
+    return f"(?:{pattern.pattern})"
+
+
+# All API key patterns as one alternation.  Most scanned lines hold no key,
+# and this rules them out in a single pass instead of one search per pattern.
+_ANY_API_KEY = re.compile("|".join(_as_group(pattern) for pattern, _ in API_KEY_PATTERNS))
+
+
 def match_endpoint(url: str) -> tuple[str, str] | None:
     """
     Match a URL against known AI service endpoints.
@@ -66,7 +82,11 @@ def detect_api_key(text: str) -> list[tuple[str, str, str]]:
         [("sk-ant-t...st123", "Anthropic", "sk-ant-[a-zA-Z0-9_-]{32,}")]
     """
     results: list[tuple[str, str, str]] = []
+    if not _ANY_API_KEY.search(text):
+        return results
 
+    # Patterns overlap (sk- and sk-ant-, say), so each one is still run on
+    # its own to report every provider that matches
     for pattern, provider in API_KEY_PATTERNS:
         for match in pattern.finditer(text):
             key = match.group(0)
@@ -81,3 +101,17 @@ def detect_api_key(text: str) -> list[tuple[str, str, str]]:
             results.append((masked_key, provider, str(pattern.pattern)))
 
     return results
+
+
+def has_api_key(text: str) -> bool:
+    """Return True if ``text`` contains anything matching an API key pattern.
+
+    Cheaper than :func:`detect_api_key` when the keys themselves are not needed.
+
+    Args:
+        text: Text content to scan
+
+    Returns:
+        True if any pattern in ``API_KEY_PATTERNS`` matches
+    """
+    return _ANY_API_KEY.search(text) is not None
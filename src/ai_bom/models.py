@@ -81,6 +81,17 @@ class AIComponent(BaseModel):
     flags: list[str] = Field(default_factory=list)
     source: str = ""  # which scanner found this: "code", "docker", "network", "cloud", "n8n"
 
+    @classmethod
+    def trusted(cls, **data: Any) -> AIComponent:
+        """Build a component from already-typed values without validation.
+
+        Uses ``model_construct`` so pydantic's validator is skipped; defaults
+        and default factories still apply.  Only for internal callers that
+        pass enum members, model instances and correctly typed scalars — use
+        the normal constructor for anything parsed from external input.
+        """
+        return cls.model_construct(**data)
+
 
 class N8nWorkflowInfo(BaseModel):
     """Information about an n8n workflow."""
@@ -116,39 +127,48 @@ class ScanResult(BaseModel):
     summary: ScanSummary = Field(default_factory=ScanSummary)
 
     def build_summary(self) -> None:
-        """Populate summary from components."""
-        self.summary.total_components = len(self.components)
+        """Populate summary from components in a single pass.
+
+        Counts are rebuilt from scratch, so calling this again after the
+        component list changes (e.g. severity filtering) is safe; fields not
+        derived from components, such as ``scan_duration_seconds``, are kept.
+        """
+        summary = self.summary
+        by_type: dict[str, int] = {}
+        by_provider: dict[str, int] = {}
+        by_severity: dict[str, int] = {}
+        unique_files: set[str] = set()
+        highest_risk = 0
+
+        summary.total_components = len(self.components)
 
-        # Count by type
         for component in self.components:
+            # Count by type, provider and severity
             component_type = component.type.value
-            self.summary.by_type[component_type] = self.summary.by_type.get(component_type, 0) + 1
+            by_type[component_type] = by_type.get(component_type, 0) + 1
 
-        # Count by provider
-        for component in self.components:
-            if component.provider:
-                self.summary.by_provider[component.provider] = (
-                    self.summary.by_provider.get(component.provider, 0) + 1
-                )
+            provider = component.provider
+            if provider:
+                by_provider[provider] = by_provider.get(provider, 0) + 1
 
-        # Count by severity
-        for component in self.components:
-            severity = component.risk.severity.value
-            self.summary.by_severity[severity] = self.summary.by_severity.get(severity, 0) + 1
+            risk = component.risk
+            severity = risk.severity.value
+            by_severity[severity] = by_severity.get(severity, 0) + 1
 
-        # Count unique files scanned
-        unique_files = set()
-        for component in self.components:
+            # Track unique files scanned
             fp = component.location.file_path
             if fp and fp != "dependency files":
                 unique_files.add(fp)
-        self.summary.total_files_scanned = len(unique_files)
 
-        # Find highest risk score
-        if self.components:
-            self.summary.highest_risk_score = max(
-                component.risk.score for component in self.components
-            )
+            # Track highest risk score
+            if risk.score > highest_risk:
+                highest_risk = risk.score
+
+        summary.by_type = by_type
+        summary.by_provider = by_provider
+        summary.by_severity = by_severity
+        summary.total_files_scanned = len(unique_files)
+        summary.highest_risk_score = highest_risk
 
     def to_cyclonedx(self) -> dict:
         """Generate CycloneDX 1.6 JSON-compatible dict."""
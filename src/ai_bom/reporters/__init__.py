@@ -1,5 +1,11 @@
 """Reporter modules for AI-BOM scan output."""
 
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ai_bom.models import ScanResult
 from ai_bom.reporters.base import BaseReporter
 from ai_bom.reporters.cli_reporter import CLIReporter
 from ai_bom.reporters.csv_reporter import CSVReporter
@@ -23,10 +29,67 @@ REPORTERS: dict[str, type[BaseReporter]] = {
 }
 
 
+#: File extension used by :func:`render_all` for each format
+REPORT_EXTENSIONS: dict[str, str] = {
+    "table": "txt",
+    "json": "json",
+    "cyclonedx": "cdx.json",
+    "html": "html",
+    "markdown": "md",
+    "sarif": "sarif",
+    "spdx3": "spdx.json",
+    "csv": "csv",
+    "junit": "xml",
+}
+
+
 def get_reporter(format_name: str) -> BaseReporter:
     """Get reporter instance by format name."""
     cls = REPORTERS.get(format_name, CLIReporter)
     return cls()
 
 
-__all__ = ["REPORTERS", "BaseReporter", "get_reporter"]
+def render_all(
+    result: ScanResult,
+    formats: list[str],
+    out_dir: str | Path,
+    basename: str = "ai-bom",
+) -> dict[str, Path]:
+    """Write one scan result in several formats concurrently.
+
+    Reporters only read from ``result``, so each format is written on its
+    own thread and wall-clock time approaches that of the slowest reporter.
+
+    Args:
+        result: The scan result to write (summary should already be built)
+        formats: Format names from :data:`REPORTERS`
+        out_dir: Directory to write the reports into (created if missing)
+        basename: File name stem, e.g. ``ai-bom`` -> ``ai-bom.csv``
+
+    Returns:
+        Mapping of format name to the path written
+
+    Raises:
+        ValueError: If a format name is not a known reporter
+    """
+    unknown = [f for f in formats if f not in REPORTERS]
+    if unknown:
+        raise ValueError(f"Unknown report format(s): {', '.join(unknown)}")
+
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    paths = {f: out / f"{basename}.{REPORT_EXTENSIONS[f]}" for f in dict.fromkeys(formats)}
+    if not paths:
+        return paths
+
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        futures = [
+            executor.submit(get_reporter(fmt).write, result, path) for fmt, path in paths.items()
+        ]
+        for future in futures:
+            future.result()
+
+    return paths
+
+
+__all__ = ["REPORTERS", "REPORT_EXTENSIONS", "BaseReporter", "get_reporter", "render_all"]
@@ -4,14 +4,59 @@ from __future__ import annotations
 
 import csv
 import io
+from operator import attrgetter
+from pathlib import Path
+from typing import TextIO
 
-from ai_bom.models import ScanResult
+from ai_bom.models import AIComponent, ScanResult
 from ai_bom.reporters.base import BaseReporter
 
+# Pulls every CSV column out of a component in one C-level call, in HEADERS order
+_ROW_GETTER = attrgetter(
+    "name",
+    "type.value",
+    "provider",
+    "model_name",
+    "version",
+    "risk.score",
+    "risk.severity.value",
+    "location.file_path",
+    "location.line_number",
+    "flags",
+    "source",
+)
+
 
 class CSVReporter(BaseReporter):
     """Reporter that generates CSV tabular output."""
 
+    HEADERS: tuple[str, ...] = (
+        "name",
+        "type",
+        "provider",
+        "model_name",
+        "version",
+        "risk_score",
+        "severity",
+        "file_path",
+        "line_number",
+        "flags",
+        "source",
+    )
+
+    @staticmethod
+    def _row(component: AIComponent) -> tuple[object, ...]:
+        """Build the CSV row for a single component, in ``HEADERS`` order."""
+        row = _ROW_GETTER(component)
+        # line_number is blank when unknown; flags are joined into one cell
+        return (*row[:8], row[8] or "", ", ".join(row[9]), row[10])
+
+    def _write_rows(self, stream: TextIO, result: ScanResult) -> None:
+        """Write the header and one row per component to *stream*."""
+        writer = csv.writer(stream)
+        writer.writerow(self.HEADERS)
+        writer.writerows(self._row(c) for c in result.components)
+
     def render(self, result: ScanResult) -> str:
         """Render scan result as CSV.
 
@@ -24,41 +69,15 @@ class CSVReporter(BaseReporter):
             severity, file_path, line_number, flags, source
         """
         output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(
-            [
-                "name",
-                "type",
-                "provider",
-                "model_name",
-                "version",
-                "risk_score",
-                "severity",
-                "file_path",
-                "line_number",
-                "flags",
-                "source",
-            ]
-        )
+        self._write_rows(output, result)
+        return output.getvalue()
 
-        # Write component rows
-        for component in result.components:
-            writer.writerow(
-                [
-                    component.name,
-                    component.type.value,
-                    component.provider,
-                    component.model_name,
-                    component.version,
-                    component.risk.score,
-                    component.risk.severity.value,
-                    component.location.file_path,
-                    component.location.line_number if component.location.line_number else "",
-                    ", ".join(component.flags) if component.flags else "",
-                    component.source,
-                ]
-            )
+    def write(self, result: ScanResult, path: str | Path) -> None:
+        """Stream CSV rows straight to *path* without building the full string.
 
-        return output.getvalue()
+        Args:
+            result: The scan result to render
+            path: Output file path
+        """
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            self._write_rows(f, result)
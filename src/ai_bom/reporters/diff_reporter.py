@@ -9,14 +9,32 @@ Compares two ScanResult objects or JSON files and shows differences in:
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from ai_bom.models import ScanResult
+from pydantic import ValidationError
+
+from ai_bom.models import AIComponent, ScanResult
+from ai_bom.utils import fast_json
+
+# (name, type, provider) — hashable identity used to match components across scans
+_ComponentKey = tuple[str, str, str]
 
 
 class DiffResult:
-    """Container for scan comparison results."""
+    """Container for scan comparison results.
+
+    Each list is sorted by ``(name, type, provider)`` when built by
+    :func:`compare_scans`, so formatters can emit it as-is.
+    """
+
+    __slots__ = (
+        "added_components",
+        "modified_components",
+        "removed_components",
+        "risk_score_changes",
+    )
 
     def __init__(self) -> None:
         self.added_components: list[dict[str, Any]] = []
@@ -42,19 +60,66 @@ def load_scan_from_file(file_path: str | Path) -> ScanResult:
     if not path.exists():
         raise FileNotFoundError(f"Scan file not found: {file_path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    raw = path.read_bytes()
+
+    # Validate straight from bytes; pydantic's JSON parser skips the
+    # intermediate dict.  Only inspect the payload if validation fails.
+    try:
+        return ScanResult.model_validate_json(raw)
+    except ValidationError:
+        data = json.loads(raw)
+        # Handle both raw ScanResult JSON and CycloneDX format
+        if isinstance(data, dict) and "bomFormat" in data:
+            raise ValueError(
+                "CycloneDX format not supported for diff. Use JSON scan output instead."
+            ) from None
+        raise
+
+
+def load_scans_parallel(
+    baseline_path: str | Path, current_path: str | Path
+) -> tuple[ScanResult, ScanResult]:
+    """Load a baseline and a current scan file concurrently.
+
+    Reading and validating the two files overlap on a two-thread pool, which
+    shortens diff start-up when both scans are large.
+
+    Args:
+        baseline_path: Path to the baseline JSON scan file
+        current_path: Path to the current JSON scan file
 
-    # Handle both raw ScanResult JSON and CycloneDX format
-    if "bomFormat" in data:
-        raise ValueError("CycloneDX format not supported for diff. Use JSON scan output instead.")
+    Returns:
+        Tuple of ``(baseline, current)`` ScanResult objects
 
-    return ScanResult.model_validate(data)
+    Raises:
+        FileNotFoundError: If either file doesn't exist
+        ValueError: If either file is not valid JSON or missing required fields
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        baseline = executor.submit(load_scan_from_file, baseline_path)
+        current = executor.submit(load_scan_from_file, current_path)
+        return baseline.result(), current.result()
+
+
+def _component_entry(component: AIComponent) -> dict[str, Any]:
+    """Summarise a component for the added/removed lists."""
+    return {
+        "name": component.name,
+        "type": component.type.value,
+        "provider": component.provider,
+        "risk_score": component.risk.score,
+        "severity": component.risk.severity.value,
+        "location": component.location.file_path,
+    }
 
 
 def compare_scans(scan1: ScanResult, scan2: ScanResult) -> DiffResult:
     """Compare two scan results.
 
+    Components are keyed by ``(name, type, provider)`` so the comparison is a
+    single pass over each scan plus set operations on the key views.  Keys
+    are sorted once here so every formatter sees the same stable order.
+
     Args:
         scan1: The first (baseline) scan result
         scan2: The second (current) scan result
@@ -65,64 +130,49 @@ def compare_scans(scan1: ScanResult, scan2: ScanResult) -> DiffResult:
     result = DiffResult()
 
     # Build component maps by name+type for easier comparison
-    scan1_map = {(c.name, c.type.value, c.provider): c for c in scan1.components}
-    scan2_map = {(c.name, c.type.value, c.provider): c for c in scan2.components}
-
-    scan1_keys = set(scan1_map.keys())
-    scan2_keys = set(scan2_map.keys())
-
-    # Find added components
-    for key in scan2_keys - scan1_keys:
-        component = scan2_map[key]
-        result.added_components.append(
-            {
-                "name": component.name,
-                "type": component.type.value,
-                "provider": component.provider,
-                "risk_score": component.risk.score,
-                "severity": component.risk.severity.value,
-                "location": component.location.file_path,
-            }
-        )
-
-    # Find removed components
-    for key in scan1_keys - scan2_keys:
-        component = scan1_map[key]
-        result.removed_components.append(
-            {
-                "name": component.name,
-                "type": component.type.value,
-                "provider": component.provider,
-                "risk_score": component.risk.score,
-                "severity": component.risk.severity.value,
-                "location": component.location.file_path,
-            }
-        )
+    scan1_map: dict[_ComponentKey, AIComponent] = {
+        (c.name, c.type.value, c.provider): c for c in scan1.components
+    }
+    scan2_map: dict[_ComponentKey, AIComponent] = {
+        (c.name, c.type.value, c.provider): c for c in scan2.components
+    }
+
+    scan1_keys = scan1_map.keys()
+    scan2_keys = scan2_map.keys()
+
+    # Find added / removed components
+    result.added_components = [
+        _component_entry(scan2_map[k]) for k in sorted(scan2_keys - scan1_keys)
+    ]
+    result.removed_components = [
+        _component_entry(scan1_map[k]) for k in sorted(scan1_keys - scan2_keys)
+    ]
 
     # Find modified components (risk score changes)
-    for key in scan1_keys & scan2_keys:
-        comp1 = scan1_map[key]
+    for key in sorted(scan1_keys & scan2_keys):
+        risk1 = scan1_map[key].risk
         comp2 = scan2_map[key]
+        risk2 = comp2.risk
 
-        if comp1.risk.score != comp2.risk.score or comp1.risk.severity != comp2.risk.severity:
+        if risk1.score != risk2.score or risk1.severity != risk2.severity:
             result.modified_components.append(
                 {
                     "name": comp2.name,
                     "type": comp2.type.value,
                     "provider": comp2.provider,
-                    "old_risk_score": comp1.risk.score,
-                    "new_risk_score": comp2.risk.score,
-                    "old_severity": comp1.risk.severity.value,
-                    "new_severity": comp2.risk.severity.value,
+                    "old_risk_score": risk1.score,
+                    "new_risk_score": risk2.score,
+                    "old_severity": risk1.severity.value,
+                    "new_severity": risk2.severity.value,
                     "location": comp2.location.file_path,
                 }
             )
             result.risk_score_changes.append(
                 {
                     "name": comp2.name,
-                    "change": comp2.risk.score - comp1.risk.score,
-                    "old": comp1.risk.score,
-                    "new": comp2.risk.score,
+                    "change": risk2.score - risk1.score,
+                    "old": risk1.score,
+                    "new": risk2.score,
                 }
             )
 
@@ -279,4 +329,4 @@ def format_diff_as_json(diff: DiffResult) -> str:
         "modified_components": diff.modified_components,
         "risk_score_changes": diff.risk_score_changes,
     }
-    return json.dumps(data, indent=2)
+    return fast_json.dumps(data)
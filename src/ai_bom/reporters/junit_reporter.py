@@ -2,12 +2,35 @@
 
 from __future__ import annotations
 
-import io
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 
-from ai_bom.models import AIComponent, ScanResult
+from ai_bom.models import AIComponent, ScanResult, Severity
 from ai_bom.reporters.base import BaseReporter
 
+# High and critical severity are failures
+_FAIL_SEVERITIES: frozenset[Severity] = frozenset({Severity.high, Severity.critical})
+
+# Specific security flags are failures regardless of severity
+_FAIL_FLAGS: frozenset[str] = frozenset(
+    {
+        "hardcoded_api_key",
+        "shadow_ai",
+        "webhook_no_auth",
+        "code_http_tools",
+        "mcp_unknown_server",
+        "multi_agent_no_trust",
+        "no_auth",
+    }
+)
+
+# Characters ElementTree escapes in attribute values beyond &, < and >
+_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#09;"}
+
+
+def _attr(value: object) -> str:
+    """Return *value* as a double-quoted, escaped XML attribute value."""
+    return f'"{escape(str(value), _ATTR_ENTITIES)}"'
+
 
 class JUnitReporter(BaseReporter):
     """Reporter that generates JUnit XML output.
@@ -21,68 +44,57 @@ class JUnitReporter(BaseReporter):
     def render(self, result: ScanResult) -> str:
         """Render scan result as JUnit XML.
 
+        The document is assembled as a list of string fragments joined once
+        at the end, rather than built as an ElementTree, so large scans do
+        not allocate a tree of element objects only to serialise it again.
+
         Args:
             result: The scan result to render
 
         Returns:
             JUnit XML formatted string
         """
-        # Create root testsuite element
-        testsuite = ET.Element("testsuite")
-        testsuite.set("name", f"AI-BOM Scan: {result.target_path}")
-        testsuite.set("tests", str(result.summary.total_components))
-        testsuite.set("timestamp", result.scan_timestamp)
-
-        # Count failures
-        failures = 0
-        for component in result.components:
-            if self._is_failure(component):
-                failures += 1
-
-        testsuite.set("failures", str(failures))
-        testsuite.set("errors", "0")
-        testsuite.set("time", str(result.summary.scan_duration_seconds))
-
-        # Add properties
-        properties = ET.SubElement(testsuite, "properties")
-
-        # Add scan metadata as properties
-        prop = ET.SubElement(properties, "property")
-        prop.set("name", "ai_bom_version")
-        prop.set("value", result.ai_bom_version)
-
-        prop = ET.SubElement(properties, "property")
-        prop.set("name", "highest_risk_score")
-        prop.set("value", str(result.summary.highest_risk_score))
-
-        prop = ET.SubElement(properties, "property")
-        prop.set("name", "total_files_scanned")
-        prop.set("value", str(result.summary.total_files_scanned))
+        summary = result.summary
+        failed = [self._is_failure(component) for component in result.components]
+
+        parts: list[str] = []
+        parts.append("<?xml version='1.0' encoding='utf-8'?>\n")
+        parts.append(
+            f"<testsuite name={_attr(f'AI-BOM Scan: {result.target_path}')}"
+            f" tests={_attr(summary.total_components)}"
+            f" timestamp={_attr(result.scan_timestamp)}"
+            f" failures={_attr(sum(failed))}"
+            f' errors="0"'
+            f" time={_attr(summary.scan_duration_seconds)}>"
+        )
 
-        # Add each component as a testcase
-        for component in result.components:
-            testcase = ET.SubElement(testsuite, "testcase")
-            testcase.set("name", component.name)
-            testcase.set("classname", f"{component.type.value}.{component.provider}")
-            testcase.set("time", "0")
-
-            # Check if component should be marked as failure
-            if self._is_failure(component):
-                failure = ET.SubElement(testcase, "failure")
-                failure.set("type", component.risk.severity.value)
-                failure.set(
-                    "message",
-                    f"{component.name} has {component.risk.severity.value} severity "
-                    f"(risk score: {component.risk.score})",
-                )
+        # Scan metadata as properties
+        parts.append("<properties>")
+        for prop_name, prop_value in (
+            ("ai_bom_version", result.ai_bom_version),
+            ("highest_risk_score", summary.highest_risk_score),
+            ("total_files_scanned", summary.total_files_scanned),
+        ):
+            parts.append(f"<property name={_attr(prop_name)} value={_attr(prop_value)} />")
+        parts.append("</properties>")
 
+        # Add each component as a testcase
+        for component, is_failure in zip(result.components, failed, strict=True):
+            severity = component.risk.severity.value
+            parts.append(
+                f"<testcase name={_attr(component.name)}"
+                f" classname={_attr(f'{component.type.value}.{component.provider}')}"
+                f' time="0">'
+            )
+
+            if is_failure:
                 # Build failure details
                 details = []
                 details.append(f"Component: {component.name}")
                 details.append(f"Type: {component.type.value}")
                 details.append(f"Provider: {component.provider}")
                 details.append(f"Risk Score: {component.risk.score}/100")
-                details.append(f"Severity: {component.risk.severity.value}")
+                details.append(f"Severity: {severity}")
                 details.append(f"Location: {component.location.file_path}")
 
                 if component.location.line_number:
@@ -97,10 +109,15 @@ class JUnitReporter(BaseReporter):
                 if component.risk.factors:
                     details.append(f"Risk Factors: {', '.join(component.risk.factors)}")
 
-                failure.text = "\n".join(details)
+                message = (
+                    f"{component.name} has {severity} severity (risk score: {component.risk.score})"
+                )
+                parts.append(
+                    f"<failure type={_attr(severity)} message={_attr(message)}>"
+                    f"{escape(chr(10).join(details))}</failure>"
+                )
 
             # Add system-out with component metadata
-            system_out = ET.SubElement(testcase, "system-out")
             out_lines = []
             out_lines.append(f"Provider: {component.provider}")
             out_lines.append(f"Type: {component.type.value}")
@@ -111,13 +128,11 @@ class JUnitReporter(BaseReporter):
             if component.location.context_snippet:
                 out_lines.append(f"Context: {component.location.context_snippet}")
 
-            system_out.text = "\n".join(out_lines)
+            parts.append(f"<system-out>{escape(chr(10).join(out_lines))}</system-out>")
+            parts.append("</testcase>")
 
-        # Convert to string with XML declaration
-        tree = ET.ElementTree(testsuite)
-        output = io.BytesIO()
-        tree.write(output, encoding="utf-8", xml_declaration=True)
-        return output.getvalue().decode("utf-8")
+        parts.append("</testsuite>")
+        return "".join(parts)
 
     def _is_failure(self, component: AIComponent) -> bool:
         """Determine if a component should be marked as a test failure.
@@ -128,18 +143,6 @@ class JUnitReporter(BaseReporter):
         Returns:
             True if component should be marked as failure
         """
-        # High and critical severity are failures
-        # Specific security flags are failures
-        security_flags = {
-            "hardcoded_api_key",
-            "shadow_ai",
-            "webhook_no_auth",
-            "code_http_tools",
-            "mcp_unknown_server",
-            "multi_agent_no_trust",
-            "no_auth",
-        }
-
-        return component.risk.severity.value in ("high", "critical") or any(
-            flag in security_flags for flag in component.flags
+        return component.risk.severity in _FAIL_SEVERITIES or not _FAIL_FLAGS.isdisjoint(
+            component.flags
         )
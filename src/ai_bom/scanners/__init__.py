@@ -23,7 +23,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import scanner modules to trigger registration via __init_subclass__
@@ -63,7 +63,11 @@ def run_scanners_parallel(
 
     Only scanners whose ``supports(path)`` returns True are executed.
     Exceptions in individual scanners are logged and do not abort the
-    remaining work.
+    remaining work.  With a single scanner (or ``workers <= 1``) everything
+    runs inline, skipping thread-pool setup entirely.  Otherwise each
+    scanner's ``supports()`` probe and ``scan()`` run together as one pool
+    task, so probes do not serialise on the calling thread and results come
+    back in scanner order.
 
     Args:
         scanners: List of scanner instances to run.
@@ -77,19 +81,23 @@ def run_scanners_parallel(
 
     results: list[AIComponent] = []
 
-    supported = [s for s in scanners if s.supports(path)]
-    if not supported:
+    def _run_one(scanner: BaseScanner) -> list[AIComponent]:
+        if not scanner.supports(path):
+            return []
+        try:
+            return scanner.scan(path)
+        except Exception:
+            logger.exception("Error in parallel scanner %s", scanner.name)
+            return []
+
+    if len(scanners) <= 1 or workers <= 1:
+        for scanner in scanners:
+            results.extend(_run_one(scanner))
         return results
 
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        future_to_scanner = {executor.submit(s.scan, path): s for s in supported}
-        for future in as_completed(future_to_scanner):
-            scanner = future_to_scanner[future]
-            try:
-                components = future.result()
-                results.extend(components)
-            except Exception:
-                logger.exception("Error in parallel scanner %s", scanner.name)
+    with ThreadPoolExecutor(max_workers=min(workers, len(scanners))) as executor:
+        for components in executor.map(_run_one, scanners):
+            results.extend(components)
 
     return results
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import codecs
 import logging
 import os
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +19,25 @@ logger = logging.getLogger(__name__)
 # Global registry populated via __init_subclass__
 _scanner_registry: list[type[BaseScanner]] = []
 
+# Bytes inspected for null bytes when deciding whether a file is binary
+_BINARY_SNIFF_SIZE = 8192
+
+# Decoders tried in order by safe_read_text; latin-1 accepts any byte, so it
+# must stay last and nothing after it could ever run
+_TEXT_CODECS: tuple[codecs.CodecInfo, ...] = tuple(
+    codecs.lookup(name) for name in ("utf-8", "latin-1")
+)
+
+# Test directory names skipped unless include_tests=True
+_TEST_DIRS: frozenset[str] = frozenset({"test", "tests", "spec", "specs"})
+
+# Directory names pruned from the walk, with and without test directories
+_PRUNED_DIRS: frozenset[str] = EXCLUDED_DIRS | _TEST_DIRS
+_PRUNED_DIRS_WITH_TESTS: frozenset[str] = EXCLUDED_DIRS
+
+# Opt-in switch for classifying walked files on a thread pool
+_PARALLEL_ENV = "AI_BOM_PARALLEL"
+
 # Cached .ai-bomignore spec (module-level singleton)
 _ignore_spec: Any = None
 _ignore_spec_loaded: bool = False
@@ -130,10 +151,11 @@ class BaseScanner(ABC):
     def safe_read_text(self, path: Path) -> str | None:
         """Safely read text file with encoding fallback chain.
 
-        Attempts to read the file using:
+        The file is opened once: the first 8KB is checked for null bytes
+        before the rest is read, then the bytes are decoded using:
         1. UTF-8 encoding
         2. Latin-1 encoding (fallback)
-        3. Returns None if both fail or file contains binary content
+        Returns None if the file cannot be read or contains binary content.
 
         Args:
             path: Path to file to read
@@ -141,35 +163,32 @@ class BaseScanner(ABC):
         Returns:
             File contents as string, or None if file cannot be read or is binary
         """
-        # First check for binary content (null bytes in first 8KB)
+        # Read once: sniff the first 8KB for null bytes, then the remainder
         try:
             with open(path, "rb") as f:
-                chunk = f.read(8192)
-                if b"\x00" in chunk:
+                head = f.read(_BINARY_SNIFF_SIZE)
+                if b"\x00" in head:
                     logger.debug("Skipping binary file (null bytes detected): %s", path)
                     return None
+                data = head + f.read()
         except (OSError, PermissionError) as e:
             logger.warning("Cannot read file %s: %s", path, e)
             return None
 
-        # Try UTF-8 first
-        try:
-            return path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.debug("UTF-8 decode failed for %s, trying latin-1", path)
-        except (OSError, PermissionError) as e:
-            logger.warning("Cannot read file %s: %s", path, e)
+        # Try UTF-8 first, then fall back to latin-1 (which accepts any byte)
+        for codec in _TEXT_CODECS:
+            try:
+                text, _ = codec.decode(data)
+                break
+            except UnicodeDecodeError:
+                logger.debug("%s decode failed for %s, trying next encoding", codec.name, path)
+        else:  # pragma: no cover - latin-1 never fails
             return None
 
-        # Fallback to latin-1
-        try:
-            return path.read_text(encoding="latin-1")
-        except (OSError, PermissionError) as e:
-            logger.warning("Cannot read file %s with latin-1: %s", path, e)
-            return None
-        except Exception as e:
-            logger.warning("Unexpected error reading file %s: %s", path, e)
-            return None
+        # Match text-mode reads: translate \r\n and \r to \n
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
 
     def iter_files(
         self,
@@ -217,8 +236,6 @@ class BaseScanner(ABC):
         # Load .ai-bomignore spec (cached after first call)
         ignore_spec = _load_ignore_spec(root if root.is_dir() else root.parent)
 
-        # Track real paths to detect symlink cycles
-        seen_real_paths: set[Path] = set()
         root_real = Path(os.path.realpath(root))
 
         # Handle single file: yield it if it matches criteria, then return
@@ -237,36 +254,7 @@ class BaseScanner(ABC):
             if root.suffix == ".pyc":
                 return
 
-            # Skip files larger than max_file_size to avoid binary/generated files
-            try:
-                file_size = os.path.getsize(root)
-                if file_size > self.max_file_size:
-                    max_mb = self.max_file_size // (1024 * 1024)
-                    logger.warning(
-                        "Skipping large file (>%dMB): %s (%d bytes)",
-                        max_mb,
-                        root,
-                        file_size,
-                    )
-                    return
-            except OSError as e:
-                logger.warning("Cannot get size of %s: %s", root, e)
-                return
-
-            # Check for binary content (null bytes in first 8KB)
-            try:
-                with open(root, "rb") as f:
-                    chunk = f.read(8192)
-                    if b"\x00" in chunk:
-                        logger.debug("Skipping binary file: %s", root)
-                        return
-            except PermissionError:
-                logger.warning("Permission denied reading %s", root)
-                return
-            except OSError as e:
-                logger.warning("Cannot read file %s: %s", root, e)
-                return
-
+            # Cheap name checks first, before touching the file itself
             matches = False
             if extensions is not None and root.suffix.lower() in extensions:
                 matches = True
@@ -274,137 +262,235 @@ class BaseScanner(ABC):
                 matches = True
             if extensions is None and filenames is None:
                 matches = True
-            if matches:
-                # Check .ai-bomignore
-                if ignore_spec is not None:
-                    rel = str(root.relative_to(root.parent))
-                    if ignore_spec.match_file(rel):
-                        logger.debug("Skipping ignored file: %s", root)
-                        return
+            if not matches:
+                return
+
+            # Check .ai-bomignore
+            if ignore_spec is not None:
+                rel = str(root.relative_to(root.parent))
+                if ignore_spec.match_file(rel):
+                    logger.debug("Skipping ignored file: %s", root)
+                    return
+
+            try:
+                file_size = os.stat(root).st_size
+            except OSError as e:
+                logger.warning("Cannot get size of %s: %s", root, e)
+                return
+            if self._accept_file(str(root), file_size):
                 yield root
             return
 
-        # Test directory names to exclude
-        test_dirs = {"test", "tests", "spec", "specs"} if not include_tests else set()
+        # Directory names to prune (test directories too, unless requested)
+        pruned_dirs = _PRUNED_DIRS_WITH_TESTS if include_tests else _PRUNED_DIRS
 
-        # Walk the directory tree
+        # Walk the directory tree, then apply the size/binary guards
+        candidates = self._walk_files(
+            str(root), str(root_real), pruned_dirs, extensions, filenames, ignore_spec
+        )
         try:
-            for dirpath, dirnames, filenames_list in os.walk(root, topdown=True, followlinks=True):
-                # Resolve current directory to detect symlink cycles
-                try:
-                    current_real = Path(os.path.realpath(dirpath))
+            if _parallel_enabled():
+                yield from self._accept_files_parallel(candidates)
+            else:
+                for file_path, file_size in candidates:
+                    if self._accept_file(file_path, file_size):
+                        yield Path(file_path)
+        except PermissionError as e:
+            logger.warning("Permission denied walking directory %s: %s", root, e)
 
-                    # Skip if this creates a cycle
-                    if current_real in seen_real_paths:
-                        logger.warning("Skipping symlink cycle at: %s", dirpath)
-                        dirnames[:] = []  # Don't descend into this directory
-                        continue
+    def _accept_file(self, file_path: str, file_size: int) -> bool:
+        """Apply the size and binary-content guards to a candidate file.
 
-                    # Skip if symlink points outside root
-                    if not str(current_real).startswith(str(root_real)):
-                        logger.warning(
-                            "Skipping symlink outside root: %s -> %s",
-                            dirpath,
-                            current_real,
-                        )
-                        dirnames[:] = []
-                        continue
+        Args:
+            file_path: Path of the file to check.
+            file_size: Size in bytes, taken from a stat result the caller
+                already has so the file is not stat'ed twice.
+
+        Returns:
+            True if the file is small enough and does not look binary.
+        """
+        # Skip files larger than max_file_size to avoid binary/generated files
+        if file_size > self.max_file_size:
+            logger.warning(
+                "Skipping large file (>%dMB): %s (%d bytes)",
+                self.max_file_size // (1024 * 1024),
+                file_path,
+                file_size,
+            )
+            return False
+
+        # Empty files cannot hold a null byte; skip the open/read entirely
+        if file_size == 0:
+            return True
+
+        # Check for binary content (null bytes in first 8KB)
+        try:
+            with open(file_path, "rb") as f:
+                if b"\x00" in f.read(min(file_size, _BINARY_SNIFF_SIZE)):
+                    logger.debug("Skipping binary file: %s", file_path)
+                    return False
+        except PermissionError:
+            logger.warning("Permission denied reading %s", file_path)
+            return False
+        except OSError as e:
+            logger.warning("Cannot read file %s: %s", file_path, e)
+            return False
+        return True
+
+    def _accept_files_parallel(self, candidates: Iterator[tuple[str, int]]) -> Iterator[Path]:
+        """Run :meth:`_accept_file` over walked candidates on a thread pool.
+
+        The walk itself stays sequential; only the per-file open/read of the
+        binary sniff is overlapped, which helps on network filesystems and
+        cold caches.  Files are yielded in walk order.
+        """
+        batch = list(candidates)
+        if not batch:
+            return
+        paths = [file_path for file_path, _ in batch]
+        sizes = [file_size for _, file_size in batch]
+        workers = min(32, (os.cpu_count() or 1) * 4, len(batch))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            accepted = list(executor.map(self._accept_file, paths, sizes))
+        for file_path, keep in zip(paths, accepted, strict=True):
+            if keep:
+                yield Path(file_path)
+
+    def _walk_files(
+        self,
+        root: str,
+        root_real: str,
+        pruned_dirs: frozenset[str],
+        extensions: set[str] | None,
+        filenames: set[str] | None,
+        ignore_spec: Any,
+    ) -> Iterator[tuple[str, int]]:
+        """Directory branch of :meth:`iter_files`, built on ``os.scandir``.
+
+        Yields ``(path, size)`` for each file that passes the name, ignore
+        and symlink checks; the size/binary guards are left to the caller.
+
+        ``DirEntry`` caches the file type from the directory read, so
+        directories, symlinks and regular files are told apart without extra
+        ``stat`` calls, and name/extension filters run before any file is
+        stat'ed or opened.  Only symlinks have their real path resolved;
+        cycles are caught by remembering each directory's device/inode.
+        """
+        # Directories already queued, keyed by (st_dev, st_ino), to detect
+        # symlink cycles without resolving every path
+        seen_dirs: set[tuple[int, int]] = set()
+        try:
+            root_stat = os.stat(root)
+            seen_dirs.add((root_stat.st_dev, root_stat.st_ino))
+        except OSError:
+            pass
+
+        root_prefix = root_real if root_real.endswith(os.sep) else root_real + os.sep
+        # Offset of the root-relative part of each entry path; a root that
+        # already ends in a separator ("/") must not lose another character
+        prefix_len = len(root if root.endswith(os.sep) else root + os.sep)
+
+        def _outside_root(entry: os.DirEntry[str]) -> bool:
+            """Resolve a symlink entry and report whether it escapes root."""
+            target = os.path.realpath(entry.path)
+            if target == root_real or target.startswith(root_prefix):
+                return False
+            logger.warning("Skipping symlink outside root: %s -> %s", entry.path, target)
+            return True
+
+        stack = [root]
+        while stack:
+            dirpath = stack.pop()
 
-                    seen_real_paths.add(current_real)
-                except (OSError, ValueError) as e:
-                    logger.warning("Cannot resolve directory %s: %s", dirpath, e)
-                    dirnames[:] = []
+            try:
+                with os.scandir(dirpath) as it:
+                    entries = list(it)
+            except PermissionError as e:
+                if dirpath == root:
+                    raise
+                logger.warning("Permission denied walking directory %s: %s", dirpath, e)
+                continue
+            except OSError as e:
+                logger.warning("Cannot read directory %s: %s", dirpath, e)
+                continue
+
+            subdirs: list[str] = []
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    # Prune excluded directories before descending, so their
+                    # subtrees are never listed or stat'ed
+                    if name in pruned_dirs:
+                        continue
+                    try:
+                        if entry.is_symlink() and _outside_root(entry):
+                            continue
+                        dir_stat = entry.stat()
+                    except (OSError, ValueError) as e:
+                        logger.warning("Cannot resolve directory %s: %s", entry.path, e)
+                        continue
+                    dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+                    if dir_key in seen_dirs:
+                        logger.warning("Skipping symlink cycle at: %s", entry.path)
+                        continue
+                    seen_dirs.add(dir_key)
+                    subdirs.append(entry.path)
                     continue
 
-                # Prune excluded directories in-place (modifies dirnames)
-                dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS and d not in test_dirs]
+                # Skip .pyc files
+                if name.endswith(".pyc"):
+                    continue
 
-                # Check each file in current directory
-                for filename in filenames_list:
-                    # Skip .pyc files
-                    if filename.endswith(".pyc"):
+                # Match by extension or exact filename
+                if extensions is not None or filenames is not None:
+                    matches = (
+                        extensions is not None and os.path.splitext(name)[1].lower() in extensions
+                    ) or (
+                        filenames is not None and (name in filenames or name.lower() in filenames)
+                    )
+                    if not matches:
                         continue
 
-                    file_path = Path(dirpath) / filename
+                file_path = entry.path
+
+                # Check .ai-bomignore
+                if ignore_spec is not None and ignore_spec.match_file(file_path[prefix_len:]):
+                    logger.debug("Skipping ignored file: %s", file_path)
+                    continue
 
-                    # Check for symlink safety
+                # Check for symlink safety
+                if entry.is_symlink():
                     try:
-                        file_real = Path(os.path.realpath(file_path))
-
-                        # Skip if symlink points outside root
-                        if not str(file_real).startswith(str(root_real)):
-                            logger.warning(
-                                "Skipping symlink outside root: %s -> %s",
-                                file_path,
-                                file_real,
-                            )
+                        if _outside_root(entry):
                             continue
                     except (OSError, ValueError) as e:
                         logger.warning("Cannot resolve file %s: %s", file_path, e)
                         continue
 
-                    # Skip files larger than max_file_size to avoid binary/generated files
-                    try:
-                        file_size = os.path.getsize(file_path)
-                        if file_size > self.max_file_size:
-                            logger.warning(
-                                "Skipping large file (>%dMB): %s (%d bytes)",
-                                self.max_file_size // (1024 * 1024),
-                                file_path,
-                                file_size,
-                            )
-                            continue
-                    except PermissionError:
-                        logger.warning("Permission denied accessing %s", file_path)
-                        continue
-                    except OSError as e:
-                        logger.warning("Cannot get size of %s: %s", file_path, e)
-                        continue
+                # DirEntry caches the stat result, so this is the only stat call
+                try:
+                    file_size = entry.stat().st_size
+                except PermissionError:
+                    logger.warning("Permission denied accessing %s", file_path)
+                    continue
+                except OSError as e:
+                    logger.warning("Cannot get size of %s: %s", file_path, e)
+                    continue
 
-                    # Check for binary content (null bytes in first 8KB)
-                    try:
-                        with open(file_path, "rb") as f:
-                            chunk = f.read(8192)
-                            if b"\x00" in chunk:
-                                logger.debug("Skipping binary file: %s", file_path)
-                                continue
-                    except PermissionError:
-                        logger.warning("Permission denied reading %s", file_path)
-                        continue
-                    except OSError as e:
-                        logger.warning("Cannot read file %s: %s", file_path, e)
-                        continue
+                yield file_path, file_size
 
-                    # Match by extension or exact filename
-                    matches = False
-
-                    if extensions is not None:
-                        file_ext = file_path.suffix.lower()
-                        if file_ext in extensions:
-                            matches = True
-
-                    if filenames is not None and (
-                        filename in filenames or filename.lower() in filenames
-                    ):
-                        matches = True
-
-                    # If no filters specified, match all files
-                    if extensions is None and filenames is None:
-                        matches = True
-
-                    if matches:
-                        # Check .ai-bomignore
-                        if ignore_spec is not None:
-                            try:
-                                rel = str(file_path.relative_to(root))
-                            except ValueError:
-                                rel = str(file_path)
-                            if ignore_spec.match_file(rel):
-                                logger.debug("Skipping ignored file: %s", file_path)
-                                continue
-                        yield file_path
-        except PermissionError as e:
-            logger.warning("Permission denied walking directory %s: %s", root, e)
+            # Descend in listing order, like a top-down os.walk
+            stack.extend(reversed(subdirs))
+
+
+def _parallel_enabled() -> bool:
+    """Return True if ``AI_BOM_PARALLEL`` opts in to threaded file checks."""
+    return os.environ.get(_PARALLEL_ENV, "").lower() in ("1", "true")
 
 
 def get_all_scanners(*, max_file_size: int | None = None) -> list[BaseScanner]:
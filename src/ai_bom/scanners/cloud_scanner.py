@@ -4,13 +4,56 @@ from __future__ import annotations
 
 import json
 import re
+from functools import cache
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import TYPE_CHECKING, Any
 
 from ai_bom.models import AIComponent, ComponentType, SourceLocation, UsageType
 from ai_bom.scanners.base import BaseScanner
+from ai_bom.utils.fast_yaml import safe_load, safe_loader
+
+if TYPE_CHECKING:
+    import yaml
+
+_CLOUDFORMATION_TAGS = (
+    "!Ref",
+    "!GetAtt",
+    "!Sub",
+    "!Join",
+    "!Select",
+    "!Split",
+    "!FindInMap",
+    "!GetAZs",
+    "!ImportValue",
+    "!Base64",
+)
+
+
+def _cloudformation_constructor(loader: Any, node: yaml.Node) -> Any:
+    """Constructor for CloudFormation intrinsic functions."""
+    if node.id == "scalar":
+        return loader.construct_scalar(node)
+    elif node.id == "sequence":
+        return loader.construct_sequence(node)
+    elif node.id == "mapping":
+        return loader.construct_mapping(node)
+    return None
+
+
+@cache
+def _cloudformation_loader() -> type[yaml.SafeLoader]:
+    """Build the safe loader subclass that accepts CloudFormation intrinsic tags.
+
+    Built on first use so PyYAML is not imported with the scanner module. The
+    tags are registered on the subclass only, so yaml.SafeLoader is left untouched.
+    """
+
+    class _CloudFormationLoader(safe_loader()):  # type: ignore[misc]
+        """Safe YAML loader that accepts CloudFormation intrinsic function tags."""
+
+    for tag in _CLOUDFORMATION_TAGS:
+        _CloudFormationLoader.add_constructor(tag, _cloudformation_constructor)
+    return _CloudFormationLoader
 
 
 class CloudScanner(BaseScanner):
@@ -27,7 +70,7 @@ class CloudScanner(BaseScanner):
     description = "Scan Terraform/CloudFormation for AI resources"
 
     # Terraform resource type to (provider, component_type) mapping
-    TERRAFORM_AI_RESOURCES = {
+    TERRAFORM_AI_RESOURCES: dict[str, tuple[str, ComponentType]] = {
         # --- AWS Bedrock ---
         "aws_bedrockagent_agent": ("AWS Bedrock", ComponentType.agent_framework),
         "aws_bedrockagent_knowledge_base": ("AWS Bedrock", ComponentType.tool),
@@ -98,7 +141,7 @@ class CloudScanner(BaseScanner):
     }
 
     # CloudFormation resource types to (provider, component_type) mapping
-    CLOUDFORMATION_AI_RESOURCES = {
+    CLOUDFORMATION_AI_RESOURCES: dict[str, tuple[str, ComponentType]] = {
         # --- Bedrock ---
         "AWS::Bedrock::Agent": ("AWS Bedrock", ComponentType.agent_framework),
         "AWS::Bedrock::KnowledgeBase": ("AWS Bedrock", ComponentType.tool),
@@ -132,6 +175,15 @@ class CloudScanner(BaseScanner):
         "AWS::Rekognition::Project": ("AWS Rekognition", ComponentType.model),
     }
 
+    # Matches: resource "type" "name" for AI resource types only, so one
+    # finditer pass over the file replaces a per-line search plus lookup.
+    # [^\S\n] keeps the match on one line, like the old line-by-line scan.
+    TERRAFORM_RESOURCE_PATTERN = re.compile(
+        r'resource[^\S\n]+"('
+        + "|".join(map(re.escape, TERRAFORM_AI_RESOURCES))
+        + r')"[^\S\n]+"([^"]+)"'
+    )
+
     # Patterns for GPU instance types
     GPU_INSTANCE_PATTERN = re.compile(r"ml\.(g\d+|p\d+|inf\d+|trn\d+)\.\w+", re.IGNORECASE)
 
@@ -235,56 +287,55 @@ class CloudScanner(BaseScanner):
             return components
 
         lines = content.split("\n")
+        # One path string shared by every component from this file
+        location_path = str(file_path.resolve())
 
-        # Pattern to match Terraform resource blocks
-        # Matches: resource "type" "name" {
-        resource_pattern = re.compile(r'resource\s+"([^"]+)"\s+"([^"]+)"')
-
-        for line_num, line in enumerate(lines, start=1):
-            match = resource_pattern.search(line)
-            if match:
-                resource_type = match.group(1)
-                resource_name = match.group(2)
+        # Track line numbers incrementally between matches
+        line_num = 1
+        last_pos = 0
 
-                if resource_type in self.TERRAFORM_AI_RESOURCES:
-                    provider, comp_type = self.TERRAFORM_AI_RESOURCES[resource_type]
+        for match in self.TERRAFORM_RESOURCE_PATTERN.finditer(content):
+            line_num += content.count("\n", last_pos, match.start())
+            last_pos = match.start()
+            resource_type, resource_name = match.group(1, 2)
+            provider, comp_type = self.TERRAFORM_AI_RESOURCES[resource_type]
 
-                    # Extract context snippet (current line + next 5 lines)
-                    context_lines = lines[line_num - 1 : line_num + 5]
-                    context = "\n".join(context_lines).strip()
+            # Extract context snippet (current line + next 5 lines)
+            context_lines = lines[line_num - 1 : line_num + 5]
+            context = "\n".join(context_lines).strip()
 
-                    # Extract additional metadata from the resource block
-                    metadata = self._extract_terraform_metadata(content, line_num - 1, lines)
+            # Extract additional metadata from the resource block
+            metadata = self._extract_terraform_metadata(content, line_num - 1, lines)
 
-                    # Determine model name from metadata
-                    model_name = metadata.get(
-                        "model_id",
-                        metadata.get("foundation_model", ""),
-                    )
+            # Determine model name from metadata
+            model_name = metadata.get(
+                "model_id",
+                metadata.get("foundation_model", ""),
+            )
 
-                    # Create component
-                    component = AIComponent(
-                        name=f"{resource_type}.{resource_name}",
-                        type=comp_type,
-                        provider=provider,
-                        model_name=model_name,
-                        location=SourceLocation(
-                            file_path=str(file_path.resolve()),
-                            line_number=line_num,
-                            context_snippet=context[:200],  # Limit context size
-                        ),
-                        usage_type=self._infer_usage_type(comp_type, metadata),
-                        metadata=metadata,
-                        source="cloud",
-                    )
+            # Create component
+            component = AIComponent(
+                name=f"{resource_type}.{resource_name}",
+                type=comp_type,
+                provider=provider,
+                model_name=model_name,
+                location=SourceLocation(
+                    file_path=location_path,
+                    line_number=line_num,
+                    context_snippet=context[:200],  # Limit context size
+                ),
+                usage_type=self._infer_usage_type(comp_type, metadata),
+                metadata=metadata,
+                source="cloud",
+            )
 
-                    # Add flags for GPU instances
-                    if "instance_type" in metadata:
-                        instance_type = metadata["instance_type"]
-                        if self.GPU_INSTANCE_PATTERN.match(instance_type):
-                            component.flags.append("gpu_instance")
+            # Add flags for GPU instances
+            if "instance_type" in metadata:
+                instance_type = metadata["instance_type"]
+                if self.GPU_INSTANCE_PATTERN.match(instance_type):
+                    component.flags.append("gpu_instance")
 
-                    components.append(component)
+            components.append(component)
 
         return components
 
@@ -377,6 +428,8 @@ class CloudScanner(BaseScanner):
         Returns:
             List of detected AI components
         """
+        import yaml
+
         components: list[AIComponent] = []
 
         try:
@@ -398,14 +451,18 @@ class CloudScanner(BaseScanner):
             if not isinstance(resources, dict):
                 return components
 
+            # One path string shared by every component from this file
+            location_path = str(file_path.resolve())
+
             # Scan each resource
             for resource_name, resource_def in resources.items():
                 if not isinstance(resource_def, dict):
                     continue
 
                 resource_type = resource_def.get("Type", "")
-                if resource_type in self.CLOUDFORMATION_AI_RESOURCES:
-                    provider, comp_type = self.CLOUDFORMATION_AI_RESOURCES[resource_type]
+                resource_info = self.CLOUDFORMATION_AI_RESOURCES.get(resource_type)
+                if resource_info is not None:
+                    provider, comp_type = resource_info
 
                     # Extract properties
                     properties = resource_def.get("Properties", {})
@@ -441,7 +498,7 @@ class CloudScanner(BaseScanner):
                         provider=provider,
                         model_name=model_name,
                         location=SourceLocation(
-                            file_path=str(file_path.resolve()),
+                            file_path=location_path,
                             line_number=None,  # JSON/YAML line numbers are complex
                             context_snippet=f"Resource: {resource_name}",
                         ),
@@ -462,7 +519,8 @@ class CloudScanner(BaseScanner):
         """Parse CloudFormation YAML with custom tag support.
 
         CloudFormation uses custom YAML tags like !Ref, !GetAtt, !Sub, etc.
-        This method adds constructors for these tags to return simple string values.
+        These are handled by a cached SafeLoader subclass (libyaml-backed when
+        available) whose constructors return the tag values as plain data.
 
         Args:
             content: YAML content string
@@ -470,39 +528,7 @@ class CloudScanner(BaseScanner):
         Returns:
             Parsed YAML as dictionary
         """
-
-        # Define a custom constructor that returns the tag value as a string
-        def cloudformation_constructor(loader: Any, node: yaml.Node) -> Any:
-            """Constructor for CloudFormation intrinsic functions."""
-            if isinstance(node, yaml.ScalarNode):
-                return loader.construct_scalar(node)
-            elif isinstance(node, yaml.SequenceNode):
-                return loader.construct_sequence(node)
-            elif isinstance(node, yaml.MappingNode):
-                return loader.construct_mapping(node)
-            return None
-
-        # Create a custom YAML loader
-        loader = yaml.SafeLoader
-
-        # Add constructors for common CloudFormation tags
-        cf_tags = [
-            "!Ref",
-            "!GetAtt",
-            "!Sub",
-            "!Join",
-            "!Select",
-            "!Split",
-            "!FindInMap",
-            "!GetAZs",
-            "!ImportValue",
-            "!Base64",
-        ]
-
-        for tag in cf_tags:
-            yaml.add_constructor(tag, cloudformation_constructor, Loader=loader)
-
-        result: dict[str, Any] = yaml.load(content, Loader=loader)  # noqa: S506 — loader IS SafeLoader
+        result: dict[str, Any] = safe_load(content, _cloudformation_loader())
         return result
 
     def _is_cloudformation_file(self, file_path: Path) -> bool:
@@ -514,6 +540,8 @@ class CloudScanner(BaseScanner):
         Returns:
             True if the file appears to be a CloudFormation template
         """
+        import yaml
+
         try:
             content = file_path.read_text(encoding="utf-8", errors="ignore")
 
@@ -526,7 +554,7 @@ class CloudScanner(BaseScanner):
 
             # Try parsing and checking structure
             if file_path.suffix.lower() in {".yml", ".yaml"}:
-                data = yaml.safe_load(content)
+                data = self._parse_cloudformation_yaml(content)
             elif file_path.suffix.lower() == ".json":
                 data = json.loads(content)
             else:
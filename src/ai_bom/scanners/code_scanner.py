@@ -10,8 +10,15 @@ unpinned models, and hardcoded credentials.
 
 from __future__ import annotations
 
+import os
 import re
+import sys
+import threading
+from collections.abc import Callable, Iterable
+from collections.abc import Set as AbstractSet
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from ai_bom.config import (
     DEPRECATED_MODELS,
@@ -23,6 +30,64 @@ from ai_bom.detectors.llm_patterns import LLM_PATTERNS, get_all_dep_names
 from ai_bom.models import AIComponent, ComponentType, SourceLocation, UsageType
 from ai_bom.scanners.base import BaseScanner
 
+# Every package name the dependency parsers treat as AI-related, built once
+_KNOWN_AI_DEPS: frozenset[str] = frozenset(get_all_dep_names()).union(KNOWN_AI_PACKAGES)
+
+# Lower-cased dependency file name -> CodeScanner parser method
+_DEP_FILE_PARSERS: dict[str, str] = {
+    "requirements.txt": "_parse_requirements_format",
+    "pipfile": "_parse_requirements_format",
+    "pyproject.toml": "_parse_pyproject_toml",
+    "package.json": "_parse_package_json",
+    "cargo.toml": "_parse_cargo_toml",
+    "go.mod": "_parse_go_mod",
+    "gemfile": "_parse_gemfile",
+    "pom.xml": "_parse_pom_xml",
+    "build.gradle": "_parse_gradle",
+    "build.gradle.kts": "_parse_gradle",
+}
+
+# Below this many dependency files, parse inline rather than start a thread pool
+_PARALLEL_DEP_FILES_MIN = 4
+
+# Parsed dependency files keyed by (scanner class, parser, path, mtime_ns, size),
+# so unchanged files are not re-read by later scans in the same process
+_DEP_FILE_CACHE_SIZE = 512
+_dep_file_cache: dict[tuple[type, str, str, int, int], frozenset[str]] = {}
+_dep_file_cache_lock = threading.Lock()
+
+# Dependency-file patterns, compiled once at import rather than per parse
+
+# requirements.txt: package name ends at the first version specifier/extra
+_REQUIREMENT_NAME_END_RE = re.compile(r"[=<>!~\[\s]")
+
+# pyproject.toml: "openai>=1.0" or "openai" inside a dependencies array
+_PYPROJECT_DEP_RE = re.compile(r'["\']([a-zA-Z0-9_-]+)(?:[>=<\[]|["\'])')
+
+# package.json: "openai": "^1.0.0" or "@anthropic/sdk": "latest"
+_PACKAGE_JSON_DEP_RE = re.compile(r'["\']([a-zA-Z0-9@/_-]+)["\']\s*:\s*["\']')
+
+# Gemfile: gem 'ruby-openai' or gem "anthropic", "~> 0.1"
+_GEMFILE_GEM_RE = re.compile(r"gem\s+['\"]([a-zA-Z0-9_-]+)['\"]")
+
+# pom.xml: groupId / artifactId elements, in document order (single line each)
+_POM_COORDINATE_RE = re.compile(r"<(groupId|artifactId)>([^<\n]+)</\1>")
+
+# build.gradle(.kts): Groovy implementation 'g:a:v' and Kotlin implementation("g:a:v")
+_GRADLE_DEP_RE = re.compile(
+    r"(?:implementation|compile|api|testImplementation)\s*(?:\()?['\"]([a-zA-Z0-9._:/-]+)"
+)
+
+# .csproj: <PackageReference Include="Azure.AI.OpenAI" ... />
+_CSPROJ_PACKAGE_RE = re.compile(r'<PackageReference\s+Include="([^"]+)"')
+
+# Cargo.toml tables that declare crates (top level, [workspace] and [target.*])
+_CARGO_DEP_TABLES = ("dependencies", "dev-dependencies", "build-dependencies")
+
+# Model version pinning: a date-like digit run, or a trailing -NNNN
+_MODEL_DATE_RE = re.compile(r"\d{4,8}")
+_MODEL_VERSION_SUFFIX_RE = re.compile(r"-\d{4}$")
+
 
 class CodeScanner(BaseScanner):
     """Scan source code for AI SDK imports and usage.
@@ -93,7 +158,7 @@ class CodeScanner(BaseScanner):
             # Determine component type based on provider/usage
             component_type = self._determine_component_type(provider, usage_type_str)
 
-            component = AIComponent(
+            component = AIComponent.trusted(
                 name=dep_name,
                 type=component_type,
                 provider=provider,
@@ -127,77 +192,67 @@ class CodeScanner(BaseScanner):
             Set of declared AI package names
         """
         declared_deps: set[str] = set()
-        all_known_ai_deps = get_all_dep_names() | set(KNOWN_AI_PACKAGES.keys())
-
-        # Find all dependency files
-        # Get files matching exact names from the list
-        dep_files_list = list(self.iter_files(path, filenames=SCANNABLE_EXTENSIONS["deps"]))
-
-        # Also find .csproj files (pattern matching) since they can have any name
-        for file_path in path.rglob("*.csproj"):
-            if file_path.is_file() and file_path not in dep_files_list:
-                dep_files_list.append(file_path)
-
-        dep_files = dep_files_list
 
-        for dep_file in dep_files:
-            filename = dep_file.name.lower()
+        # One walk finds both the named dependency files and *.csproj files
+        # (which can have any name); excluded directories are pruned as usual
+        dep_files = list(
+            self.iter_files(path, extensions={".csproj"}, filenames=SCANNABLE_EXTENSIONS["deps"])
+        )
 
-            try:
-                content = dep_file.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
-                # Skip unreadable files
-                continue
+        # Parsers are independent, so overlap their file reads on larger trees
+        results: Iterable[set[str]]
+        if len(dep_files) < _PARALLEL_DEP_FILES_MIN:
+            results = map(self._scan_single_dep_file, dep_files)
+        else:
+            workers = min(8, os.cpu_count() or 1, len(dep_files))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._scan_single_dep_file, dep_files))
 
-            # Parse based on file type
-            if filename == "requirements.txt" or filename == "pipfile":
-                declared_deps.update(self._parse_requirements_format(content, all_known_ai_deps))
-            elif filename == "pyproject.toml":
-                declared_deps.update(self._parse_pyproject_toml(content, all_known_ai_deps))
-            elif filename == "package.json":
-                declared_deps.update(self._parse_package_json(content, all_known_ai_deps))
-            elif filename == "cargo.toml":
-                declared_deps.update(self._parse_cargo_toml(content, all_known_ai_deps))
-            elif filename == "go.mod":
-                declared_deps.update(self._parse_go_mod(content, all_known_ai_deps))
-            elif filename == "gemfile":
-                declared_deps.update(self._parse_gemfile(content, all_known_ai_deps))
-            elif filename == "pom.xml":
-                declared_deps.update(self._parse_pom_xml(content, all_known_ai_deps))
-            elif filename in ("build.gradle", "build.gradle.kts"):
-                declared_deps.update(self._parse_gradle(content, all_known_ai_deps))
-            elif filename.endswith(".csproj"):
-                declared_deps.update(self._parse_csproj(content, all_known_ai_deps))
+        for found in results:
+            declared_deps.update(found)
 
         return declared_deps
 
     def _scan_single_dep_file(self, path: Path) -> set[str]:
-        """Scan a single dependency file."""
-        all_known_ai_deps = get_all_dep_names() | set(KNOWN_AI_PACKAGES.keys())
+        """Scan a single dependency file with the parser for its file name."""
+        filename = path.name.lower()
+        parser_name = _DEP_FILE_PARSERS.get(filename)
+        if parser_name is None and filename.endswith(".csproj"):
+            parser_name = "_parse_csproj"
+        if parser_name is None:
+            # Known dependency file without a parser (e.g. poetry.lock): don't read it
+            return set()
+
+        # Reuse the previous parse while the file's mtime and size are unchanged
         try:
-            content = path.read_text(encoding="utf-8", errors="ignore")
+            st = os.stat(path)
+        except OSError:
+            return set()
+        cache_key = (type(self), parser_name, os.fspath(path), st.st_mtime_ns, st.st_size)
+        with _dep_file_cache_lock:
+            cached = _dep_file_cache.get(cache_key)
+        if cached is not None:
+            return set(cached)
+
+        try:
+            content = path.read_bytes().decode("utf-8", errors="ignore")
         except Exception:
             return set()
-        filename = path.name.lower()
-        if filename == "requirements.txt" or filename == "pipfile":
-            return self._parse_requirements_format(content, all_known_ai_deps)
-        elif filename == "pyproject.toml":
-            return self._parse_pyproject_toml(content, all_known_ai_deps)
-        elif filename == "package.json":
-            return self._parse_package_json(content, all_known_ai_deps)
-        elif filename == "cargo.toml":
-            return self._parse_cargo_toml(content, all_known_ai_deps)
-        elif filename == "go.mod":
-            return self._parse_go_mod(content, all_known_ai_deps)
-        elif filename == "gemfile":
-            return self._parse_gemfile(content, all_known_ai_deps)
-        elif filename == "pom.xml":
-            return self._parse_pom_xml(content, all_known_ai_deps)
-        elif filename in ("build.gradle", "build.gradle.kts"):
-            return self._parse_gradle(content, all_known_ai_deps)
-        elif filename.endswith(".csproj"):
-            return self._parse_csproj(content, all_known_ai_deps)
-        return set()
+        parser: Callable[[str, AbstractSet[str]], set[str]] = getattr(self, parser_name)
+        found = parser(content, _KNOWN_AI_DEPS)
+
+        with _dep_file_cache_lock:
+            if len(_dep_file_cache) >= _DEP_FILE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _dep_file_cache[next(iter(_dep_file_cache))]
+            _dep_file_cache[cache_key] = frozenset(found)
+        return found
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached dependency-file parse results."""
+        with _dep_file_cache_lock:
+            _dep_file_cache.clear()
 
     def _scan_single_source_file(
         self,
@@ -208,7 +263,7 @@ class CodeScanner(BaseScanner):
         """Scan a single source file for AI SDK usage."""
         components: list[AIComponent] = []
         try:
-            content = path.read_text(encoding="utf-8", errors="ignore")
+            content = path.read_bytes().decode("utf-8", errors="ignore")
         except Exception:
             return components
         lines = content.splitlines()
@@ -216,7 +271,7 @@ class CodeScanner(BaseScanner):
         for line_num, line in enumerate(lines, start=1):
             api_key_results = detect_api_key(line)
             for _, provider, _ in api_key_results:
-                component = AIComponent(
+                component = AIComponent.trusted(
                     name=f"{provider} API Key",
                     type=ComponentType.llm_provider,
                     provider=provider,
@@ -250,7 +305,7 @@ class CodeScanner(BaseScanner):
                                 flags.append("unpinned_model")
                     if is_shadow_ai:
                         flags.append("shadow_ai")
-                    component = AIComponent(
+                    component = AIComponent.trusted(
                         name=pat.sdk_name,
                         type=pat.component_type,
                         provider=pat.provider,
@@ -267,7 +322,7 @@ class CodeScanner(BaseScanner):
                     components.append(component)
         return components
 
-    def _parse_requirements_format(self, content: str, known_deps: set[str]) -> set[str]:
+    def _parse_requirements_format(self, content: str, known_deps: AbstractSet[str]) -> set[str]:
         """Parse requirements.txt or Pipfile format.
 
         Format: package==version or package>=version or just package
@@ -290,7 +345,7 @@ class CodeScanner(BaseScanner):
 
             # Extract package name (before any version specifier)
             # Split on common version specifiers
-            package_name = re.split(r"[=<>!~\[\s]", line)[0].strip()
+            package_name = _REQUIREMENT_NAME_END_RE.split(line, maxsplit=1)[0].strip()
 
             # Normalize package name (replace _ with -)
             normalized = package_name.replace("_", "-").lower()
@@ -301,7 +356,7 @@ class CodeScanner(BaseScanner):
 
         return found
 
-    def _parse_pyproject_toml(self, content: str, known_deps: set[str]) -> set[str]:
+    def _parse_pyproject_toml(self, content: str, known_deps: AbstractSet[str]) -> set[str]:
         """Parse pyproject.toml dependencies section.
 
         Looks for dependencies = [ ... ] or tool.poetry.dependencies
@@ -316,9 +371,6 @@ class CodeScanner(BaseScanner):
         found: set[str] = set()
 
         # Simple regex-based parsing (good enough for most cases)
-        # Match lines like: "openai>=1.0" or "openai" inside dependencies array
-        dep_pattern = r'["\']([a-zA-Z0-9_-]+)(?:[>=<\[]|["\'])'
-
         # Check if we're in a dependencies section
         in_deps_section = False
 
@@ -335,7 +387,7 @@ class CodeScanner(BaseScanner):
 
             # Parse dependency lines
             if in_deps_section:
-                matches = re.findall(dep_pattern, line)
+                matches = _PYPROJECT_DEP_RE.findall(line)
                 for package_name in matches:
                     normalized = package_name.replace("_", "-").lower()
                     if package_name in known_deps or normalized in known_deps:
@@ -343,7 +395,7 @@ class CodeScanner(BaseScanner):
 
         return found
 
-    def _parse_package_json(self, content: str, known_deps: set[str]) -> set[str]:
+    def _parse_package_json(self, content: str, known_deps: AbstractSet[str]) -> set[str]:
         """Parse package.json dependencies and devDependencies.
 
         Args:
@@ -355,10 +407,7 @@ class CodeScanner(BaseScanner):
         """
         found: set[str] = set()
 
-        # Match lines like: "openai": "^1.0.0" or "@anthropic/sdk": "latest"
-        dep_pattern = r'["\']([a-zA-Z0-9@/_-]+)["\']\s*:\s*["\']'
-
-        for match in re.finditer(dep_pattern, content):
+        for match in _PACKAGE_JSON_DEP_RE.finditer(content):
             package_name = match.group(1)
 
             # Remove scope prefix if present (e.g., @anthropic/sdk -> sdk)
@@ -393,7 +442,7 @@ class CodeScanner(BaseScanner):
 
         for source_file in source_files:
             try:
-                content = source_file.read_text(encoding="utf-8", errors="ignore")
+                content = source_file.read_bytes().decode("utf-8", errors="ignore")
             except Exception:
                 # Skip unreadable files
                 continue
@@ -408,7 +457,7 @@ class CodeScanner(BaseScanner):
                 # Check for API keys
                 api_key_results = detect_api_key(line)
                 for _, provider, _ in api_key_results:
-                    component = AIComponent(
+                    component = AIComponent.trusted(
                         name=f"{provider} API Key",
                         type=ComponentType.llm_provider,
                         provider=provider,
@@ -457,7 +506,7 @@ class CodeScanner(BaseScanner):
 
                                     # Create a model component
                                     if model_flags:
-                                        component = AIComponent(
+                                        component = AIComponent.trusted(
                                             name=f"{llm_pat.sdk_name} Model",
                                             type=ComponentType.model,
                                             provider=llm_pat.provider,
@@ -499,7 +548,7 @@ class CodeScanner(BaseScanner):
                         if is_shadow_ai:
                             sdk_flags.append("shadow_ai")
 
-                        component = AIComponent(
+                        component = AIComponent.trusted(
                             name=llm_pat.sdk_name,
                             type=llm_pat.component_type,
                             provider=llm_pat.provider,
@@ -556,7 +605,9 @@ class CodeScanner(BaseScanner):
         # If model name contains a date pattern (e.g., 20240229, 0314) it's pinned
         # If model name ends with a specific version number, it's pinned
         # e.g., gpt-3.5-turbo-0125
-        return bool(re.search(r"\d{4,8}", model_name) or re.search(r"-\d{4}$", model_name))
+        return bool(
+            _MODEL_DATE_RE.search(model_name) or _MODEL_VERSION_SUFFIX_RE.search(model_name)
+        )
 
     def _map_usage_type(self, usage_type_str: str) -> UsageType:
         """Map usage type string to UsageType enum.
@@ -600,12 +651,69 @@ class CodeScanner(BaseScanner):
         # Default to LLM provider
         return ComponentType.llm_provider
 
-    def _parse_cargo_toml(self, content: str, known_deps: set[str]) -> set[str]:
-        """Parse Cargo.toml dependencies section (Rust).
+    def _parse_cargo_toml(self, content: str, known_deps: AbstractSet[str]) -> set[str]:
+        """Parse Cargo.toml dependency tables (Rust).
 
         Looks for dependencies like:
         async-openai = "0.14"
         anthropic-sdk = { version = "0.1" }
+        openai = { package = "async-openai", version = "0.14" }
+
+        The file is parsed with tomllib; [dependencies], [dev-dependencies] and
+        [build-dependencies] are read at the top level, under [workspace] and
+        under each [target.*] table.  Files that are not valid TOML fall back
+        to a line-based scan.
+
+        Args:
+            content: File content
+            known_deps: Set of known AI package names
+
+        Returns:
+            Set of found AI package names
+        """
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:  # pragma: no cover - exercised on Python 3.10 only
+            import tomli as tomllib
+
+        try:
+            data = tomllib.loads(content)
+        except tomllib.TOMLDecodeError:
+            return self._parse_cargo_toml_lines(content, known_deps)
+
+        tables: list[Any] = [data, data.get("workspace")]
+        targets = data.get("target")
+        if isinstance(targets, dict):
+            tables.extend(targets.values())
+
+        found: set[str] = set()
+        for table in tables:
+            if not isinstance(table, dict):
+                continue
+            for section in _CARGO_DEP_TABLES:
+                deps = table.get(section)
+                if not isinstance(deps, dict):
+                    continue
+                for package_name, spec in deps.items():
+                    # A renamed dependency keeps the real crate name in "package"
+                    if isinstance(spec, dict) and isinstance(spec.get("package"), str):
+                        package_name = spec["package"]
+                    if self._is_known_crate(package_name, known_deps):
+                        found.add(package_name)
+
+        return found
+
+    @staticmethod
+    def _is_known_crate(package_name: str, known_deps: AbstractSet[str]) -> bool:
+        """Check a crate name against known deps in its -/_ spellings."""
+        return (
+            package_name in known_deps
+            or package_name.replace("-", "_") in known_deps
+            or package_name.replace("_", "-") in known_deps
+        )
+
+    def _parse_cargo_toml_lines(self, content: str, known_deps: AbstractSet[str]) -> set[str]:
+        """Line-based Cargo.toml fallback for files tomllib cannot parse.
 
         Args:
             content: File content
@@ -632,27 +740,23 @@ class CodeScanner(BaseScanner):
             # Parse dependency lines
             if in_deps_section and "=" in line:
                 # Extract package name (before =)
-                package_name = line.split("=")[0].strip()
+                package_name = line.partition("=")[0].strip()
 
-                # Normalize: replace - with _ and vice versa
-                normalized_underscore = package_name.replace("-", "_")
-                normalized_dash = package_name.replace("_", "-")
-
-                if (
-                    package_name in known_deps
-                    or normalized_underscore in known_deps
-                    or normalized_dash in known_deps
-                ):
+                if self._is_known_crate(package_name, known_deps):
                     found.add(package_name)
 
         return found
 
-    def _parse_go_mod(self, content: str, known_deps: set[str]) -> set[str]:
+    def _parse_go_mod(self, content: str, known_deps: AbstractSet[str]) -> set[str]:
         """Parse go.mod require section (Go).
 
         Looks for require statements like:
         require github.com/sashabaranov/go-openai v1.5.0
 
+        Both the single-line form and ``require ( ... )`` blocks are read; module
+        paths in replace/exclude/retract directives are not dependencies and are
+        skipped.
+
         Args:
             content: File content
             known_deps: Set of known AI package names
@@ -661,24 +765,35 @@ class CodeScanner(BaseScanner):
             Set of found AI package names
         """
         found: set[str] = set()
+        in_require_block = False
 
         for line in content.splitlines():
-            line = line.strip()
+            # Drop "// indirect" and other trailing comments
+            line = line.partition("//")[0].strip()
+            if not line:
+                continue
 
-            # Match require lines
-            if line.startswith("require ") or (not line.startswith("//") and "/" in line):
-                # Extract package path
+            if in_require_block:
+                if line == ")":
+                    in_require_block = False
+                    continue
                 parts = line.split()
-                if len(parts) >= 2:
-                    package_path = parts[0] if parts[0] != "require" else parts[1]
-
-                    # Check if full path matches known deps
-                    if package_path in known_deps:
-                        found.add(package_path)
+            else:
+                if not line.startswith("require"):
+                    continue
+                rest = line[len("require") :].strip()
+                if rest == "(":
+                    in_require_block = True
+                    continue
+                parts = rest.split()
+
+            # module path followed by a version (v1.2.3 or a pseudo-version)
+            if len(parts) >= 2 and parts[1].startswith("v") and parts[0] in known_deps:
+                found.add(parts[0])
 
         return found
 
-    def _parse_gemfile(self, content: str, known_deps: set[str]) -> set[str]:
+    def _parse_gemfile(self, content: str, known_deps: AbstractSet[str]) -> set[str]:
         """Parse Gemfile gem declarations (Ruby).
 
         Looks for gem statements like:
@@ -694,12 +809,8 @@ class CodeScanner(BaseScanner):
         """
         found: set[str] = set()
 
-        # Match gem declarations
-        gem_pattern = r"gem\s+['\"]([a-zA-Z0-9_-]+)['\"]"
-
-        for match in re.finditer(gem_pattern, content):
-            gem_name = match.group(1)
-
+        # findall hands back bare strings; a set drops gems listed in several groups
+        for gem_name in set(_GEMFILE_GEM_RE.findall(content)):
             # Normalize
             normalized_underscore = gem_name.replace("-", "_")
             normalized_dash = gem_name.replace("_", "-")
@@ -713,7 +824,7 @@ class CodeScanner(BaseScanner):
 
         return found
 
-    def _parse_pom_xml(self, content: str, known_deps: set[str]) -> set[str]:
+    def _parse_pom_xml(self, content: str, known_deps: AbstractSet[str]) -> set[str]:
         """Parse pom.xml Maven dependencies (Java).
 
         Looks for dependency elements like:
@@ -731,25 +842,19 @@ class CodeScanner(BaseScanner):
         """
         found: set[str] = set()
 
-        # Extract groupId and artifactId pairs
-        group_id_pattern = r"<groupId>([^<]+)</groupId>"
-        artifact_id_pattern = r"<artifactId>([^<]+)</artifactId>"
-
-        lines = content.splitlines()
+        # Extract groupId and artifactId pairs in one pass over the file
         current_group_id = None
 
-        for line in lines:
-            line = line.strip()
+        for match in _POM_COORDINATE_RE.finditer(content):
+            tag, value = match.group(1, 2)
 
             # Match groupId
-            group_match = re.search(group_id_pattern, line)
-            if group_match:
-                current_group_id = group_match.group(1)
+            if tag == "groupId":
+                current_group_id = value
 
             # Match artifactId
-            artifact_match = re.search(artifact_id_pattern, line)
-            if artifact_match and current_group_id:
-                artifact_id = artifact_match.group(1)
+            elif current_group_id:
+                artifact_id = value
 
                 # Build full coordinate
                 full_name = f"{current_group_id}:{artifact_id}"
@@ -762,7 +867,7 @@ class CodeScanner(BaseScanner):
 
         return found
 
-    def _parse_gradle(self, content: str, known_deps: set[str]) -> set[str]:
+    def _parse_gradle(self, content: str, known_deps: AbstractSet[str]) -> set[str]:
         """Parse build.gradle or build.gradle.kts Gradle dependencies (Java/Kotlin).
 
         Looks for implementation/compile statements like:
@@ -779,32 +884,22 @@ class CodeScanner(BaseScanner):
         found: set[str] = set()
 
         # Match implementation/compile lines for both Groovy and Kotlin DSL
-        # Groovy: implementation 'group:artifact:version'
-        # Kotlin: implementation("group:artifact:version")
-        dep_pattern = (
-            r"(?:implementation|compile|api|testImplementation)"
-            r"\s*(?:\()?['\"]([a-zA-Z0-9._:/-]+)"
-        )
-
-        for match in re.finditer(dep_pattern, content):
-            dep_string = match.group(1)
-
+        # (a coordinate repeated across configurations is only checked once)
+        for dep_string in set(_GRADLE_DEP_RE.findall(content)):
             # Extract group:artifact from dep string
-            if ":" in dep_string:
+            first, sep, rest = dep_string.partition(":")
+            if sep:
                 # Full coordinate format (group:artifact:version or artifact:version)
-                parts = dep_string.split(":")
-
-                if len(parts) >= 2:
-                    # Check if it's full coordinate (group:artifact) or just (artifact:version)
-                    # If parts[0] is a known dep, it's artifact:version format
-                    if parts[0] in known_deps:
-                        # artifact:version format (e.g., spring-ai:0.8.0)
-                        found.add(parts[0])
-                    else:
-                        # group:artifact:version format (e.g., com.langchain4j:langchain4j:0.27.0)
-                        group_artifact = f"{parts[0]}:{parts[1]}"
-                        if group_artifact in known_deps or parts[1] in known_deps:
-                            found.add(group_artifact)
+                # If the first part is a known dep, it's artifact:version format
+                if first in known_deps:
+                    # artifact:version format (e.g., spring-ai:0.8.0)
+                    found.add(first)
+                else:
+                    # group:artifact:version format (e.g., com.langchain4j:langchain4j:0.27.0)
+                    artifact = rest.partition(":")[0]
+                    group_artifact = f"{first}:{artifact}"
+                    if group_artifact in known_deps or artifact in known_deps:
+                        found.add(group_artifact)
             else:
                 # Just artifact name
                 if dep_string in known_deps:
@@ -812,7 +907,7 @@ class CodeScanner(BaseScanner):
 
         return found
 
-    def _parse_csproj(self, content: str, known_deps: set[str]) -> set[str]:
+    def _parse_csproj(self, content: str, known_deps: AbstractSet[str]) -> set[str]:
         """Parse .csproj PackageReference elements (.NET).
 
         Looks for PackageReference elements like:
@@ -829,9 +924,7 @@ class CodeScanner(BaseScanner):
         found: set[str] = set()
 
         # Match PackageReference Include attribute
-        package_pattern = r'<PackageReference\s+Include="([^"]+)"'
-
-        for match in re.finditer(package_pattern, content):
+        for match in _CSPROJ_PACKAGE_RE.finditer(content):
             package_name = match.group(1)
 
             if package_name in known_deps:
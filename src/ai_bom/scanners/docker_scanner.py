@@ -6,11 +6,10 @@ import re
 from pathlib import Path
 from re import Pattern
 
-import yaml
-
 from ai_bom.config import AI_DOCKER_IMAGES
 from ai_bom.models import AIComponent, ComponentType, SourceLocation, UsageType
 from ai_bom.scanners.base import BaseScanner
+from ai_bom.utils.fast_yaml import safe_load
 
 
 class DockerScanner(BaseScanner):
@@ -48,13 +47,10 @@ class DockerScanner(BaseScanner):
         "EMBEDDING",
     ]
 
-    def __init__(self) -> None:
-        """Initialize the Docker scanner."""
-        super().__init__()
-        # Compile AI image patterns for efficient matching
-        self._image_patterns: list[Pattern[str]] = [
-            re.compile(re.escape(prefix)) for prefix in AI_DOCKER_IMAGES
-        ]
+    # AI image prefixes, compiled once for every instance
+    _image_patterns: tuple[Pattern[str], ...] = tuple(
+        re.compile(re.escape(prefix)) for prefix in AI_DOCKER_IMAGES
+    )
 
     def supports(self, path: Path) -> bool:
         """Check if this scanner should run on the given path.
@@ -157,12 +153,14 @@ class DockerScanner(BaseScanner):
         try:
             content = file_path.read_text(encoding="utf-8", errors="ignore")
             lines = content.splitlines()
+            # One path string shared by every component from this file
+            location_path = str(file_path.resolve())
 
             for line_num, line in enumerate(lines, start=1):
                 # Strip comments and whitespace
                 line = line.strip()
                 if "#" in line:
-                    line = line.split("#")[0].strip()
+                    line = line.partition("#")[0].strip()
 
                 # Look for FROM instructions
                 if not line.upper().startswith("FROM"):
@@ -188,13 +186,13 @@ class DockerScanner(BaseScanner):
                         # Parse image name and version
                         image_name, version = self._parse_image_ref(image_ref)
 
-                        component = AIComponent(
+                        component = AIComponent.trusted(
                             name=image_name,
                             type=ComponentType.container,
                             version=version,
                             provider=self._extract_provider(image_name),
                             location=SourceLocation(
-                                file_path=str(file_path.resolve()),
+                                file_path=location_path,
                                 line_number=line_num,
                                 context_snippet=line,
                             ),
@@ -220,11 +218,13 @@ class DockerScanner(BaseScanner):
         Returns:
             List of AI components found in the compose file
         """
+        import yaml
+
         components: list[AIComponent] = []
 
         try:
             content = file_path.read_text(encoding="utf-8", errors="ignore")
-            data = yaml.safe_load(content)
+            data = safe_load(content)
 
             if not isinstance(data, dict):
                 return components
@@ -233,6 +233,9 @@ class DockerScanner(BaseScanner):
             if not isinstance(services, dict):
                 return components
 
+            # One path string shared by every component from this file
+            location_path = str(file_path.resolve())
+
             for service_name, service_config in services.items():
                 if not isinstance(service_config, dict):
                     continue
@@ -269,13 +272,13 @@ class DockerScanner(BaseScanner):
                             if has_ai_env:
                                 metadata["has_ai_env_vars"] = True
 
-                            component = AIComponent(
+                            component = AIComponent.trusted(
                                 name=f"{service_name} ({image_name})",
                                 type=ComponentType.container,
                                 version=version,
                                 provider=self._extract_provider(image_name),
                                 location=SourceLocation(
-                                    file_path=str(file_path.resolve()),
+                                    file_path=location_path,
                                     line_number=None,
                                     context_snippet=f"Service: {service_name}",
                                 ),
@@ -308,17 +311,21 @@ class DockerScanner(BaseScanner):
                         if dockerfile_path.exists():
                             # Scan the Dockerfile
                             dockerfile_components = self._scan_dockerfile(dockerfile_path)
+                            if not dockerfile_components:
+                                continue
+
+                            # GPU, model mounts and env vars are per service, so check
+                            # them once rather than for every multi-stage FROM match
+                            has_gpu = self._check_gpu(service_config)
+                            has_models = self._check_model_mounts(service_config)
+                            has_ai_env = self._check_ai_env_vars(service_config)
+
                             # Update service name in components
                             for comp in dockerfile_components:
                                 comp.name = f"{service_name} ({comp.name})"
                                 comp.metadata["service_name"] = service_name
                                 comp.metadata["file_type"] = "compose_build"
 
-                                # Check for GPU, model mounts, and env vars
-                                has_gpu = self._check_gpu(service_config)
-                                has_models = self._check_model_mounts(service_config)
-                                has_ai_env = self._check_ai_env_vars(service_config)
-
                                 if has_gpu:
                                     comp.metadata["gpu"] = True
                                 if has_models:
@@ -348,20 +355,16 @@ class DockerScanner(BaseScanner):
         """
         # Remove "as builder" or similar aliases
         if " as " in image_ref.lower():
-            image_ref = image_ref.split(" as ")[0].strip()
+            image_ref = image_ref.partition(" as ")[0].strip()
 
         # Split by colon to separate name and tag
-        if ":" in image_ref:
-            parts = image_ref.rsplit(":", 1)
-            image_name = parts[0]
-            version = parts[1]
-        else:
-            image_name = image_ref
-            version = "latest"
+        image_name, sep, version = image_ref.rpartition(":")
+        if not sep:
+            image_name, version = image_ref, "latest"
 
         # Extract digest if present
         if "@sha256:" in image_name:
-            image_name = image_name.split("@")[0]
+            image_name = image_name.partition("@")[0]
 
         return image_name, version
 
@@ -490,7 +493,7 @@ class DockerScanner(BaseScanner):
                 if not isinstance(env_var, str):
                     continue
                 # Format: "KEY=value" or just "KEY"
-                key = env_var.split("=")[0].upper()
+                key = env_var.partition("=")[0].upper()
                 for pattern in self.AI_ENV_PATTERNS:
                     if pattern in key:
                         return True
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
-
+from ai_bom.detectors.endpoint_db import has_api_key
 from ai_bom.models import AIComponent, ComponentType, SourceLocation, UsageType
 from ai_bom.scanners.base import BaseScanner
+from ai_bom.utils.fast_yaml import safe_load
 
 
 class GitHubActionsScanner(BaseScanner):
@@ -66,6 +68,34 @@ class GitHubActionsScanner(BaseScanner):
         "XAI_API_KEY",
     ]
 
+    # Any AI_ACTIONS entry inside a uses: reference, in one case-insensitive search
+    AI_ACTION_PATTERN = re.compile("|".join(map(re.escape, AI_ACTIONS)), re.IGNORECASE)
+
+    # Env var name fragment -> provider, checked in order (first match wins)
+    ENV_VAR_PROVIDERS = (
+        ("OPENAI", "OpenAI"),
+        ("ANTHROPIC", "Anthropic"),
+        ("CLAUDE", "Anthropic"),
+        ("HUGGING", "HuggingFace"),
+        ("HF_", "HuggingFace"),
+        ("COHERE", "Cohere"),
+        ("MISTRAL", "Mistral"),
+        ("GOOGLE", "Google"),
+        ("VERTEX", "Google"),
+        ("REPLICATE", "Replicate"),
+        ("TOGETHER", "Together"),
+        ("GROQ", "Groq"),
+        ("DEEPSEEK", "DeepSeek"),
+        ("XAI", "xAI"),
+    )
+
+    # Every detection above needs one of these strings somewhere in the file, so
+    # workflows without a hit are skipped before the (much slower) YAML parse
+    AI_KEYWORD_PATTERN = re.compile(
+        b"|".join(re.escape(keyword.encode()) for keyword in [*AI_ACTIONS, *AI_ENV_VARS]),
+        re.IGNORECASE,
+    )
+
     def supports(self, path: Path) -> bool:
         """Check if this scanner should run on the given path.
 
@@ -124,16 +154,24 @@ class GitHubActionsScanner(BaseScanner):
         Returns:
             List of AI components found in the workflow
         """
+        import yaml
+
         components: list[AIComponent] = []
 
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            data = yaml.safe_load(content)
+            raw = file_path.read_bytes()
+            if not self.AI_KEYWORD_PATTERN.search(raw):
+                return components
+
+            content = raw.decode("utf-8", errors="ignore")
+            data = safe_load(content)
 
             if not isinstance(data, dict):
                 return components
 
             workflow_name = data.get("name", file_path.stem)
+            # One path string shared by every component from this file
+            location_path = str(file_path.resolve())
 
             # Scan jobs for AI actions
             jobs = data.get("jobs", {})
@@ -160,45 +198,43 @@ class GitHubActionsScanner(BaseScanner):
                         action_ref = uses.strip()
 
                         # Check if it matches any AI action pattern
-                        for ai_action in self.AI_ACTIONS:
-                            if ai_action.lower() in action_ref.lower():
-                                # Parse action owner/name and version
-                                action_name, version = self._parse_action_ref(action_ref)
-
-                                component = AIComponent(
-                                    name=f"{action_name} (GitHub Action)",
-                                    type=ComponentType.workflow,
-                                    version=version,
-                                    provider="GitHub Actions",
-                                    location=SourceLocation(
-                                        file_path=str(file_path.resolve()),
-                                        line_number=None,
-                                        context_snippet=(
-                                            f"Workflow: {workflow_name},"
-                                            f" Job: {job_name},"
-                                            f" Step {step_idx}"
-                                        ),
+                        if self.AI_ACTION_PATTERN.search(action_ref):
+                            # Parse action owner/name and version
+                            action_name, version = self._parse_action_ref(action_ref)
+
+                            component = AIComponent.trusted(
+                                name=f"{action_name} (GitHub Action)",
+                                type=ComponentType.workflow,
+                                version=version,
+                                provider="GitHub Actions",
+                                location=SourceLocation(
+                                    file_path=location_path,
+                                    line_number=None,
+                                    context_snippet=(
+                                        f"Workflow: {workflow_name},"
+                                        f" Job: {job_name},"
+                                        f" Step {step_idx}"
                                     ),
-                                    usage_type=UsageType.orchestration,
-                                    source="github-actions",
-                                    metadata={
-                                        "workflow_name": workflow_name,
-                                        "job_name": job_name,
-                                        "step_number": step_idx,
-                                        "action_reference": action_ref,
-                                        "step_name": step.get("name", ""),
-                                    },
-                                )
-                                components.append(component)
-                                break
+                                ),
+                                usage_type=UsageType.orchestration,
+                                source="github-actions",
+                                metadata={
+                                    "workflow_name": workflow_name,
+                                    "job_name": job_name,
+                                    "step_number": step_idx,
+                                    "action_reference": action_ref,
+                                    "step_name": step.get("name", ""),
+                                },
+                            )
+                            components.append(component)
 
                 # Check for AI environment variables in job
                 components.extend(
-                    self._check_env_vars(job_config, file_path, workflow_name, job_name)
+                    self._check_env_vars(job_config, location_path, workflow_name, job_name)
                 )
 
             # Check for global environment variables
-            components.extend(self._check_env_vars(data, file_path, workflow_name, "global"))
+            components.extend(self._check_env_vars(data, location_path, workflow_name, "global"))
 
         except yaml.YAMLError:
             # YAML parse error, skip this file
@@ -209,9 +245,14 @@ class GitHubActionsScanner(BaseScanner):
 
         return components
 
-    def _parse_action_ref(self, action_ref: str) -> tuple[str, str]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_action_ref(action_ref: str) -> tuple[str, str]:
         """Parse GitHub Action reference into name and version.
 
+        Cached: the same few references (actions/checkout@v4, ...) repeat in
+        nearly every workflow of a repository.
+
         Args:
             action_ref: GitHub Action reference (e.g., "actions/checkout@v3")
 
@@ -219,24 +260,16 @@ class GitHubActionsScanner(BaseScanner):
             Tuple of (action_name, version)
         """
         # Remove comments
-        if "#" in action_ref:
-            action_ref = action_ref.split("#")[0].strip()
+        action_ref = action_ref.partition("#")[0]
 
         # Split by @ to separate name and version/ref
-        if "@" in action_ref:
-            parts = action_ref.split("@", 1)
-            action_name = parts[0].strip()
-            version = parts[1].strip()
-        else:
-            action_name = action_ref.strip()
-            version = "latest"
-
-        return action_name, version
+        action_name, sep, version = action_ref.partition("@")
+        return action_name.strip(), version.strip() if sep else "latest"
 
     def _check_env_vars(
         self,
         config: dict,
-        file_path: Path,
+        location_path: str,
         workflow_name: str,
         scope: str,
     ) -> list[AIComponent]:
@@ -244,7 +277,7 @@ class GitHubActionsScanner(BaseScanner):
 
         Args:
             config: Workflow or job configuration dictionary
-            file_path: Path to workflow file
+            location_path: Resolved path of the workflow file
             workflow_name: Name of the workflow
             scope: Scope of env vars (job name or "global")
 
@@ -267,14 +300,15 @@ class GitHubActionsScanner(BaseScanner):
                     # Determine provider from env var name
                     provider = self._extract_provider_from_env(env_var_name_upper)
 
-                    # Check if value is hardcoded (security risk)
+                    # Check if value is hardcoded (security risk); a literal key
+                    # inside a ${{ }} expression still counts
                     is_hardcoded = not (
                         isinstance(env_var_value, str)
                         and (
                             env_var_value.startswith("${{")
                             or "secrets." in str(env_var_value).lower()
                         )
-                    )
+                    ) or has_api_key(str(env_var_value))
 
                     metadata: dict = {
                         "workflow_name": workflow_name,
@@ -285,13 +319,13 @@ class GitHubActionsScanner(BaseScanner):
                     if is_hardcoded:
                         metadata["hardcoded"] = True
 
-                    component = AIComponent(
+                    component = AIComponent.trusted(
                         name=f"{provider} API Key",
                         type=ComponentType.llm_provider,
                         version="",
                         provider=provider,
                         location=SourceLocation(
-                            file_path=str(file_path.resolve()),
+                            file_path=location_path,
                             line_number=None,
                             context_snippet=f"Workflow: {workflow_name}, Scope: {scope}",
                         ),
@@ -318,27 +352,7 @@ class GitHubActionsScanner(BaseScanner):
         Returns:
             Provider name
         """
-        if "OPENAI" in env_var_name:
-            return "OpenAI"
-        if "ANTHROPIC" in env_var_name or "CLAUDE" in env_var_name:
-            return "Anthropic"
-        if "HUGGING" in env_var_name or "HF_" in env_var_name:
-            return "HuggingFace"
-        if "COHERE" in env_var_name:
-            return "Cohere"
-        if "MISTRAL" in env_var_name:
-            return "Mistral"
-        if "GOOGLE" in env_var_name or "VERTEX" in env_var_name:
-            return "Google"
-        if "REPLICATE" in env_var_name:
-            return "Replicate"
-        if "TOGETHER" in env_var_name:
-            return "Together"
-        if "GROQ" in env_var_name:
-            return "Groq"
-        if "DEEPSEEK" in env_var_name:
-            return "DeepSeek"
-        if "XAI" in env_var_name:
-            return "xAI"
-
+        for marker, provider in self.ENV_VAR_PROVIDERS:
+            if marker in env_var_name:
+                return provider
         return "Unknown"
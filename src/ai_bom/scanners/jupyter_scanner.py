@@ -53,14 +53,11 @@ class JupyterScanner(BaseScanner):
         (r"SentenceTransformer\(['\"]([^'\"]+)", "HuggingFace", "model"),
     ]
 
-    def __init__(self) -> None:
-        """Initialize the Jupyter scanner."""
-        super().__init__()
-        # Compile model loading patterns for efficiency
-        self._model_patterns = [
-            (re.compile(pattern, re.IGNORECASE), provider, comp_type)
-            for pattern, provider, comp_type in self.MODEL_LOADING_PATTERNS
-        ]
+    # Model loading patterns, compiled once for every instance
+    _model_patterns = tuple(
+        (re.compile(pattern, re.IGNORECASE), provider, comp_type)
+        for pattern, provider, comp_type in MODEL_LOADING_PATTERNS
+    )
 
     def supports(self, path: Path) -> bool:
         """Check if this scanner should run on the given path.
@@ -164,7 +161,7 @@ class JupyterScanner(BaseScanner):
                     )
                     if import_match:
                         module_name = import_match.group(1) or import_match.group(2)
-                        base_module = module_name.split(".")[0]
+                        base_module = module_name.partition(".")[0]
 
                         # Check if it's a known AI package
                         if base_module in KNOWN_AI_PACKAGES or module_name in KNOWN_AI_PACKAGES:
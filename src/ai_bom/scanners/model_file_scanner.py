@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 
+from ai_bom.config import EXCLUDED_DIRS
 from ai_bom.models import AIComponent, ComponentType, SourceLocation, UsageType
-from ai_bom.scanners.base import BaseScanner
+from ai_bom.scanners.base import BaseScanner, _parallel_enabled
+
+# With AI_BOM_PARALLEL set, directories waiting to be listed before the walk
+# moves onto a thread pool; below this, thread start-up costs more than the
+# overlapped scandir calls save
+_PARALLEL_MIN_PENDING_DIRS = 4
 
 
 class ModelFileScanner(BaseScanner):
@@ -23,6 +30,8 @@ class ModelFileScanner(BaseScanner):
     - .bin files >1MB (heuristic for model weights)
 
     Reports file size, format, and location for each detected model.
+    Directories in ``EXCLUDED_DIRS`` (.git, node_modules, virtualenvs,
+    caches) are not walked.
     """
 
     name = "model-files"
@@ -44,6 +53,9 @@ class ModelFileScanner(BaseScanner):
     # Minimum size for .bin files to be considered models (1MB)
     MIN_BIN_SIZE = 1_048_576
 
+    # Extensions worth a stat during the walk: every model format, plus .bin
+    _CANDIDATE_EXTENSIONS: frozenset[str] = frozenset(MODEL_EXTENSIONS) | {".bin"}
+
     def supports(self, path: Path) -> bool:
         """Check if this scanner should run on the given path.
 
@@ -58,17 +70,7 @@ class ModelFileScanner(BaseScanner):
 
         # For directories, check if any model files exist
         if path.is_dir():
-            try:
-                # Quick check for any model extensions
-                for ext in self.MODEL_EXTENSIONS:
-                    if any(path.rglob(f"*{ext}")):
-                        return True
-                # Check for large .bin files
-                for bin_file in path.rglob("*.bin"):
-                    if bin_file.is_file() and self._is_model_file(bin_file):
-                        return True
-            except (OSError, PermissionError):
-                pass
+            return self._has_model_file(path)
 
         return False
 
@@ -90,29 +92,124 @@ class ModelFileScanner(BaseScanner):
                 if component:
                     components.append(component)
         else:
-            # Scan directory for model files
-            # First, scan known extensions
-            for ext in self.MODEL_EXTENSIONS:
-                for model_file in path.rglob(f"*{ext}"):
-                    if model_file.is_file():
-                        component = self._create_component_from_file(model_file)
-                        if component:
-                            components.append(component)
-
-            # Then scan .bin files >1MB
-            for bin_file in path.rglob("*.bin"):
-                if bin_file.is_file() and self._is_model_file(bin_file):
-                    component = self._create_component_from_file(bin_file)
-                    if component:
-                        components.append(component)
+            # Scan directory for model files, reusing the size read during the walk
+            for model_file, file_size in self._walk_model_files(path):
+                component = self._create_component_from_file(model_file, file_size)
+                if component:
+                    components.append(component)
 
         return components
 
-    def _is_model_file(self, file_path: Path) -> bool:
+    def _walk_model_files(self, root: Path) -> list[tuple[Path, int]]:
+        """Find every model file under ``root`` along with its size.
+
+        The walk is serial by default.  When ``AI_BOM_PARALLEL`` opts in and
+        the tree fans out past a few pending directories, the remaining
+        ``scandir`` calls run on a thread pool so their syscall latency
+        overlaps (worthwhile on network filesystems and cold caches).  The
+        result is sorted, so the component order does not depend on thread
+        scheduling.
+
+        Args:
+            root: Directory to walk
+
+        Returns:
+            Sorted list of (model file path, size in bytes)
+        """
+        files: list[tuple[str, int]] = []
+        pending = [str(root)]
+
+        parallel = _parallel_enabled()
+
+        while pending and not (parallel and len(pending) > _PARALLEL_MIN_PENDING_DIRS):
+            found, subdirs = self._list_model_dir(pending.pop())
+            files.extend(found)
+            pending.extend(subdirs)
+
+        if pending:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures: set[Future[tuple[list[tuple[str, int]], list[str]]]] = {
+                    executor.submit(self._list_model_dir, dirpath) for dirpath in pending
+                }
+                while futures:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        found, subdirs = future.result()
+                        files.extend(found)
+                        futures.update(
+                            executor.submit(self._list_model_dir, dirpath) for dirpath in subdirs
+                        )
+
+        files.sort()
+        return [(Path(file_path), file_size) for file_path, file_size in files]
+
+    def _has_model_file(self, root: Path) -> bool:
+        """Return True as soon as a serial walk of ``root`` finds a model file.
+
+        Args:
+            root: Directory to walk
+
+        Returns:
+            True if any model file exists under ``root``
+        """
+        pending = [str(root)]
+        while pending:
+            found, subdirs = self._list_model_dir(pending.pop())
+            if found:
+                return True
+            pending.extend(subdirs)
+        return False
+
+    def _list_model_dir(self, dirpath: str) -> tuple[list[tuple[str, int]], list[str]]:
+        """List one directory for :meth:`_walk_model_files`.
+
+        Only files whose extension already qualifies are stat'ed, through
+        the ``DirEntry`` so the size is read once and handed on to
+        :meth:`_create_component_from_file`.  Subdirectories named in
+        ``EXCLUDED_DIRS`` and symlinked directories are not descended into,
+        and unreadable entries are skipped.
+
+        Args:
+            dirpath: Directory to list
+
+        Returns:
+            Tuple of ((model file path, size) pairs, subdirectory paths)
+        """
+        files: list[tuple[str, int]] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in EXCLUDED_DIRS:
+                                subdirs.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext not in self._CANDIDATE_EXTENSIONS:
+                        continue
+                    try:
+                        file_size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    if self._is_model_file(Path(entry.path), file_size):
+                        files.append((entry.path, file_size))
+        except OSError:
+            pass
+        return files, subdirs
+
+    def _is_model_file(self, file_path: Path, file_size: int | None = None) -> bool:
         """Check if a file is likely a model file.
 
         Args:
             file_path: Path to file to check
+            file_size: Size in bytes if the caller already has it; otherwise
+                ``.bin`` files are stat'ed for the size heuristic
 
         Returns:
             True if file is likely a model file
@@ -125,25 +222,31 @@ class ModelFileScanner(BaseScanner):
 
         # For .bin files, check size heuristic
         if ext == ".bin":
-            try:
-                file_size = os.path.getsize(file_path)
-                return file_size >= self.MIN_BIN_SIZE
-            except OSError:
-                return False
+            if file_size is None:
+                try:
+                    file_size = os.path.getsize(file_path)
+                except OSError:
+                    return False
+            return file_size >= self.MIN_BIN_SIZE
 
         return False
 
-    def _create_component_from_file(self, file_path: Path) -> AIComponent | None:
+    def _create_component_from_file(
+        self, file_path: Path, file_size: int | None = None
+    ) -> AIComponent | None:
         """Create an AIComponent from a model file.
 
         Args:
             file_path: Path to model file
+            file_size: Size in bytes if the caller already has it; otherwise
+                the file is stat'ed
 
         Returns:
             AIComponent or None if file cannot be read
         """
         try:
-            file_size = os.path.getsize(file_path)
+            if file_size is None:
+                file_size = os.path.getsize(file_path)
             ext = file_path.suffix.lower()
 
             # Determine format and provider
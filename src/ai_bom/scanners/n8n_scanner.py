@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from ai_bom.integrations.n8n_api import N8nAPIClient
 
 from ai_bom.config import API_KEY_PATTERNS, N8N_AI_NODE_TYPES
+from ai_bom.detectors.endpoint_db import has_api_key
 from ai_bom.models import (
     AIComponent,
     ComponentType,
@@ -19,6 +20,10 @@ from ai_bom.models import (
     UsageType,
 )
 from ai_bom.scanners.base import BaseScanner
+from ai_bom.utils import fast_json
+
+# Top-level keys every n8n workflow export contains, as they appear in raw JSON
+_WORKFLOW_KEYS = (b'"nodes"', b'"connections"')
 
 
 class N8nScanner(BaseScanner):
@@ -65,23 +70,7 @@ class N8nScanner(BaseScanner):
                 if workflow_data is None:
                     continue
 
-                workflow_info = self._extract_workflow_info(workflow_data, workflow_file)
-                workflows[str(workflow_file)] = workflow_info
-
-                # Extract AI components from this workflow
-                workflow_components = self._extract_ai_components(
-                    workflow_data, workflow_file, workflow_info
-                )
-
-                # Second pass: inspect base n8n nodes for security risks
-                self._inspect_base_nodes(
-                    workflow_data, workflow_file, workflow_info, workflow_components
-                )
-
-                # Apply workflow-level risk patterns
-                self._apply_workflow_risks(workflow_data, workflow_components)
-
-                components.extend(workflow_components)
+                components.extend(self._scan_workflow_data(workflow_data, workflow_file, workflows))
 
             except Exception:
                 # Log error but continue scanning other files
@@ -115,24 +104,62 @@ class N8nScanner(BaseScanner):
             wf_id = workflow_data.get("id", "unknown")
             synthetic_path = Path(f"n8n://workflows/{wf_id}/{wf_name}.json")
 
-            workflow_info = self._extract_workflow_info(workflow_data, synthetic_path)
-            workflows[str(synthetic_path)] = workflow_info
+            components.extend(self._scan_workflow_data(workflow_data, synthetic_path, workflows))
 
-            workflow_components = self._extract_ai_components(
-                workflow_data, synthetic_path, workflow_info
-            )
+        self._detect_agent_chains(workflows, components)
 
-            self._inspect_base_nodes(
-                workflow_data, synthetic_path, workflow_info, workflow_components
-            )
+        return components
 
-            self._apply_workflow_risks(workflow_data, workflow_components)
-            components.extend(workflow_components)
+    def scan_bytes(self, data: bytes, file_path: Path) -> list[AIComponent]:
+        """Scan a single n8n workflow given as raw JSON, without touching the filesystem.
 
-        self._detect_agent_chains(workflows, components)
+        Args:
+            data: Workflow JSON document.
+            file_path: Path recorded as the components' location.
+
+        Returns:
+            List of detected AI components, or an empty list if ``data`` is
+            not a valid n8n workflow.
+        """
+        workflow_data = self._parse_workflow(data)
+        if workflow_data is None:
+            return []
 
+        workflows: dict[str, N8nWorkflowInfo] = {}
+        components = self._scan_workflow_data(workflow_data, file_path, workflows)
+        self._detect_agent_chains(workflows, components)
         return components
 
+    def _scan_workflow_data(
+        self,
+        workflow_data: dict[str, Any],
+        file_path: Path,
+        workflows: dict[str, N8nWorkflowInfo],
+    ) -> list[AIComponent]:
+        """Extract AI components and risks from one parsed workflow.
+
+        Args:
+            workflow_data: Parsed, validated workflow JSON
+            file_path: Path to workflow file (or a synthetic path for API workflows)
+            workflows: Workflow info by path, updated for cross-workflow analysis
+
+        Returns:
+            List of AI components found in this workflow
+        """
+        workflow_info = self._extract_workflow_info(workflow_data, file_path)
+        workflows[str(file_path)] = workflow_info
+
+        # Extract AI components from this workflow
+        workflow_components = self._extract_ai_components(workflow_data, file_path, workflow_info)
+
+        # Second pass: inspect base n8n nodes for security risks
+        self._inspect_base_nodes(workflow_data, file_path, workflow_info, workflow_components)
+
+        # Apply workflow-level risk patterns
+        self._apply_workflow_risks(workflow_data, workflow_components)
+
+        return workflow_components
+
     @staticmethod
     def _is_valid_workflow(data: dict[str, Any]) -> bool:
         """Check whether a dict looks like a valid n8n workflow."""
@@ -152,28 +179,38 @@ class N8nScanner(BaseScanner):
             Parsed workflow data if valid n8n workflow, None otherwise
         """
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Validate this is an n8n workflow
-            if not isinstance(data, dict):
-                return None
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+        return self._parse_workflow(raw)
 
-            # n8n workflows have both "nodes" (list) and "connections" (dict)
-            if "nodes" not in data or "connections" not in data:
-                return None
+    def _parse_workflow(self, raw: bytes) -> dict[str, Any] | None:
+        """Parse workflow JSON and validate it is an n8n workflow.
 
-            if not isinstance(data.get("nodes"), list):
-                return None
+        Args:
+            raw: Workflow JSON document
 
-            if not isinstance(data.get("connections"), dict):
-                return None
+        Returns:
+            Parsed workflow data if valid n8n workflow, None otherwise
+        """
+        # Skip decoding JSON that lacks either workflow key (package.json,
+        # tsconfig.json, ...).  The whole buffer is searched: exports often put
+        # "connections" after a nodes array far longer than any fixed head.
+        if not all(key in raw for key in _WORKFLOW_KEYS):
+            return None
 
-            return data
+        try:
+            data = fast_json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
 
-        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        # n8n workflows have both "nodes" (list) and "connections" (dict)
+        if not self._is_valid_workflow(data):
             return None
 
+        return data  # type: ignore[no-any-return]
+
     def _extract_workflow_info(
         self, workflow_data: dict[str, Any], file_path: Path
     ) -> N8nWorkflowInfo:
@@ -711,7 +748,7 @@ class N8nScanner(BaseScanner):
 
         # Check against known API key patterns
         params_str = json.dumps(parameters)
-        return any(pattern.search(params_str) for pattern, _ in API_KEY_PATTERNS)
+        return has_api_key(params_str)
 
     def _check_mcp_risks(self, parameters: dict[str, Any], component: AIComponent) -> None:
         """Check for MCP-specific security risks.
@@ -14,7 +14,7 @@ from pathlib import Path
 from typing import Any
 
 from ai_bom.config import MCP_CONFIG_FILES
-from ai_bom.detectors.endpoint_db import detect_api_key, match_endpoint
+from ai_bom.detectors.endpoint_db import detect_api_key, has_api_key, match_endpoint
 from ai_bom.models import (
     AIComponent,
     ComponentType,
@@ -467,8 +467,7 @@ class NetworkScanner(BaseScanner):
             return False
 
         # Check if it matches API key patterns
-        api_keys = detect_api_key(value)
-        return len(api_keys) > 0
+        return has_api_key(value)
 
     def _scan_mcp_config(self, file_path: Path) -> list[AIComponent]:
         """Parse an MCP config file and extract server definitions.
@@ -0,0 +1,59 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install ai-bom[speedups]``); without it
+the stdlib ``json`` module is used and the result is the same.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None  # type: ignore[assignment]
+
+
+def dumps(data: Any) -> str:
+    """Serialise plain JSON data like ``json.dumps(data, indent=2)``.
+
+    Non-ASCII characters are escaped as ``\\uXXXX``, as the stdlib does by
+    default.  orjson always writes raw UTF-8, so its output is only used when
+    it is pure ASCII (and therefore identical); otherwise the stdlib encodes.
+
+    Args:
+        data: dicts, lists, strings, numbers, booleans and None only.
+
+    Returns:
+        The JSON document as a string.
+    """
+    if _orjson is not None:
+        output = _orjson.dumps(data, option=_orjson.OPT_INDENT_2).decode("utf-8")
+        if output.isascii():
+            return output
+    return json.dumps(data, indent=2)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: The document as UTF-8 bytes or a string.
+
+    Returns:
+        The parsed value.
+
+    Documents orjson rejects but the stdlib accepts (``NaN``/``Infinity``
+    literals, lone surrogate escapes) are re-parsed with ``json``, so what
+    parses never depends on whether the speedup is installed.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
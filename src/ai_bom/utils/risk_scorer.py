@@ -1,5 +1,7 @@
 """Risk scoring utilities for AI components."""
 
+from bisect import bisect_right
+
 from ai_bom.config import DEPRECATED_MODELS, RISK_WEIGHTS
 from ai_bom.models import AIComponent, RiskAssessment, Severity
 
@@ -21,6 +23,19 @@ FLAG_DESCRIPTIONS = {
     "hardcoded_credentials": "Hardcoded credentials in workflow",
 }
 
+# flag -> (weight, factor text), built once at import
+_FLAG_TABLE: dict[str, tuple[int, str]] = {
+    flag: (
+        weight,
+        f"{FLAG_DESCRIPTIONS.get(flag, flag.replace('_', ' ').title())} (+{weight})",
+    )
+    for flag, weight in RISK_WEIGHTS.items()
+}
+
+# Lower score bounds of each severity band, ascending
+_SEVERITY_THRESHOLDS = (26, 51, 76)
+_SEVERITY_LEVELS = (Severity.low, Severity.medium, Severity.high, Severity.critical)
+
 
 def score_component(component: AIComponent) -> RiskAssessment:
     """
@@ -37,38 +52,33 @@ def score_component(component: AIComponent) -> RiskAssessment:
         RiskAssessment with score (0-100), severity level, and list of
         contributing risk factors
     """
+    # Fast path: most components carry no flags and no deprecated model.  Each
+    # gets its own assessment, since callers may mutate it in place.
+    if not component.flags and component.model_name not in DEPRECATED_MODELS:
+        return RiskAssessment()
+
     score = 0
     factors: list[str] = []
 
     # Process component flags
     for flag in component.flags:
-        if flag in RISK_WEIGHTS:
-            weight = RISK_WEIGHTS[flag]
+        hit = _FLAG_TABLE.get(flag)
+        if hit is not None:
+            weight, factor = hit
             score += weight
-
-            # Get human-readable description
-            description = FLAG_DESCRIPTIONS.get(flag, flag.replace("_", " ").title())
-            factors.append(f"{description} (+{weight})")
+            factors.append(factor)
 
     # Check for deprecated models
     if component.model_name and component.model_name in DEPRECATED_MODELS:
-        weight = RISK_WEIGHTS.get("deprecated_model", 0)
-        if weight > 0:
-            score += weight
-            description = FLAG_DESCRIPTIONS.get("deprecated_model", "Using deprecated AI model")
-            factors.append(f"{description} (+{weight})")
+        hit = _FLAG_TABLE.get("deprecated_model")
+        if hit is not None and hit[0] > 0:
+            score += hit[0]
+            factors.append(hit[1])
 
     # Cap score at 100
     score = min(score, 100)
 
     # Determine severity level
-    if score >= 76:
-        severity = Severity.critical
-    elif score >= 51:
-        severity = Severity.high
-    elif score >= 26:
-        severity = Severity.medium
-    else:
-        severity = Severity.low
+    severity = _SEVERITY_LEVELS[bisect_right(_SEVERITY_THRESHOLDS, score)]
 
     return RiskAssessment(score=score, severity=severity, factors=factors)
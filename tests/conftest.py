@@ -1,5 +1,6 @@
 """Shared test fixtures for AI-BOM test suite."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -12,14 +13,91 @@ from ai_bom.models import (
     SourceLocation,
     UsageType,
 )
+from ai_bom.scanners.code_scanner import CodeScanner
+from ai_bom.scanners.docker_scanner import DockerScanner
+from ai_bom.scanners.jupyter_scanner import JupyterScanner
+from ai_bom.scanners.mcp_config_scanner import MCPConfigScanner
+from ai_bom.scanners.model_file_scanner import ModelFileScanner
+from ai_bom.scanners.n8n_scanner import N8nScanner
+from ai_bom.scanners.network_scanner import NetworkScanner
 
+_TMPFS = "/dev/shm"
 
-@pytest.fixture
+# Holds the PYTEST_DEBUG_TEMPROOT override so pytest_unconfigure can restore it
+_temproot_patch = pytest.MonkeyPatch()
+
+
+def pytest_configure(config):
+    """Keep pytest's temporary directories on tmpfs when one is available.
+
+    The suite writes hundreds of tiny fixture files; on /dev/shm they never
+    reach the disk.  An explicit ``--basetemp`` or ``PYTEST_DEBUG_TEMPROOT``
+    wins, and ``AI_BOM_TEST_TMPFS=0`` keeps the platform default.  The
+    environment is restored in :func:`pytest_unconfigure`.
+    """
+    if (
+        config.option.basetemp is None
+        and "PYTEST_DEBUG_TEMPROOT" not in os.environ
+        and os.environ.get("AI_BOM_TEST_TMPFS", "1") != "0"
+        and os.path.isdir(_TMPFS)
+        and os.access(_TMPFS, os.W_OK)
+    ):
+        _temproot_patch.setenv("PYTEST_DEBUG_TEMPROOT", _TMPFS)
+
+
+def pytest_unconfigure(config):
+    """Undo the ``PYTEST_DEBUG_TEMPROOT`` override from :func:`pytest_configure`."""
+    _temproot_patch.undo()
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """Path to test fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(scope="session")
+def code_scanner():
+    """A CodeScanner shared across the session; scanners keep no per-scan state."""
+    return CodeScanner()
+
+
+@pytest.fixture(scope="session")
+def docker_scanner():
+    """A DockerScanner shared across the session; scanners keep no per-scan state."""
+    return DockerScanner()
+
+
+@pytest.fixture(scope="session")
+def jupyter_scanner():
+    """A JupyterScanner shared across the session; scanners keep no per-scan state."""
+    return JupyterScanner()
+
+
+@pytest.fixture(scope="session")
+def mcp_config_scanner():
+    """An MCPConfigScanner shared across the session; scanners keep no per-scan state."""
+    return MCPConfigScanner()
+
+
+@pytest.fixture(scope="session")
+def model_file_scanner():
+    """A ModelFileScanner shared across the session; scanners keep no per-scan state."""
+    return ModelFileScanner()
+
+
+@pytest.fixture(scope="session")
+def n8n_scanner():
+    """An N8nScanner shared across the session; scanners keep no per-scan state."""
+    return N8nScanner()
+
+
+@pytest.fixture(scope="session")
+def network_scanner():
+    """A NetworkScanner shared across the session; scanners keep no per-scan state."""
+    return NetworkScanner()
+
+
 @pytest.fixture
 def sample_component():
     """A basic AI component for testing."""
@@ -0,0 +1,23 @@
+"""Shared helpers for building test fixture files."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def write_sparse_file(path: Path, size: int, head: bytes = b"") -> None:
+    """Create a *size*-byte file with only *head* actually written.
+
+    Scanners decide on ``st_size`` and at most the first few KB, so the rest
+    can be a sparse hole; on filesystems without sparse support ``ftruncate``
+    zero-fills instead.  Pass a non-null *head* when the file must get past
+    the binary-content guard.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if head:
+            os.write(fd, head)
+        os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
@@ -5,7 +5,7 @@ import re
 import pytest
 
 from ai_bom.config import API_KEY_PATTERNS, KNOWN_MODEL_PATTERNS
-from ai_bom.detectors.endpoint_db import detect_api_key, match_endpoint
+from ai_bom.detectors.endpoint_db import detect_api_key, has_api_key, match_endpoint
 from ai_bom.detectors.llm_patterns import LLM_PATTERNS, get_all_dep_names
 from ai_bom.detectors.model_registry import lookup_model
 
@@ -101,6 +101,25 @@ class TestAPIKeyPatterns:
                 return
         pytest.fail(f"No pattern matched {key} for {provider}")
 
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "MODEL=gpt-4o",
+            "sk-short",
+            'key = "sk-ant-REDACTED"',
+            "AIzaSyA1234567890abcdefghijklmnop",
+            "TOGETHER_API_KEY=" + "ab12" * 16,
+            "Together_Key: " + "ab12" * 16,
+            "MISTRAL_API_KEY=" + "A1b2" * 8,
+            "commit " + "ab12" * 16,
+        ],
+    )
+    def test_combined_pattern_agrees_with_each_pattern(self, text):
+        """The one-pass prefilter matches exactly when some individual pattern does."""
+        expected = any(pattern.search(text) for pattern, _ in API_KEY_PATTERNS)
+        assert has_api_key(text) is expected
+        assert bool(detect_api_key(text)) is expected
+
 
 class TestModelPatterns:
     @pytest.mark.parametrize(
@@ -46,6 +46,21 @@ class TestAIComponent:
         assert "type" in data
         assert "location" in data
 
+    def test_trusted_matches_validated(self):
+        kwargs = {
+            "name": "test",
+            "type": ComponentType.llm_provider,
+            "provider": "OpenAI",
+            "location": SourceLocation(file_path="test.py", line_number=3),
+            "flags": ["shadow_ai"],
+        }
+        trusted = AIComponent.trusted(**kwargs)
+        validated = AIComponent(**kwargs)
+        assert isinstance(trusted, AIComponent)
+        assert trusted.id and trusted.id != validated.id  # default factory still runs
+        assert trusted.risk.score == 0
+        assert trusted.model_dump(exclude={"id"}) == validated.model_dump(exclude={"id"})
+
 
 class TestScanResult:
     def test_build_summary(self, sample_scan_result):
@@ -70,3 +85,20 @@ class TestScanResult:
         # The critical_component has flags, so highest risk should be > 0
         # (risk scoring is applied separately, but the fixture has default 0)
         assert multi_component_result.summary.highest_risk_score >= 0
+
+    def test_build_summary_is_idempotent(self, multi_component_result):
+        multi_component_result.build_summary()
+        first = multi_component_result.summary.model_dump()
+        multi_component_result.build_summary()
+        assert multi_component_result.summary.model_dump() == first
+
+    def test_build_summary_after_filtering(self, multi_component_result):
+        multi_component_result.summary.scan_duration_seconds = 1.5
+        multi_component_result.build_summary()
+        multi_component_result.components = multi_component_result.components[:1]
+        multi_component_result.build_summary()
+        summary = multi_component_result.summary
+        assert summary.total_components == 1
+        assert sum(summary.by_type.values()) == 1
+        assert sum(summary.by_severity.values()) == 1
+        assert summary.scan_duration_seconds == 1.5
@@ -125,3 +125,47 @@ def test_parallel_empty_scanner_list(tmp_path: Path) -> None:
     """Empty scanner list should return empty results."""
     result = run_scanners_parallel([], tmp_path, workers=2)
     assert result == []
+
+
+def test_single_scanner_runs_without_thread_pool(tmp_path: Path, monkeypatch) -> None:
+    """A single scanner, or workers=1, should run inline without a thread pool."""
+    import ai_bom.scanners as scanners_mod
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("ThreadPoolExecutor should not be created")
+
+    monkeypatch.setattr(scanners_mod, "ThreadPoolExecutor", _fail)
+
+    supported = _StubScanner(components=[_make_component("only")])
+    result = run_scanners_parallel([supported], tmp_path, workers=4)
+    assert [c.name for c in result] == ["only"]
+
+    # workers=1 is sequential even with several scanners
+    unsupported = _StubScanner(supported=False, components=[_make_component("skip")])
+    bad = _StubScanner(error=RuntimeError("boom"))
+    result = run_scanners_parallel([unsupported, bad, supported], tmp_path, workers=1)
+    assert [c.name for c in result] == ["only"]
+
+
+def test_supports_probed_on_worker_threads(tmp_path: Path) -> None:
+    """With several scanners, supports() should run on the pool, not the caller."""
+    import threading
+
+    caller = threading.get_ident()
+    probe_threads: list[int] = []
+
+    class _RecordingScanner(_StubScanner):
+        def supports(self, path: Path) -> bool:
+            probe_threads.append(threading.get_ident())
+            return self.supported
+
+    scanners = [
+        _RecordingScanner(components=[_make_component("a")]),
+        _RecordingScanner(supported=False, components=[_make_component("skip")]),
+        _RecordingScanner(components=[_make_component("b")]),
+    ]
+    result = run_scanners_parallel(scanners, tmp_path, workers=2)
+
+    assert sorted(c.name for c in result) == ["a", "b"]
+    assert len(probe_threads) == 3
+    assert caller not in probe_threads
@@ -146,3 +146,12 @@ class TestCSVReporter:
         reader = csv.reader(io.StringIO(content))
         rows = list(reader)
         assert len(rows) > 1  # Header + data
+
+    def test_write_matches_render(self, multi_component_result, tmp_path):
+        """Test that streaming to a file produces the same bytes as render()."""
+        reporter = CSVReporter()
+        path = tmp_path / "report.csv"
+        reporter.write(multi_component_result, path)
+
+        expected = reporter.render(multi_component_result).encode("utf-8")
+        assert path.read_bytes() == expected
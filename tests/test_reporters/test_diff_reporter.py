@@ -20,6 +20,7 @@ from ai_bom.reporters.diff_reporter import (
     format_diff_as_markdown,
     format_diff_as_table,
     load_scan_from_file,
+    load_scans_parallel,
 )
 
 
@@ -149,6 +150,39 @@ def test_format_diff_as_json(baseline_scan, current_scan):
     assert len(data["modified_components"]) == 1
 
 
+def test_format_diff_as_json_without_orjson(baseline_scan, current_scan, monkeypatch):
+    """Test that the stdlib fallback produces the same JSON as orjson."""
+    from ai_bom.utils import fast_json
+
+    diff = compare_scans(baseline_scan, current_scan)
+    output = format_diff_as_json(diff)
+
+    monkeypatch.setattr(fast_json, "_orjson", None)
+    assert format_diff_as_json(diff) == output
+
+
+def test_format_diff_as_json_escapes_non_ascii(baseline_scan):
+    """Test that non-ASCII names are escaped exactly as json.dumps(indent=2) does."""
+    current = ScanResult(
+        target_path="/test/project",
+        components=[
+            *baseline_scan.components,
+            AIComponent(
+                name="modèle",
+                type=ComponentType.model,
+                location=SourceLocation(file_path="modèles.py"),
+            ),
+        ],
+    )
+    diff = compare_scans(baseline_scan, current)
+
+    output = format_diff_as_json(diff)
+
+    assert output.isascii()
+    assert output == json.dumps(json.loads(output), indent=2)
+    assert json.loads(output)["added_components"][0]["name"] == "modèle"
+
+
 def test_load_scan_from_file(tmp_path):
     """Test loading scan from JSON file."""
     scan = ScanResult(
@@ -185,6 +219,81 @@ def test_load_scan_cyclonedx_format_error(tmp_path):
         load_scan_from_file(scan_file)
 
 
+def test_load_scan_invalid_json_raises_value_error(tmp_path):
+    """Test that malformed JSON surfaces as a ValueError."""
+    scan_file = tmp_path / "scan.json"
+    scan_file.write_text("{not json")
+
+    with pytest.raises(ValueError):
+        load_scan_from_file(scan_file)
+
+
+def test_load_scans_parallel(tmp_path):
+    """Test loading baseline and current scans concurrently."""
+    baseline = ScanResult(
+        target_path="/baseline",
+        components=[
+            AIComponent(
+                name=f"base-{i}",
+                type=ComponentType.llm_provider,
+                location=SourceLocation(file_path=f"b{i}.py"),
+            )
+            for i in range(200)
+        ],
+    )
+    current = ScanResult(
+        target_path="/current",
+        components=[
+            AIComponent(
+                name=f"cur-{i}",
+                type=ComponentType.llm_provider,
+                location=SourceLocation(file_path=f"c{i}.py"),
+            )
+            for i in range(300)
+        ],
+    )
+    baseline_file = tmp_path / "baseline.json"
+    current_file = tmp_path / "current.json"
+    baseline_file.write_text(baseline.model_dump_json())
+    current_file.write_text(current.model_dump_json())
+
+    loaded_baseline, loaded_current = load_scans_parallel(baseline_file, current_file)
+    assert loaded_baseline.target_path == "/baseline"
+    assert len(loaded_baseline.components) == 200
+    assert loaded_current.target_path == "/current"
+    assert len(loaded_current.components) == 300
+
+
+def test_load_scans_parallel_missing_file(tmp_path):
+    """Test that a missing file still raises FileNotFoundError."""
+    scan_file = tmp_path / "scan.json"
+    scan_file.write_text(ScanResult(target_path="/test").model_dump_json())
+
+    with pytest.raises(FileNotFoundError):
+        load_scans_parallel(scan_file, tmp_path / "missing.json")
+
+
+def test_compare_scans_sorted_by_name():
+    """Test that diff lists come back in a stable, name-sorted order."""
+    names = ["zeta", "alpha", "mu", "beta"]
+    current = ScanResult(
+        target_path="/test",
+        components=[
+            AIComponent(
+                name=name,
+                type=ComponentType.llm_provider,
+                location=SourceLocation(file_path="test.py"),
+            )
+            for name in names
+        ],
+    )
+    diff = compare_scans(ScanResult(target_path="/test"), current)
+    assert [c["name"] for c in diff.added_components] == sorted(names)
+
+    reverse = compare_scans(current, ScanResult(target_path="/test"))
+    assert [c["name"] for c in reverse.removed_components] == sorted(names)
+
+
 def test_compare_scans_no_changes():
     """Test comparing identical scans."""
     scan = ScanResult(
@@ -2,7 +2,9 @@
 
 import json
 
-from ai_bom.reporters import get_reporter
+import pytest
+
+from ai_bom.reporters import REPORT_EXTENSIONS, REPORTERS, get_reporter, render_all
 from ai_bom.reporters.cli_reporter import CLIReporter
 from ai_bom.reporters.cyclonedx import CycloneDXReporter
 from ai_bom.reporters.html_reporter import HTMLReporter
@@ -365,3 +367,22 @@ class TestGetReporter:
 
     def test_unknown_format_defaults_to_cli(self):
         assert isinstance(get_reporter("unknown"), CLIReporter)
+
+
+class TestRenderAll:
+    def test_writes_each_format(self, multi_component_result, tmp_path):
+        paths = render_all(multi_component_result, ["csv", "junit", "json"], tmp_path)
+
+        assert set(paths) == {"csv", "junit", "json"}
+        assert all(path.parent == tmp_path for path in paths.values())
+        csv_bytes = paths["csv"].read_bytes()
+        assert csv_bytes == get_reporter("csv").render(multi_component_result).encode()
+        assert paths["junit"].read_text().startswith("<?xml")
+        assert json.loads(paths["json"].read_text())["bomFormat"] == "CycloneDX"
+
+    def test_unknown_format_raises(self, multi_component_result, tmp_path):
+        with pytest.raises(ValueError, match="bogus"):
+            render_all(multi_component_result, ["csv", "bogus"], tmp_path)
+
+    def test_every_reporter_has_an_extension(self):
+        assert REPORT_EXTENSIONS.keys() == REPORTERS.keys()
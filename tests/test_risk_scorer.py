@@ -22,6 +22,22 @@ class TestScoreComponent:
         assert risk.severity == Severity.low
         assert risk.factors == []
 
+    def test_no_flags_assessments_are_independent(self):
+        a = score_component(_make_component(name="a"))
+        b = score_component(_make_component(name="b"))
+        a.factors.append("manual review")
+        a.score = 10
+        assert b.factors == []
+        assert b.score == 0
+
+    def test_deprecated_model_without_flags_is_scored(self):
+        from ai_bom.config import DEPRECATED_MODELS
+
+        comp = _make_component(model_name=next(iter(DEPRECATED_MODELS)))
+        risk = score_component(comp)
+        assert risk.score > 0
+        assert len(risk.factors) == 1
+
     def test_hardcoded_api_key(self):
         comp = _make_component(flags=["hardcoded_api_key"])
         risk = score_component(comp)
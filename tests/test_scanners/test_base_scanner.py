@@ -1,10 +1,14 @@
 """Tests for base scanner functionality."""
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+import ai_bom
 from ai_bom.models import AIComponent
 from ai_bom.scanners.base import (
     BaseScanner,
@@ -61,6 +65,19 @@ class TestBaseScannerSafeReadText:
         assert content is not None
         assert "Hello" in content
 
+    def test_safe_read_text_normalizes_newlines(self, scanner, tmp_path):
+        test_file = tmp_path / "crlf.txt"
+        test_file.write_bytes(b"line1\r\nline2\rline3\n")
+        content = scanner.safe_read_text(test_file)
+        assert content == "line1\nline2\nline3\n"
+
+    def test_safe_read_text_null_after_sniff_window(self, scanner, tmp_path):
+        test_file = tmp_path / "late_null.txt"
+        test_file.write_bytes(b"a" * 8192 + b"\x00tail")
+        content = scanner.safe_read_text(test_file)
+        assert content is not None
+        assert content.endswith("\x00tail")
+
     def test_safe_read_text_permission_error(self, scanner, tmp_path):
         test_file = tmp_path / "test.txt"
         test_file.write_text("test")
@@ -108,6 +125,22 @@ class TestBaseScannerIterFiles:
         files = list(scanner.iter_files(test_file, extensions={".py"}))
         assert len(files) == 0
 
+    def test_iter_files_single_file_not_matching_is_not_opened(self, scanner, tmp_path):
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("pass")
+
+        with patch.object(scanner, "_accept_file") as accept:
+            files = list(scanner.iter_files(test_file, extensions={".py"}))
+        assert files == []
+        accept.assert_not_called()
+
+    def test_iter_files_single_file_too_large(self, scanner, tmp_path):
+        test_file = tmp_path / "test.py"
+        test_file.write_text("print('hello')")
+        scanner.max_file_size = 3
+
+        assert list(scanner.iter_files(test_file, extensions={".py"})) == []
+
     def test_iter_files_excludes_pyc(self, scanner, tmp_path):
         (tmp_path / "test.py").write_text("pass")
         (tmp_path / "test.pyc").write_text("compiled")
@@ -117,11 +150,14 @@ class TestBaseScannerIterFiles:
 
     def test_iter_files_excludes_large_files(self, scanner, tmp_path):
         large_file = tmp_path / "large.txt"
-        # Create a file larger than 10MB
-        with patch("os.path.getsize", return_value=10_485_761):
-            large_file.write_text("test")
-            files = list(scanner.iter_files(tmp_path))
-            assert large_file not in files
+        large_file.write_text("test")
+        small_file = tmp_path / "small.txt"
+        small_file.write_text("ok")
+        # Shrink the limit rather than writing a real >10MB file
+        scanner.max_file_size = 3
+        files = list(scanner.iter_files(tmp_path))
+        assert large_file not in files
+        assert small_file in files
 
     def test_iter_files_excludes_binary(self, scanner, tmp_path):
         binary_file = tmp_path / "binary.bin"
@@ -130,6 +166,65 @@ class TestBaseScannerIterFiles:
         files = list(scanner.iter_files(tmp_path))
         assert binary_file not in files
 
+    def test_iter_files_empty_file_not_opened(self, scanner, tmp_path):
+        empty = tmp_path / "__init__.py"
+        empty.write_bytes(b"")
+
+        with patch("builtins.open", side_effect=AssertionError("opened")):
+            files = list(scanner.iter_files(tmp_path, extensions={".py"}))
+        assert files == [empty]
+
+    def test_iter_files_sizes_come_from_dir_entries(self, scanner, tmp_path):
+        """os.stat calls must not grow with the number of files walked."""
+        small, wide = tmp_path / "small", tmp_path / "wide"
+        small.mkdir()
+        wide.mkdir()
+        (small / "a.py").write_text("a")
+        for i in range(20):
+            (wide / f"m{i}.py").write_text("m")
+
+        stat_calls = []
+        for root in (small, wide):
+            list(scanner.iter_files(root, extensions={".py"}))  # warm per-root caches
+            with patch("os.stat", wraps=os.stat) as stat:
+                files = list(scanner.iter_files(root, extensions={".py"}))
+            assert files
+            stat_calls.append(stat.call_count)
+        assert stat_calls[0] == stat_calls[1]
+
+    def test_walk_files_relative_paths_with_trailing_separator(self, scanner, tmp_path):
+        """A root ending in a separator (e.g. "/") keeps ignore paths intact."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "app.py").write_text("pass")
+
+        class _RecordingSpec:
+            def __init__(self):
+                self.paths = []
+
+            def match_file(self, path):
+                self.paths.append(path)
+                return False
+
+        spec = _RecordingSpec()
+        root = str(tmp_path) + os.sep
+        list(scanner._walk_files(root, str(tmp_path), frozenset(), None, None, spec))
+        assert spec.paths == [os.path.join("sub", "app.py")]
+
+    def test_iter_files_parallel_matches_serial(self, scanner, tmp_path, monkeypatch):
+        (tmp_path / "a.py").write_text("a")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.py").write_text("b")
+        (tmp_path / "blob.py").write_bytes(b"\x00binary")
+        (tmp_path / "big.py").write_text("x" * 10)
+        scanner.max_file_size = 5
+
+        serial = list(scanner.iter_files(tmp_path, extensions={".py"}))
+        monkeypatch.setenv("AI_BOM_PARALLEL", "1")
+        parallel = list(scanner.iter_files(tmp_path, extensions={".py"}))
+
+        assert parallel == serial
+        assert {f.name for f in parallel} == {"a.py", "b.py"}
+
     def test_iter_files_excludes_test_dirs(self, scanner, tmp_path):
         src_dir = tmp_path / "src"
         src_dir.mkdir()
@@ -161,7 +256,8 @@ class TestBaseScannerIterFiles:
         assert all("node_modules" not in str(f) for f in files)
 
     def test_iter_files_handles_permission_error(self, scanner, tmp_path):
-        with patch("os.walk", side_effect=PermissionError("Access denied")):
+        (tmp_path / "app.py").write_text("pass")
+        with patch("os.scandir", side_effect=PermissionError("Access denied")):
             files = list(scanner.iter_files(tmp_path))
             assert files == []
 
@@ -246,6 +342,15 @@ class TestGetAllScanners:
             assert scanner.name != ""
             assert scanner.description != ""
 
+    def test_registry_import_defers_parser_modules(self):
+        # Run in a fresh interpreter: this one has already imported yaml
+        code = "import sys, ai_bom.scanners; print('yaml' in sys.modules, 'tomllib' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": str(Path(ai_bom.__file__).parents[1])}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+        )
+        assert result.stdout.split() == ["False", "False"]
+
 
 class TestScannerRegistration:
     def test_scanner_auto_registration(self):
@@ -0,0 +1,84 @@
+"""Throughput benchmarks for the Jupyter and MCP config scanners.
+
+Skipped unless pytest-benchmark is installed (part of ``[dev]``) and pytest
+runs with ``--benchmark-only``, so the regular (coverage-traced) test run does
+not calibrate them.  Run them and compare against the last saved run with
+``make bench``.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+_CELL_SOURCES = (
+    ["import openai\n", "client = openai.OpenAI()\n"],
+    "import anthropic\nclient = anthropic.Anthropic()",
+    'model = AutoModel.from_pretrained("bert-base-uncased")',
+    "from langchain.chat_models import ChatOpenAI\nllm = ChatOpenAI()",
+    "# Notes\nresults = [x * 2 for x in range(10)]",
+)
+_MCP_PACKAGES = (
+    "@modelcontextprotocol/server-filesystem",
+    "@modelcontextprotocol/server-github",
+    "@modelcontextprotocol/server-brave-search",
+    "@modelcontextprotocol/server-fetch",
+)
+_NOTEBOOK_CELLS = 1000
+_MCP_SERVERS = 500
+
+# Serialised once at import so the benchmarks time scanning, not fixture building.
+_BIG_NOTEBOOK = json.dumps(
+    {
+        "cells": [
+            {"cell_type": "code", "source": _CELL_SOURCES[i % len(_CELL_SOURCES)]}
+            for i in range(_NOTEBOOK_CELLS)
+        ]
+    }
+).encode()
+_BIG_MCP_CONFIG = json.dumps(
+    {
+        "mcpServers": {
+            f"server-{i}": {"command": "npx", "args": ["-y", _MCP_PACKAGES[i % len(_MCP_PACKAGES)]]}
+            for i in range(_MCP_SERVERS)
+        }
+    }
+).encode()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _benchmark_only(request):
+    """Skip the module unless benchmarks were asked for explicitly."""
+    if not request.config.getoption("benchmark_only"):
+        pytest.skip("benchmarks run only with --benchmark-only (make bench)")
+
+
+@pytest.fixture(scope="module")
+def big_notebook_dir(tmp_path_factory):
+    """Directory holding one notebook with ``_NOTEBOOK_CELLS`` code cells."""
+    workspace = tmp_path_factory.mktemp("bench-jupyter")
+    (workspace / "big.ipynb").write_bytes(_BIG_NOTEBOOK)
+    return workspace
+
+
+@pytest.fixture(scope="module")
+def big_mcp_dir(tmp_path_factory):
+    """Directory holding one MCP config declaring ``_MCP_SERVERS`` servers."""
+    workspace = tmp_path_factory.mktemp("bench-mcp")
+    (workspace / "mcp.json").write_bytes(_BIG_MCP_CONFIG)
+    return workspace
+
+
+def test_jupyter_scan_large_notebook(benchmark, jupyter_scanner, big_notebook_dir):
+    """Benchmark scanning a 1000-cell notebook."""
+    components = benchmark(jupyter_scanner.scan, big_notebook_dir)
+
+    assert {"OpenAI", "Anthropic", "HuggingFace"}.issubset({c.provider for c in components})
+
+
+def test_mcp_scan_large_config(benchmark, mcp_config_scanner, big_mcp_dir):
+    """Benchmark scanning an MCP config with 500 servers."""
+    components = benchmark(mcp_config_scanner.scan, big_mcp_dir)
+
+    assert len(components) == _MCP_SERVERS
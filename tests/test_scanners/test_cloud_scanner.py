@@ -1,85 +1,90 @@
 """Tests for cloud scanner."""
 
 import pytest
+import yaml
 
 from ai_bom.models import ComponentType, UsageType
 from ai_bom.scanners.cloud_scanner import CloudScanner
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scanner():
     return CloudScanner()
 
 
+@pytest.fixture(scope="module")
+def terraform_components(scanner, fixtures_dir):
+    """Components from sample_terraform.tf, scanned once and shared read-only."""
+    return scanner.scan(fixtures_dir / "sample_terraform.tf")
+
+
+@pytest.fixture(scope="module")
+def cloudformation_components(scanner, fixtures_dir):
+    """Components from sample_cloudformation.yaml, scanned once and shared read-only."""
+    return scanner.scan(fixtures_dir / "sample_cloudformation.yaml")
+
+
 class TestCloudScanner:
     def test_name(self, scanner):
         assert scanner.name == "cloud"
 
-    def test_detects_bedrock_agent(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_terraform.tf")
-        assert len(components) > 0
-        providers = [c.provider for c in components]
+    def test_detects_bedrock_agent(self, terraform_components):
+        assert len(terraform_components) > 0
+        providers = [c.provider for c in terraform_components]
         assert any("Bedrock" in p for p in providers) or any("AWS" in p for p in providers)
 
-    def test_detects_sagemaker(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_terraform.tf")
-        providers = [c.provider for c in components]
+    def test_detects_sagemaker(self, terraform_components):
+        providers = [c.provider for c in terraform_components]
         assert (
             any("SageMaker" in p for p in providers)
             or any("AWS" in p for p in providers)
-            or len(components) >= 2
+            or len(terraform_components) >= 2
         )
 
-    def test_source_is_cloud(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_terraform.tf")
-        for c in components:
+    def test_source_is_cloud(self, terraform_components):
+        for c in terraform_components:
             assert c.source == "cloud"
 
     def test_empty_directory(self, scanner, tmp_path):
         components = scanner.scan(tmp_path)
         assert components == []
 
-    def test_detects_azure_openai_deployment(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_terraform.tf")
-        azure_components = [c for c in components if "Azure" in c.provider]
-        assert len(azure_components) >= 1
-        assert any(c.provider == "Azure OpenAI" for c in azure_components)
-        azure_openai = next(c for c in azure_components if c.provider == "Azure OpenAI")
+    def test_detects_azure_openai_deployment(self, terraform_components):
+        azure_openai = next((c for c in terraform_components if c.provider == "Azure OpenAI"), None)
+        assert azure_openai is not None
         assert azure_openai.type == ComponentType.endpoint
 
-    def test_detects_gcp_reasoning_engine(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_terraform.tf")
-        gcp_agents = [
-            c
-            for c in components
-            if c.provider == "Google Vertex AI" and c.type == ComponentType.agent_framework
-        ]
-        assert len(gcp_agents) >= 1
-        assert "reasoning_engine" in gcp_agents[0].name
-
-    def test_detects_bedrock_guardrail(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_terraform.tf")
-        guardrails = [c for c in components if "guardrail" in c.name.lower()]
-        assert len(guardrails) >= 1
-        assert guardrails[0].provider == "AWS Bedrock"
-        assert guardrails[0].type == ComponentType.tool
-
-    def test_detects_cloudformation_flow(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_cloudformation.yaml")
-        flows = [c for c in components if "Flow" in c.name]
-        assert len(flows) >= 1
-        assert flows[0].provider == "AWS Bedrock"
-        assert flows[0].type == ComponentType.workflow
-
-    def test_detects_cloudformation_kendra(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_cloudformation.yaml")
-        kendra = [c for c in components if "Kendra" in c.provider]
+    def test_detects_gcp_reasoning_engine(self, terraform_components):
+        gcp_agent = next(
+            (
+                c
+                for c in terraform_components
+                if c.provider == "Google Vertex AI" and c.type == ComponentType.agent_framework
+            ),
+            None,
+        )
+        assert gcp_agent is not None
+        assert "reasoning_engine" in gcp_agent.name
+
+    def test_detects_bedrock_guardrail(self, terraform_components):
+        guardrail = next((c for c in terraform_components if "guardrail" in c.name.lower()), None)
+        assert guardrail is not None
+        assert guardrail.provider == "AWS Bedrock"
+        assert guardrail.type == ComponentType.tool
+
+    def test_detects_cloudformation_flow(self, cloudformation_components):
+        flow = next((c for c in cloudformation_components if "Flow" in c.name), None)
+        assert flow is not None
+        assert flow.provider == "AWS Bedrock"
+        assert flow.type == ComponentType.workflow
+
+    def test_detects_cloudformation_kendra(self, cloudformation_components):
+        kendra = [c for c in cloudformation_components if "Kendra" in c.provider]
         assert len(kendra) >= 1
         assert kendra[0].type == ComponentType.tool
 
-    def test_workflow_usage_type(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_terraform.tf")
-        workflow_components = [c for c in components if c.type == ComponentType.workflow]
+    def test_workflow_usage_type(self, terraform_components):
+        workflow_components = [c for c in terraform_components if c.type == ComponentType.workflow]
         assert len(workflow_components) >= 1
         for c in workflow_components:
             assert c.usage_type == UsageType.orchestration
@@ -92,24 +97,44 @@ class TestCloudScanner:
         """Verify we have the expected number of CloudFormation resource types."""
         assert len(scanner.CLOUDFORMATION_AI_RESOURCES) >= 25
 
-    def test_detects_sagemaker_pipeline(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_terraform.tf")
-        pipelines = [
-            c for c in components if "pipeline" in c.name.lower() and "SageMaker" in c.provider
-        ]
-        assert len(pipelines) >= 1
-        assert pipelines[0].type == ComponentType.workflow
+    def test_detects_sagemaker_pipeline(self, terraform_components):
+        pipeline = next(
+            (
+                c
+                for c in terraform_components
+                if "pipeline" in c.name.lower() and "SageMaker" in c.provider
+            ),
+            None,
+        )
+        assert pipeline is not None
+        assert pipeline.type == ComponentType.workflow
 
-    def test_cloudformation_guardrail(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_cloudformation.yaml")
-        guardrails = [c for c in components if "Guardrail" in c.name]
+    def test_cloudformation_guardrail(self, cloudformation_components):
+        guardrails = [c for c in cloudformation_components if "Guardrail" in c.name]
         assert len(guardrails) >= 1
         assert guardrails[0].provider == "AWS Bedrock"
         assert guardrails[0].type == ComponentType.tool
 
-    def test_cloudformation_sagemaker_pipeline(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_cloudformation.yaml")
-        pipelines = [c for c in components if "Pipeline" in c.name]
+    def test_cloudformation_sagemaker_pipeline(self, cloudformation_components):
+        pipelines = [c for c in cloudformation_components if "Pipeline" in c.name]
         assert len(pipelines) >= 1
         assert pipelines[0].provider == "AWS SageMaker"
         assert pipelines[0].type == ComponentType.workflow
+
+    def test_terraform_line_numbers_skip_non_ai_resources(self, scanner, tmp_path):
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text(
+            'resource "aws_s3_bucket" "data" {}\n'
+            "\n"
+            'resource "aws_sagemaker_endpoint" "serve" {\n'
+            '  name = "serve"\n'
+            "}\n"
+        )
+        components = scanner.scan(tf_file)
+        assert [c.name for c in components] == ["aws_sagemaker_endpoint.serve"]
+        assert components[0].location.line_number == 3
+
+    def test_cloudformation_tags_do_not_leak_into_safe_loader(self, scanner):
+        data = scanner._parse_cloudformation_yaml("Value: !Ref MyBucket\nList: !GetAZs ''\n")
+        assert data == {"Value": "MyBucket", "List": ""}
+        assert "!Ref" not in yaml.SafeLoader.yaml_constructors
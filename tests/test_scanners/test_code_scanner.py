@@ -3,12 +3,11 @@
 import pytest
 
 from ai_bom.models import ComponentType, UsageType
-from ai_bom.scanners.code_scanner import CodeScanner
 
 
 @pytest.fixture
-def scanner():
-    return CodeScanner()
+def scanner(code_scanner):
+    return code_scanner
 
 
 class TestCodeScanner:
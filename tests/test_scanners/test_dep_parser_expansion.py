@@ -1,12 +1,13 @@
 """Tests for expanded dependency parser support (Cargo.toml, go.mod, Gemfile, etc.)."""
 
+from ai_bom.scanners import code_scanner as code_scanner_module
 from ai_bom.scanners.code_scanner import CodeScanner
 
 
 class TestCargoTomlParsing:
     """Test Cargo.toml (Rust) dependency parsing."""
 
-    def test_parse_basic_cargo_deps(self, tmp_path):
+    def test_parse_basic_cargo_deps(self, code_scanner, tmp_path):
         """Test parsing basic Cargo.toml dependencies."""
         cargo_content = """
 [package]
@@ -21,15 +22,14 @@ tokio = "1.35.0"
         cargo_file = tmp_path / "Cargo.toml"
         cargo_file.write_text(cargo_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         # Should find async-openai and anthropic-sdk
         component_names = [c.name for c in components]
         assert "async-openai" in component_names or "async_openai" in component_names
         assert "anthropic-sdk" in component_names or "anthropic_sdk" in component_names
 
-    def test_parse_cargo_with_version_spec(self, tmp_path):
+    def test_parse_cargo_with_version_spec(self, code_scanner, tmp_path):
         """Test parsing Cargo.toml with version specs."""
         cargo_content = """
 [dependencies]
@@ -38,13 +38,12 @@ async-openai = { version = "0.14", features = ["streaming"] }
         cargo_file = tmp_path / "Cargo.toml"
         cargo_file.write_text(cargo_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert any("openai" in name.lower() for name in component_names)
 
-    def test_parse_cargo_empty_deps(self, tmp_path):
+    def test_parse_cargo_empty_deps(self, code_scanner, tmp_path):
         """Test parsing Cargo.toml with no AI dependencies."""
         cargo_content = """
 [dependencies]
@@ -54,17 +53,41 @@ tokio = "1.35.0"
         cargo_file = tmp_path / "Cargo.toml"
         cargo_file.write_text(cargo_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         # Should not find AI components from deps
         assert len(components) == 0
 
+    def test_parse_cargo_renamed_and_target_deps(self, code_scanner):
+        """Renamed crates and [target.*] tables should be read from the parsed TOML."""
+        cargo_content = """
+[dependencies]
+llm = { package = "async-openai", version = "0.14" }
+
+[target.'cfg(unix)'.dependencies]
+anthropic-sdk = "0.1.0"
+
+[dev-dependencies]
+tokio = "1.35.0"
+"""
+        found = code_scanner._parse_cargo_toml(cargo_content, {"async-openai", "anthropic-sdk"})
+        assert found == {"async-openai", "anthropic-sdk"}
+
+    def test_parse_cargo_invalid_toml_falls_back(self, code_scanner):
+        """Files tomllib rejects should still be scanned line by line."""
+        cargo_content = """
+[dependencies]
+async-openai = "0.14.0"
+broken = {
+"""
+        found = code_scanner._parse_cargo_toml(cargo_content, {"async-openai"})
+        assert found == {"async-openai"}
+
 
 class TestGoModParsing:
     """Test go.mod (Go) dependency parsing."""
 
-    def test_parse_basic_go_mod(self, tmp_path):
+    def test_parse_basic_go_mod(self, code_scanner, tmp_path):
         """Test parsing basic go.mod dependencies."""
         go_mod_content = """
 module myapp
@@ -80,14 +103,13 @@ require (
         go_file = tmp_path / "go.mod"
         go_file.write_text(go_mod_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert "github.com/sashabaranov/go-openai" in component_names
         assert "github.com/anthropics/anthropic-sdk-go" in component_names
 
-    def test_parse_go_mod_single_line(self, tmp_path):
+    def test_parse_go_mod_single_line(self, code_scanner, tmp_path):
         """Test parsing go.mod with single-line require."""
         go_mod_content = """
 module myapp
@@ -97,17 +119,36 @@ require github.com/sashabaranov/go-openai v1.17.9
         go_file = tmp_path / "go.mod"
         go_file.write_text(go_mod_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert "github.com/sashabaranov/go-openai" in component_names
 
+    def test_parse_go_mod_ignores_non_require_directives(self, code_scanner):
+        """Test that replace/exclude paths and comments are not read as dependencies."""
+        go_mod_content = """
+module myapp
+
+require (
+    github.com/gin-gonic/gin v1.9.1
+    github.com/sashabaranov/go-openai v1.17.9 // indirect
+)
+
+exclude github.com/anthropics/anthropic-sdk-go v0.0.1
+replace github.com/anthropics/anthropic-sdk-go => ../anthropic v0.1.0
+// github.com/anthropics/anthropic-sdk-go v0.1.0
+"""
+        known = {"github.com/sashabaranov/go-openai", "github.com/anthropics/anthropic-sdk-go"}
+
+        found = code_scanner._parse_go_mod(go_mod_content, known)
+
+        assert found == {"github.com/sashabaranov/go-openai"}
+
 
 class TestGemfileParsing:
     """Test Gemfile (Ruby) dependency parsing."""
 
-    def test_parse_basic_gemfile(self, tmp_path):
+    def test_parse_basic_gemfile(self, code_scanner, tmp_path):
         """Test parsing basic Gemfile dependencies."""
         gemfile_content = """
 source 'https://rubygems.org'
@@ -119,14 +160,13 @@ gem 'rails', '~> 7.0'
         gemfile = tmp_path / "Gemfile"
         gemfile.write_text(gemfile_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert "ruby-openai" in component_names
         assert "anthropic" in component_names
 
-    def test_parse_gemfile_double_quotes(self, tmp_path):
+    def test_parse_gemfile_double_quotes(self, code_scanner, tmp_path):
         """Test parsing Gemfile with double quotes."""
         gemfile_content = """
 gem "ruby-openai", "~> 3.0"
@@ -134,8 +174,7 @@ gem "ruby-openai", "~> 3.0"
         gemfile = tmp_path / "Gemfile"
         gemfile.write_text(gemfile_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert "ruby-openai" in component_names
@@ -144,7 +183,7 @@ gem "ruby-openai", "~> 3.0"
 class TestPomXmlParsing:
     """Test pom.xml (Maven) dependency parsing."""
 
-    def test_parse_basic_pom_xml(self, tmp_path):
+    def test_parse_basic_pom_xml(self, code_scanner, tmp_path):
         """Test parsing basic pom.xml dependencies."""
         pom_content = """<?xml version="1.0" encoding="UTF-8"?>
 <project>
@@ -169,13 +208,12 @@ class TestPomXmlParsing:
         pom_file = tmp_path / "pom.xml"
         pom_file.write_text(pom_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert "com.langchain4j:langchain4j" in component_names or "langchain4j" in component_names
 
-    def test_parse_pom_xml_without_version(self, tmp_path):
+    def test_parse_pom_xml_without_version(self, code_scanner, tmp_path):
         """Test parsing pom.xml without version tags."""
         pom_content = """<?xml version="1.0" encoding="UTF-8"?>
 <project>
@@ -190,17 +228,29 @@ class TestPomXmlParsing:
         pom_file = tmp_path / "pom.xml"
         pom_file.write_text(pom_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert any("langchain4j" in name for name in component_names)
 
+    def test_parse_pom_xml_tolerates_malformed_xml(self, code_scanner):
+        """Unclosed elements and undeclared entities should not hide dependencies."""
+        pom_content = """<project>
+    <groupId>com.example</groupId><artifactId>my-app&version;</artifactId>
+    <dependencies>
+        <dependency>
+            <groupId>com.langchain4j</groupId>
+            <artifactId>langchain4j</artifactId>
+        </dependency>
+"""
+        found = code_scanner._parse_pom_xml(pom_content, {"langchain4j"})
+        assert found == {"com.langchain4j:langchain4j"}
+
 
 class TestGradleParsing:
     """Test build.gradle (Gradle) dependency parsing."""
 
-    def test_parse_basic_gradle(self, tmp_path):
+    def test_parse_basic_gradle(self, code_scanner, tmp_path):
         """Test parsing basic build.gradle dependencies."""
         gradle_content = """
 plugins {
@@ -216,14 +266,13 @@ dependencies {
         gradle_file = tmp_path / "build.gradle"
         gradle_file.write_text(gradle_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert "com.langchain4j:langchain4j" in component_names or "langchain4j" in component_names
         assert "spring-ai" in component_names
 
-    def test_parse_gradle_kotlin_dsl(self, tmp_path):
+    def test_parse_gradle_kotlin_dsl(self, code_scanner, tmp_path):
         """Test parsing build.gradle.kts (Kotlin DSL)."""
         gradle_kts_content = """
 dependencies {
@@ -234,13 +283,12 @@ dependencies {
         gradle_file = tmp_path / "build.gradle.kts"
         gradle_file.write_text(gradle_kts_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert any("langchain4j" in name for name in component_names)
 
-    def test_parse_gradle_api_compile(self, tmp_path):
+    def test_parse_gradle_api_compile(self, code_scanner, tmp_path):
         """Test parsing Gradle with api and compile configurations."""
         gradle_content = """
 dependencies {
@@ -251,8 +299,7 @@ dependencies {
         gradle_file = tmp_path / "build.gradle"
         gradle_file.write_text(gradle_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert len(component_names) > 0
@@ -261,7 +308,7 @@ dependencies {
 class TestCsprojParsing:
     """Test .csproj (.NET) dependency parsing."""
 
-    def test_parse_basic_csproj(self, tmp_path):
+    def test_parse_basic_csproj(self, code_scanner, tmp_path):
         """Test parsing basic .csproj PackageReferences."""
         csproj_content = """<?xml version="1.0" encoding="utf-8"?>
 <Project Sdk="Microsoft.NET.Sdk">
@@ -279,14 +326,13 @@ class TestCsprojParsing:
         csproj_file = tmp_path / "MyApp.csproj"
         csproj_file.write_text(csproj_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert "Azure.AI.OpenAI" in component_names
         assert "Microsoft.SemanticKernel" in component_names
 
-    def test_parse_csproj_google_ai(self, tmp_path):
+    def test_parse_csproj_google_ai(self, code_scanner, tmp_path):
         """Test parsing .csproj with Google AI package."""
         csproj_content = """<?xml version="1.0" encoding="utf-8"?>
 <Project Sdk="Microsoft.NET.Sdk">
@@ -298,13 +344,12 @@ class TestCsprojParsing:
         csproj_file = tmp_path / "MyApp.csproj"
         csproj_file.write_text(csproj_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
         assert "Mscc.GenerativeAI" in component_names
 
-    def test_parse_csproj_no_ai_packages(self, tmp_path):
+    def test_parse_csproj_no_ai_packages(self, code_scanner, tmp_path):
         """Test parsing .csproj with no AI packages."""
         csproj_content = """<?xml version="1.0" encoding="utf-8"?>
 <Project Sdk="Microsoft.NET.Sdk">
@@ -316,17 +361,28 @@ class TestCsprojParsing:
         csproj_file = tmp_path / "MyApp.csproj"
         csproj_file.write_text(csproj_content)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         # Should not find AI components
         assert len(components) == 0
 
+    def test_csproj_in_excluded_directory_skipped(self, code_scanner, tmp_path):
+        """.csproj files are found by the same pruned walk as other dep files."""
+        vendored = tmp_path / "node_modules" / "pkg"
+        vendored.mkdir(parents=True)
+        (vendored / "Vendored.csproj").write_text(
+            '<Project><ItemGroup><PackageReference Include="Azure.AI.OpenAI" />'
+            "</ItemGroup></Project>"
+        )
+
+        components = code_scanner.scan(tmp_path)
+        assert components == []
+
 
 class TestMixedDependencyFiles:
     """Test scanning projects with multiple dependency file types."""
 
-    def test_python_and_rust_deps(self, tmp_path):
+    def test_python_and_rust_deps(self, code_scanner, tmp_path):
         """Test scanning project with both Python and Rust dependencies."""
         # Create requirements.txt
         requirements = tmp_path / "requirements.txt"
@@ -339,8 +395,7 @@ class TestMixedDependencyFiles:
 async-openai = "0.14.0"
 """)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
 
@@ -349,7 +404,7 @@ async-openai = "0.14.0"
         assert "langchain" in component_names
         assert any("openai" in name.lower() for name in component_names)
 
-    def test_java_and_dotnet_deps(self, tmp_path):
+    def test_java_and_dotnet_deps(self, code_scanner, tmp_path):
         """Test scanning project with Java and .NET dependencies."""
         # Create build.gradle
         gradle = tmp_path / "build.gradle"
@@ -369,11 +424,72 @@ dependencies {
 </Project>
 """)
 
-        scanner = CodeScanner()
-        components = scanner.scan(tmp_path)
+        components = code_scanner.scan(tmp_path)
 
         component_names = [c.name for c in components]
 
         # Should find both Java and .NET packages
         assert any("langchain4j" in name for name in component_names)
         assert "Microsoft.SemanticKernel" in component_names
+
+    def test_many_dep_files_parsed_on_thread_pool(self, code_scanner, tmp_path, monkeypatch):
+        """Projects with several dep files are parsed on a thread pool, same result."""
+        (tmp_path / "requirements.txt").write_text("openai==1.0.0\n")
+        (tmp_path / "Cargo.toml").write_text('[dependencies]\nasync-openai = "0.14.0"\n')
+        (tmp_path / "Gemfile").write_text("gem 'ruby-openai'\n")
+        (tmp_path / "App.csproj").write_text('<PackageReference Include="Azure.AI.OpenAI" />\n')
+
+        pools: list[int] = []
+
+        class RecordingExecutor(code_scanner_module.ThreadPoolExecutor):
+            def __init__(self, max_workers=None):
+                pools.append(max_workers)
+                super().__init__(max_workers=max_workers)
+
+        monkeypatch.setattr(code_scanner_module, "ThreadPoolExecutor", RecordingExecutor)
+
+        component_names = {c.name for c in code_scanner.scan(tmp_path)}
+        assert {"openai", "async-openai", "ruby-openai", "Azure.AI.OpenAI"} <= component_names
+        assert len(pools) == 1
+
+
+class TestDependencyFileCache:
+    """Test reuse of parsed dependency files across scans."""
+
+    def test_unchanged_file_not_reparsed(self, code_scanner, tmp_path, monkeypatch):
+        CodeScanner.clear_cache()
+        req = tmp_path / "requirements.txt"
+        req.write_text("openai==1.0.0\n")
+        assert code_scanner._scan_single_dep_file(req) == {"openai"}
+
+        def _fail(*args):
+            raise AssertionError("re-parsed an unchanged file")
+
+        monkeypatch.setattr(CodeScanner, "_parse_requirements_format", _fail)
+        assert code_scanner._scan_single_dep_file(req) == {"openai"}
+
+    def test_modified_file_reparsed(self, code_scanner, tmp_path):
+        CodeScanner.clear_cache()
+        req = tmp_path / "requirements.txt"
+        req.write_text("openai==1.0.0\n")
+        assert code_scanner._scan_single_dep_file(req) == {"openai"}
+
+        req.write_text("openai==1.0.0\nanthropic\n")
+        assert code_scanner._scan_single_dep_file(req) == {"openai", "anthropic"}
+
+    def test_clear_cache(self, code_scanner, tmp_path, monkeypatch):
+        req = tmp_path / "requirements.txt"
+        req.write_text("openai\n")
+        code_scanner._scan_single_dep_file(req)
+        CodeScanner.clear_cache()
+
+        calls: list[str] = []
+        original = CodeScanner._parse_requirements_format
+
+        def _recording(self, content, known_deps):
+            calls.append(content)
+            return original(self, content, known_deps)
+
+        monkeypatch.setattr(CodeScanner, "_parse_requirements_format", _recording)
+        code_scanner._scan_single_dep_file(req)
+        assert calls == ["openai\n"]
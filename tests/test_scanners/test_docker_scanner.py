@@ -1,13 +1,13 @@
 """Tests for docker scanner."""
 
-import pytest
+from unittest.mock import patch
 
-from ai_bom.scanners.docker_scanner import DockerScanner
+import pytest
 
 
 @pytest.fixture
-def scanner():
-    return DockerScanner()
+def scanner(docker_scanner):
+    return docker_scanner
 
 
 class TestDockerScanner:
@@ -153,6 +153,31 @@ services:
         components = scanner.scan(compose)
         assert len(components) == 1
 
+    def test_scan_compose_build_checks_service_once(self, scanner, tmp_path):
+        compose = tmp_path / "docker-compose.yml"
+        compose.write_text("""
+services:
+  app:
+    build: ./app
+    deploy:
+      resources:
+        reservations:
+          devices:
+            - driver: nvidia
+""")
+        app_dir = tmp_path / "app"
+        app_dir.mkdir()
+        (app_dir / "Dockerfile").write_text(
+            "FROM ollama/ollama:latest AS base\nFROM vllm/vllm-openai:latest\n"
+        )
+
+        with patch.object(scanner, "_check_gpu", wraps=scanner._check_gpu) as check_gpu:
+            components = scanner.scan(compose)
+
+        assert len(components) == 2
+        assert all(c.metadata["gpu"] is True for c in components)
+        check_gpu.assert_called_once()
+
     def test_check_gpu_with_nvidia_driver(self, scanner):
         config = {"deploy": {"resources": {"reservations": {"devices": [{"driver": "nvidia"}]}}}}
         assert scanner._check_gpu(config)
@@ -1,5 +1,7 @@
 """Tests for GitHub Actions scanner."""
 
+from unittest.mock import patch
+
 import pytest
 
 from ai_bom.models import ComponentType
@@ -159,6 +161,37 @@ jobs:
     assert comp.metadata["hardcoded"] is True
 
 
+def test_scan_key_literal_inside_expression(tmp_path, scanner):
+    """Test that a literal key wrapped in an expression is still flagged."""
+    workflows_dir = tmp_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True)
+    (workflows_dir / "sneaky.yml").write_text(
+        "name: Sneaky\non: push\nenv:\n"
+        "  ANTHROPIC_API_KEY: ${{ secrets.KEY || 'sk-ant-REDACTED' }}\n"
+    )
+
+    components = scanner.scan(tmp_path)
+
+    assert len(components) == 1
+    assert components[0].provider == "Anthropic"
+    assert "hardcoded_api_key" in components[0].flags
+
+
+def test_scan_secret_with_vars_fallback_not_flagged(tmp_path, scanner):
+    """Test that a hyphenated vars fallback is not mistaken for an sk- key."""
+    workflows_dir = tmp_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True)
+    (workflows_dir / "fallback.yml").write_text(
+        "name: Fallback\non: push\nenv:\n"
+        "  OPENAI_API_KEY: ${{ secrets.OPENAI_API_KEY || vars.disk-cache-for-integration-tests }}\n"
+    )
+
+    components = scanner.scan(tmp_path)
+
+    assert len(components) == 1
+    assert "hardcoded_api_key" not in components[0].flags
+
+
 def test_scan_secret_api_key(tmp_path, scanner):
     """Test detection of API key from secrets (not hardcoded)."""
     workflows_dir = tmp_path / ".github" / "workflows"
@@ -213,6 +246,9 @@ jobs:
     providers = {c.provider for c in components}
     assert "OpenAI" in providers
     assert "HuggingFace" in providers
+    # Every component from the file shares one resolved path string
+    assert len({id(c.location.file_path) for c in components}) == 1
+    assert components[0].location.file_path == str(workflow_file.resolve())
 
 
 def test_scan_global_env_vars(tmp_path, scanner):
@@ -295,6 +331,31 @@ def test_scan_empty_workflow(tmp_path, scanner):
     assert len(components) == 0
 
 
+def test_scan_workflow_without_ai_keywords_skips_yaml(tmp_path, scanner):
+    """Test that workflows with no AI keyword are never handed to the YAML parser."""
+    workflows_dir = tmp_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True)
+    (workflows_dir / "ci.yml").write_text(
+        "name: CI\non: push\njobs:\n  test:\n    runs-on: ubuntu-latest\n"
+        "    steps:\n      - uses: actions/checkout@v4\n"
+    )
+
+    with patch("yaml.load", side_effect=AssertionError("parsed")):
+        assert scanner.scan(tmp_path) == []
+
+
+def test_scan_keyword_match_is_case_insensitive(tmp_path, scanner):
+    """Test that lowercase env var names still pass the keyword prefilter."""
+    workflows_dir = tmp_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True)
+    (workflows_dir / "ai.yml").write_text(
+        "name: AI\non: push\nenv:\n  openai_api_key: ${{ secrets.key }}\n"
+    )
+
+    components = scanner.scan(tmp_path)
+    assert [c.provider for c in components] == ["OpenAI"]
+
+
 def test_scan_invalid_yaml(tmp_path, scanner):
     """Test scanning invalid YAML file."""
     workflows_dir = tmp_path / ".github" / "workflows"
@@ -317,6 +378,13 @@ def test_provider_extraction_from_env(scanner):
     assert scanner._extract_provider_from_env("UNKNOWN_KEY") == "Unknown"
 
 
+def test_provider_extraction_keeps_precedence(scanner):
+    """Test that earlier providers win when a name mentions several."""
+    assert scanner._extract_provider_from_env("CLAUDE_API_KEY") == "Anthropic"
+    assert scanner._extract_provider_from_env("VERTEX_AI_KEY") == "Google"
+    assert scanner._extract_provider_from_env("GOOGLE_OPENAI_PROXY_KEY") == "OpenAI"
+
+
 def test_action_reference_parsing(scanner):
     """Test action reference parsing."""
     name, version = scanner._parse_action_ref("actions/checkout@v3")
@@ -330,3 +398,25 @@ def test_action_reference_parsing(scanner):
     name, version = scanner._parse_action_ref("user/action@main")
     assert name == "user/action"
     assert version == "main"
+
+
+def test_action_reference_parsing_is_cached(scanner):
+    """Test that repeated references are served from the cache."""
+    GitHubActionsScanner._parse_action_ref.cache_clear()
+    scanner._parse_action_ref("actions/checkout@v4")
+    assert scanner._parse_action_ref("actions/checkout@v4") == ("actions/checkout", "v4")
+    assert GitHubActionsScanner._parse_action_ref.cache_info().hits == 1
+
+
+def test_scan_action_match_is_case_insensitive(tmp_path, scanner):
+    """Test that action references match AI_ACTIONS regardless of case."""
+    workflows_dir = tmp_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True)
+    (workflows_dir / "review.yml").write_text(
+        "name: Review\non: pull_request\njobs:\n  review:\n    steps:\n"
+        "      - uses: Acme/Claude-Review@v2\n      - uses: actions/checkout@v4\n"
+    )
+
+    components = scanner.scan(tmp_path)
+
+    assert [c.name for c in components] == ["Acme/Claude-Review (GitHub Action)"]
@@ -7,11 +7,20 @@ import pytest
 from ai_bom.models import ComponentType
 from ai_bom.scanners.jupyter_scanner import JupyterScanner
 
+# Everything in a one-code-cell notebook except the source, pre-serialised.
+_CODE_CELL_HEAD = b'{"cells": [{"cell_type": "code", "source": '
+_CODE_CELL_TAIL = b"}]}"
+
+
+def _write_code_cell(path, source):
+    """Write a notebook holding a single code cell; only ``source`` is serialised per call."""
+    path.write_bytes(_CODE_CELL_HEAD + json.dumps(source).encode() + _CODE_CELL_TAIL)
+
 
 @pytest.fixture
-def scanner():
-    """Create a JupyterScanner instance."""
-    return JupyterScanner()
+def scanner(jupyter_scanner):
+    """The session-wide JupyterScanner instance."""
+    return jupyter_scanner
 
 
 def test_scanner_registration():
@@ -24,7 +33,7 @@ def test_scanner_registration():
 def test_supports_ipynb_file(tmp_path, scanner):
     """Test that scanner supports .ipynb files."""
     notebook_file = tmp_path / "test.ipynb"
-    notebook_file.write_text("{}")
+    notebook_file.touch()
 
     assert scanner.supports(notebook_file)
 
@@ -32,7 +41,7 @@ def test_supports_ipynb_file(tmp_path, scanner):
 def test_supports_directory_with_notebooks(tmp_path, scanner):
     """Test that scanner supports directories with .ipynb files."""
     notebook_file = tmp_path / "notebook.ipynb"
-    notebook_file.write_text("{}")
+    notebook_file.touch()
 
     assert scanner.supports(tmp_path)
 
@@ -40,99 +49,47 @@ def test_supports_directory_with_notebooks(tmp_path, scanner):
 def test_not_supports_non_notebook_file(tmp_path, scanner):
     """Test that scanner does not support non-notebook files."""
     test_file = tmp_path / "test.py"
-    test_file.write_text("print('test')")
+    test_file.touch()
 
     assert not scanner.supports(test_file)
 
 
-def test_scan_openai_import(tmp_path, scanner):
-    """Test detection of OpenAI import."""
-    notebook_file = tmp_path / "test.ipynb"
-
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": ["import openai\n", "client = openai.Client()"],
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
+@pytest.mark.parametrize(
+    ("source", "module", "expected_provider", "expected_type"),
+    [
+        (
+            ["import openai\n", "client = openai.Client()"],
+            "openai",
+            "OpenAI",
+            ComponentType.llm_provider,
+        ),
+        ("from langchain import LLMChain", "langchain", "LangChain", ComponentType.agent_framework),
+        (
+            ["import transformers\n", "from transformers import pipeline"],
+            "transformers",
+            "HuggingFace",
+            ComponentType.model,
+        ),
+    ],
+    ids=["openai", "langchain", "transformers"],
+)
+def test_scan_library_import(tmp_path, scanner, source, module, expected_provider, expected_type):
+    """Test detection of AI library imports in a code cell."""
+    _write_code_cell(tmp_path / "test.ipynb", source)
 
     components = scanner.scan(tmp_path)
 
-    assert len(components) >= 1
-    openai_components = [c for c in components if "openai" in c.name.lower()]
-    assert len(openai_components) >= 1
-
-    comp = openai_components[0]
-    assert comp.provider == "OpenAI"
+    comp = next(c for c in components if c.name == module)
+    assert comp.provider == expected_provider
+    assert comp.type == expected_type
     assert comp.source == "jupyter"
 
 
-def test_scan_langchain_import(tmp_path, scanner):
-    """Test detection of LangChain import."""
-    notebook_file = tmp_path / "test.ipynb"
-
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": "from langchain import LLMChain",
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
-
-    components = scanner.scan(tmp_path)
-
-    assert len(components) >= 1
-    langchain_components = [c for c in components if "langchain" in c.name.lower()]
-    assert len(langchain_components) >= 1
-
-    comp = langchain_components[0]
-    assert comp.provider == "LangChain"
-    assert comp.type == ComponentType.agent_framework
-
-
-def test_scan_transformers_import(tmp_path, scanner):
-    """Test detection of HuggingFace transformers import."""
-    notebook_file = tmp_path / "test.ipynb"
-
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": ["import transformers\n", "from transformers import pipeline"],
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
-
-    components = scanner.scan(tmp_path)
-
-    assert len(components) >= 1
-    hf_components = [c for c in components if c.provider == "HuggingFace"]
-    assert len(hf_components) >= 1
-
-
 def test_scan_model_loading_automodel(tmp_path, scanner):
     """Test detection of AutoModel.from_pretrained."""
     notebook_file = tmp_path / "test.ipynb"
 
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": 'model = AutoModel.from_pretrained("bert-base-uncased")',
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
+    _write_code_cell(notebook_file, 'model = AutoModel.from_pretrained("bert-base-uncased")')
 
     components = scanner.scan(tmp_path)
 
@@ -149,16 +106,7 @@ def test_scan_model_loading_pipeline(tmp_path, scanner):
     """Test detection of pipeline() function."""
     notebook_file = tmp_path / "test.ipynb"
 
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": 'classifier = pipeline("sentiment-analysis")',
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
+    _write_code_cell(notebook_file, 'classifier = pipeline("sentiment-analysis")')
 
     components = scanner.scan(tmp_path)
 
@@ -171,16 +119,9 @@ def test_scan_chatopenai(tmp_path, scanner):
     """Test detection of ChatOpenAI initialization."""
     notebook_file = tmp_path / "test.ipynb"
 
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": "from langchain.chat_models import ChatOpenAI\nllm = ChatOpenAI()",
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
+    _write_code_cell(
+        notebook_file, "from langchain.chat_models import ChatOpenAI\nllm = ChatOpenAI()"
+    )
 
     components = scanner.scan(tmp_path)
 
@@ -217,51 +158,34 @@ def test_scan_multiple_cells(tmp_path, scanner):
 
     assert len(components) >= 2
     providers = {c.provider for c in components}
-    assert "OpenAI" in providers
-    assert "Anthropic" in providers
+    assert {"OpenAI", "Anthropic"}.issubset(providers)
 
 
 def test_scan_multiline_source(tmp_path, scanner):
     """Test scanning cell with multiline source (list of strings)."""
     notebook_file = tmp_path / "test.ipynb"
 
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": [
-                    "import openai\n",
-                    "import anthropic\n",
-                    "client = openai.Client()\n",
-                ],
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
+    _write_code_cell(
+        notebook_file,
+        [
+            "import openai\n",
+            "import anthropic\n",
+            "client = openai.Client()\n",
+        ],
+    )
 
     components = scanner.scan(tmp_path)
 
     assert len(components) >= 2
     providers = {c.provider for c in components}
-    assert "OpenAI" in providers
-    assert "Anthropic" in providers
+    assert {"OpenAI", "Anthropic"}.issubset(providers)
 
 
 def test_scan_comments_ignored(tmp_path, scanner):
     """Test that comments are ignored."""
     notebook_file = tmp_path / "test.ipynb"
 
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": "# import openai\nimport anthropic  # This is real",
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
+    _write_code_cell(notebook_file, "# import openai\nimport anthropic  # This is real")
 
     components = scanner.scan(tmp_path)
 
@@ -305,21 +229,15 @@ def test_scan_sentence_transformers(tmp_path, scanner):
     """Test detection of sentence-transformers."""
     notebook_file = tmp_path / "test.ipynb"
 
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": (
-                    "from sentence_transformers"
-                    " import SentenceTransformer\n"
-                    "model = SentenceTransformer("
-                    '"all-MiniLM-L6-v2")'
-                ),
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
+    _write_code_cell(
+        notebook_file,
+        (
+            "from sentence_transformers"
+            " import SentenceTransformer\n"
+            "model = SentenceTransformer("
+            '"all-MiniLM-L6-v2")'
+        ),
+    )
 
     components = scanner.scan(tmp_path)
 
@@ -334,20 +252,10 @@ def test_scan_google_genai(tmp_path, scanner):
     """Test detection of Google Generative AI."""
     notebook_file = tmp_path / "test.ipynb"
 
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": (
-                    "import google.generativeai as genai\n"
-                    "model = genai.GenerativeModel("
-                    '"gemini-pro")'
-                ),
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
+    _write_code_cell(
+        notebook_file,
+        'import google.generativeai as genai\nmodel = genai.GenerativeModel("gemini-pro")',
+    )
 
     components = scanner.scan(tmp_path)
 
@@ -356,26 +264,16 @@ def test_scan_google_genai(tmp_path, scanner):
     assert len(google_components) >= 1
 
 
-def test_scan_empty_notebook(tmp_path, scanner):
-    """Test scanning empty notebook."""
-    notebook_file = tmp_path / "empty.ipynb"
+@pytest.mark.parametrize(
+    "payload",
+    [b"{ invalid json [", b"{}", b'{"cells": []}'],
+    ids=["invalid-json", "empty-object", "no-cells"],
+)
+def test_scan_empty_or_invalid(tmp_path, scanner, payload):
+    """Test that empty or malformed notebooks yield no components without crashing."""
+    (tmp_path / "test.ipynb").write_bytes(payload)
 
-    notebook_data = {"cells": []}
-
-    notebook_file.write_text(json.dumps(notebook_data))
-
-    components = scanner.scan(tmp_path)
-    assert len(components) == 0
-
-
-def test_scan_invalid_json(tmp_path, scanner):
-    """Test scanning invalid JSON file."""
-    notebook_file = tmp_path / "invalid.ipynb"
-    notebook_file.write_text("{ invalid json [")
-
-    components = scanner.scan(tmp_path)
-    # Should not crash, just return empty
-    assert len(components) == 0
+    assert scanner.scan(tmp_path) == []
 
 
 def test_scan_no_code_cells(tmp_path, scanner):
@@ -406,16 +304,7 @@ def test_scan_anthropic_client(tmp_path, scanner):
     """Test detection of Anthropic client initialization."""
     notebook_file = tmp_path / "test.ipynb"
 
-    notebook_data = {
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": "import anthropic\nclient = anthropic.Anthropic()",
-            }
-        ]
-    }
-
-    notebook_file.write_text(json.dumps(notebook_data))
+    _write_code_cell(notebook_file, "import anthropic\nclient = anthropic.Anthropic()")
 
     components = scanner.scan(tmp_path)
 
@@ -9,9 +9,39 @@ from ai_bom.scanners.mcp_config_scanner import MCPConfigScanner
 
 
 @pytest.fixture
-def scanner():
-    """Create an MCPConfigScanner instance."""
-    return MCPConfigScanner()
+def scanner(mcp_config_scanner):
+    """The session-wide MCPConfigScanner instance."""
+    return mcp_config_scanner
+
+
+# One config exercising several server shapes, scanned once per module.
+_MULTI_SERVER_CONFIG = {
+    "mcpServers": {
+        "filesystem": {
+            "command": "npx",
+            "args": ["-y", "@modelcontextprotocol/server-filesystem"],
+        },
+        "github": {
+            "command": "npx",
+            "args": ["-y", "@modelcontextprotocol/server-github"],
+        },
+        "brave-search": {
+            "command": "npx",
+            "args": ["-y", "@modelcontextprotocol/server-brave-search"],
+        },
+        "sqlite": {"command": "npx", "args": ["@modelcontextprotocol/server-sqlite"]},
+        "http-fetch": {"command": "npx", "args": ["@modelcontextprotocol/server-fetch"]},
+        "untrusted": {"command": "/tmp/sketchy-binary", "args": []},
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def multi_server_scan(tmp_path_factory, mcp_config_scanner):
+    """Components from scanning ``_MULTI_SERVER_CONFIG``, shared by the module."""
+    workspace = tmp_path_factory.mktemp("mcp")
+    (workspace / "claude_desktop_config.json").write_text(json.dumps(_MULTI_SERVER_CONFIG))
+    return mcp_config_scanner.scan(workspace)
 
 
 def test_scanner_registration():
@@ -24,7 +54,7 @@ def test_scanner_registration():
 def test_supports_mcp_json(tmp_path, scanner):
     """Test that scanner supports mcp.json file."""
     config_file = tmp_path / "mcp.json"
-    config_file.write_text("{}")
+    config_file.touch()
 
     assert scanner.supports(config_file)
 
@@ -32,7 +62,7 @@ def test_supports_mcp_json(tmp_path, scanner):
 def test_supports_claude_desktop_config(tmp_path, scanner):
     """Test that scanner supports claude_desktop_config.json."""
     config_file = tmp_path / "claude_desktop_config.json"
-    config_file.write_text("{}")
+    config_file.touch()
 
     assert scanner.supports(config_file)
 
@@ -42,7 +72,7 @@ def test_supports_cursor_mcp_config(tmp_path, scanner):
     cursor_dir = tmp_path / ".cursor"
     cursor_dir.mkdir()
     config_file = cursor_dir / "mcp.json"
-    config_file.write_text("{}")
+    config_file.touch()
 
     assert scanner.supports(config_file)
 
@@ -50,7 +80,7 @@ def test_supports_cursor_mcp_config(tmp_path, scanner):
 def test_supports_directory_with_mcp_config(tmp_path, scanner):
     """Test that scanner supports directories with MCP config files."""
     config_file = tmp_path / "mcp.json"
-    config_file.write_text("{}")
+    config_file.touch()
 
     assert scanner.supports(tmp_path)
 
@@ -58,7 +88,7 @@ def test_supports_directory_with_mcp_config(tmp_path, scanner):
 def test_not_supports_non_mcp_file(tmp_path, scanner):
     """Test that scanner does not support non-MCP files."""
     test_file = tmp_path / "test.json"
-    test_file.write_text("{}")
+    test_file.touch()
 
     assert not scanner.supports(test_file)
 
@@ -67,16 +97,10 @@ def test_scan_claude_desktop_config_structure(tmp_path, scanner):
     """Test scanning Claude Desktop config structure."""
     config_file = tmp_path / "claude_desktop_config.json"
 
-    config_data = {
-        "mcpServers": {
-            "filesystem": {
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-filesystem", "/tmp"],
-            }
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
+    config_file.write_bytes(
+        b'{"mcpServers":{"filesystem":{"command":"npx","args":["-y",'
+        b'"@modelcontextprotocol/server-filesystem","/tmp"]}}}'
+    )
 
     components = scanner.scan(tmp_path)
 
@@ -93,17 +117,11 @@ def test_scan_mcp_json_structure(tmp_path, scanner):
     """Test scanning standalone mcp.json structure."""
     config_file = tmp_path / "mcp.json"
 
-    config_data = {
-        "servers": {
-            "brave-search": {
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-brave-search"],
-                "env": {"BRAVE_API_KEY": "your-key-here"},
-            }
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
+    config_file.write_bytes(
+        b'{"servers":{"brave-search":{"command":"npx","args":["-y",'
+        b'"@modelcontextprotocol/server-brave-search"],'
+        b'"env":{"BRAVE_API_KEY":"your-key-here"}}}}'
+    )
 
     components = scanner.scan(tmp_path)
 
@@ -118,18 +136,10 @@ def test_scan_nested_mcp_structure(tmp_path, scanner):
     """Test scanning nested mcp config structure."""
     config_file = tmp_path / "mcp.json"
 
-    config_data = {
-        "mcp": {
-            "servers": {
-                "github": {
-                    "command": "npx",
-                    "args": ["-y", "@modelcontextprotocol/server-github"],
-                }
-            }
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
+    config_file.write_bytes(
+        b'{"mcp":{"servers":{"github":{"command":"npx","args":["-y",'
+        b'"@modelcontextprotocol/server-github"]}}}}'
+    )
 
     components = scanner.scan(tmp_path)
 
@@ -138,54 +148,21 @@ def test_scan_nested_mcp_structure(tmp_path, scanner):
     assert "github" in comp.name.lower()
 
 
-def test_scan_multiple_servers(tmp_path, scanner):
+def test_scan_multiple_servers(multi_server_scan):
     """Test scanning config with multiple MCP servers."""
-    config_file = tmp_path / "claude_desktop_config.json"
-
-    config_data = {
-        "mcpServers": {
-            "filesystem": {
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-filesystem"],
-            },
-            "github": {
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-github"],
-            },
-            "brave-search": {
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-brave-search"],
-            },
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
-
-    components = scanner.scan(tmp_path)
-
-    assert len(components) == 3
-    server_names = {c.metadata["server_name"] for c in components}
-    assert "filesystem" in server_names
-    assert "github" in server_names
-    assert "brave-search" in server_names
+    assert len(multi_server_scan) == len(_MULTI_SERVER_CONFIG["mcpServers"])
+    server_names = {c.metadata["server_name"] for c in multi_server_scan}
+    assert server_names == _MULTI_SERVER_CONFIG["mcpServers"].keys()
 
 
 def test_scan_server_with_transport(tmp_path, scanner):
     """Test scanning server with explicit transport type."""
     config_file = tmp_path / "mcp.json"
 
-    config_data = {
-        "servers": {
-            "remote-server": {
-                "command": "node",
-                "args": ["server.js"],
-                "transport": "sse",
-                "url": "http://localhost:3000",
-            }
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
+    config_file.write_bytes(
+        b'{"servers":{"remote-server":{"command":"node","args":["server.js"],'
+        b'"transport":"sse","url":"http://localhost:3000"}}}'
+    )
 
     components = scanner.scan(tmp_path)
 
@@ -198,16 +175,7 @@ def test_scan_server_with_url_sse_transport(tmp_path, scanner):
     """Test that URL presence implies SSE transport."""
     config_file = tmp_path / "mcp.json"
 
-    config_data = {
-        "servers": {
-            "remote": {
-                "command": "node",
-                "url": "http://example.com",
-            }
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
+    config_file.write_bytes(b'{"servers":{"remote":{"command":"node","url":"http://example.com"}}}')
 
     components = scanner.scan(tmp_path)
 
@@ -216,163 +184,57 @@ def test_scan_server_with_url_sse_transport(tmp_path, scanner):
     assert comp.metadata["transport"] == "sse"
 
 
-def test_provider_guessing_filesystem(tmp_path, scanner):
-    """Test provider guessing for filesystem server."""
-    config_file = tmp_path / "mcp.json"
+@pytest.mark.parametrize(
+    ("server_name", "expected_provider"),
+    [
+        ("filesystem", "MCP Filesystem"),
+        ("github", "GitHub"),
+        ("brave-search", "Brave Search"),
+        ("sqlite", "MCP Database"),
+    ],
+)
+def test_provider_guessing(multi_server_scan, server_name, expected_provider):
+    """Test provider guessing from the server's npx package."""
+    by_name = {c.metadata["server_name"]: c for c in multi_server_scan}
+    assert by_name[server_name].provider == expected_provider
 
-    config_data = {
-        "servers": {
-            "filesystem": {"command": "npx", "args": ["@modelcontextprotocol/server-filesystem"]},
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
-
-    components = scanner.scan(tmp_path)
 
-    assert len(components) == 1
-    comp = components[0]
-    assert comp.provider == "MCP Filesystem"
-
-
-def test_provider_guessing_github(tmp_path, scanner):
-    """Test provider guessing for GitHub server."""
-    config_file = tmp_path / "mcp.json"
-
-    config_data = {
-        "servers": {
-            "github": {"command": "npx", "args": ["@modelcontextprotocol/server-github"]},
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
-
-    components = scanner.scan(tmp_path)
-
-    assert len(components) == 1
-    comp = components[0]
-    assert comp.provider == "GitHub"
-
-
-def test_provider_guessing_brave(tmp_path, scanner):
-    """Test provider guessing for Brave Search server."""
-    config_file = tmp_path / "mcp.json"
-
-    config_data = {
-        "servers": {
-            "brave-search": {
-                "command": "npx",
-                "args": ["@modelcontextprotocol/server-brave-search"],
-            },
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
-
-    components = scanner.scan(tmp_path)
-
-    assert len(components) == 1
-    comp = components[0]
-    assert comp.provider == "Brave Search"
-
-
-def test_trusted_command_detection(tmp_path, scanner):
+def test_trusted_command_detection(multi_server_scan):
     """Test detection of trusted vs untrusted commands."""
-    config_file = tmp_path / "mcp.json"
+    by_name = {c.metadata["server_name"]: c for c in multi_server_scan}
 
-    config_data = {
-        "servers": {
-            "trusted": {
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-filesystem"],
-            },
-            "untrusted": {"command": "/tmp/sketchy-binary", "args": []},
-        }
-    }
+    assert "mcp_unknown_server" in by_name["untrusted"].flags
+    assert "mcp_unknown_server" not in by_name["filesystem"].flags
 
-    config_file.write_text(json.dumps(config_data))
 
-    components = scanner.scan(tmp_path)
-
-    assert len(components) == 2
-
-    # Find untrusted component
-    untrusted = next(c for c in components if c.metadata["server_name"] == "untrusted")
-    assert "mcp_unknown_server" in untrusted.flags
-
-    # Find trusted component
-    trusted = next(c for c in components if c.metadata["server_name"] == "trusted")
-    assert "mcp_unknown_server" not in trusted.flags
-
-
-def test_internet_facing_flag(tmp_path, scanner):
+def test_internet_facing_flag(multi_server_scan):
     """Test flagging of internet-facing servers."""
-    config_file = tmp_path / "mcp.json"
-
-    config_data = {
-        "servers": {
-            "http-fetch": {"command": "npx", "args": ["@modelcontextprotocol/server-fetch"]},
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
-
-    components = scanner.scan(tmp_path)
-
-    assert len(components) == 1
-    comp = components[0]
+    comp = next(c for c in multi_server_scan if c.metadata["server_name"] == "http-fetch")
     assert "internet_facing" in comp.flags
 
 
-def test_usage_type_tool_use(tmp_path, scanner):
+def test_usage_type_tool_use(multi_server_scan):
     """Test that MCP servers have tool_use usage type."""
-    config_file = tmp_path / "mcp.json"
-
-    config_data = {
-        "servers": {
-            "test": {"command": "npx", "args": ["test"]},
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
-
-    components = scanner.scan(tmp_path)
-
-    assert len(components) == 1
-    comp = components[0]
-    assert comp.usage_type == UsageType.tool_use
-
-
-def test_scan_invalid_json(tmp_path, scanner):
-    """Test scanning invalid JSON file."""
-    config_file = tmp_path / "mcp.json"
-    config_file.write_text("{ invalid json [")
+    assert all(c.usage_type == UsageType.tool_use for c in multi_server_scan)
 
-    components = scanner.scan(tmp_path)
-    # Should not crash, just return empty
-    assert len(components) == 0
 
+@pytest.mark.parametrize(
+    "payload",
+    [b"{ invalid json [", b"{}", b'{"servers": {}}'],
+    ids=["invalid-json", "empty-object", "no-servers"],
+)
+def test_scan_empty_or_invalid(tmp_path, scanner, payload):
+    """Test that empty or malformed configs yield no components without crashing."""
+    (tmp_path / "mcp.json").write_bytes(payload)
 
-def test_scan_empty_config(tmp_path, scanner):
-    """Test scanning empty config file."""
-    config_file = tmp_path / "mcp.json"
-    config_file.write_text("{}")
-
-    components = scanner.scan(tmp_path)
-    assert len(components) == 0
+    assert scanner.scan(tmp_path) == []
 
 
 def test_scan_server_without_command(tmp_path, scanner):
     """Test scanning server entry without command (invalid)."""
     config_file = tmp_path / "mcp.json"
 
-    config_data = {
-        "servers": {
-            "invalid": {"args": ["test"]},
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
+    config_file.write_bytes(b'{"servers":{"invalid":{"args":["test"]}}}')
 
     components = scanner.scan(tmp_path)
     # Should skip invalid server
@@ -383,13 +245,7 @@ def test_scan_cline_mcp_settings(tmp_path, scanner):
     """Test scanning cline_mcp_settings.json file."""
     config_file = tmp_path / "cline_mcp_settings.json"
 
-    config_data = {
-        "mcpServers": {
-            "test-server": {"command": "npx", "args": ["test"]},
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
+    config_file.write_bytes(b'{"mcpServers":{"test-server":{"command":"npx","args":["test"]}}}')
 
     components = scanner.scan(tmp_path)
 
@@ -402,13 +258,9 @@ def test_scan_cursor_directory(tmp_path, scanner):
     cursor_dir.mkdir()
     config_file = cursor_dir / "mcp.json"
 
-    config_data = {
-        "servers": {
-            "cursor-server": {"command": "node", "args": ["server.js"]},
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
+    config_file.write_bytes(
+        b'{"servers":{"cursor-server":{"command":"node","args":["server.js"]}}}'
+    )
 
     components = scanner.scan(tmp_path)
 
@@ -421,13 +273,9 @@ def test_metadata_includes_args(tmp_path, scanner):
     """Test that metadata includes args array."""
     config_file = tmp_path / "mcp.json"
 
-    config_data = {
-        "servers": {
-            "test": {"command": "npx", "args": ["-y", "test-server", "--port", "3000"]},
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
+    config_file.write_bytes(
+        b'{"servers":{"test":{"command":"npx","args":["-y","test-server","--port","3000"]}}}'
+    )
 
     components = scanner.scan(tmp_path)
 
@@ -435,22 +283,3 @@ def test_metadata_includes_args(tmp_path, scanner):
     comp = components[0]
     assert "args" in comp.metadata
     assert comp.metadata["args"] == ["-y", "test-server", "--port", "3000"]
-
-
-def test_provider_guessing_database(tmp_path, scanner):
-    """Test provider guessing for database servers."""
-    config_file = tmp_path / "mcp.json"
-
-    config_data = {
-        "servers": {
-            "sqlite": {"command": "npx", "args": ["@modelcontextprotocol/server-sqlite"]},
-        }
-    }
-
-    config_file.write_text(json.dumps(config_data))
-
-    components = scanner.scan(tmp_path)
-
-    assert len(components) == 1
-    comp = components[0]
-    assert comp.provider == "MCP Database"
@@ -1,15 +1,41 @@
 """Tests for model file scanner."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 
 from ai_bom.models import ComponentType
 from ai_bom.scanners.model_file_scanner import ModelFileScanner
+from tests.helpers import write_sparse_file
 
 
 @pytest.fixture
-def scanner():
-    """Create a ModelFileScanner instance."""
-    return ModelFileScanner()
+def scanner(model_file_scanner):
+    """The session-wide ModelFileScanner instance."""
+    return model_file_scanner
+
+
+# Read-only sample trees shared by the directory-scan tests, relative to model_tree
+_MODEL_TREE = {
+    "multi/models/model1.onnx": 6000,
+    "multi/models/model2.pt": 6000,
+    "multi/models/model3.safetensors": 6000,
+    "nested/models/subdir/weights/model.onnx": 12000,
+    "huggingface/models/model.bin": 2 * 1024 * 1024,
+    "llama/models/model.bin": 2 * 1024 * 1024,
+}
+
+
+@pytest.fixture(scope="module")
+def model_tree(tmp_path_factory):
+    """Build ``_MODEL_TREE`` once for the module; tests only scan it."""
+    root = tmp_path_factory.mktemp("model_tree")
+    for rel_path, size in _MODEL_TREE.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_sparse_file(path, size)
+    return root
 
 
 def test_scanner_registration():
@@ -67,7 +93,7 @@ def test_supports_large_bin_file(tmp_path, scanner):
     """Test that scanner supports large .bin files (>1MB)."""
     model_file = tmp_path / "model.bin"
     # Create a file larger than 1MB
-    model_file.write_bytes(b"0" * (2 * 1024 * 1024))  # 2MB
+    write_sparse_file(model_file, 2 * 1024 * 1024)  # 2MB
 
     assert scanner.supports(model_file)
 
@@ -91,7 +117,7 @@ def test_not_supports_non_model_file(tmp_path, scanner):
 def test_scan_onnx_model(tmp_path, scanner):
     """Test scanning an ONNX model file."""
     model_file = tmp_path / "resnet50.onnx"
-    model_file.write_bytes(b"fake onnx model" * 1000)
+    write_sparse_file(model_file, 15_000)
 
     components = scanner.scan(tmp_path)
 
@@ -109,7 +135,7 @@ def test_scan_onnx_model(tmp_path, scanner):
 def test_scan_pytorch_model(tmp_path, scanner):
     """Test scanning a PyTorch model file."""
     model_file = tmp_path / "bert.pt"
-    model_file.write_bytes(b"fake pytorch model" * 1000)
+    write_sparse_file(model_file, 18_000)
 
     components = scanner.scan(tmp_path)
 
@@ -123,7 +149,7 @@ def test_scan_pytorch_model(tmp_path, scanner):
 def test_scan_tensorflow_model(tmp_path, scanner):
     """Test scanning a TensorFlow model file."""
     model_file = tmp_path / "model.pb"
-    model_file.write_bytes(b"fake tf model" * 1000)
+    write_sparse_file(model_file, 13_000)
 
     components = scanner.scan(tmp_path)
 
@@ -136,7 +162,7 @@ def test_scan_tensorflow_model(tmp_path, scanner):
 def test_scan_safetensors_model(tmp_path, scanner):
     """Test scanning a Safetensors model file."""
     model_file = tmp_path / "model.safetensors"
-    model_file.write_bytes(b"fake safetensors" * 1000)
+    write_sparse_file(model_file, 16_000)
 
     components = scanner.scan(tmp_path)
 
@@ -149,7 +175,7 @@ def test_scan_safetensors_model(tmp_path, scanner):
 def test_scan_gguf_model(tmp_path, scanner):
     """Test scanning a GGUF model file."""
     model_file = tmp_path / "llama-7b.gguf"
-    model_file.write_bytes(b"fake gguf model" * 1000)
+    write_sparse_file(model_file, 15_000)
 
     components = scanner.scan(tmp_path)
 
@@ -163,7 +189,7 @@ def test_scan_large_bin_model(tmp_path, scanner):
     """Test scanning a large .bin file."""
     model_file = tmp_path / "pytorch_model.bin"
     # Create 2MB file
-    model_file.write_bytes(b"0" * (2 * 1024 * 1024))
+    write_sparse_file(model_file, 2 * 1024 * 1024)
 
     components = scanner.scan(tmp_path)
 
@@ -173,44 +199,84 @@ def test_scan_large_bin_model(tmp_path, scanner):
     assert comp.metadata["file_size_mb"] == 2.0
 
 
-def test_scan_multiple_models(tmp_path, scanner):
+def test_scan_multiple_models(model_tree, scanner):
     """Test scanning directory with multiple model files."""
-    models_dir = tmp_path / "models"
-    models_dir.mkdir()
-
-    (models_dir / "model1.onnx").write_bytes(b"model1" * 1000)
-    (models_dir / "model2.pt").write_bytes(b"model2" * 1000)
-    (models_dir / "model3.safetensors").write_bytes(b"model3" * 1000)
-
-    components = scanner.scan(tmp_path)
+    components = scanner.scan(model_tree / "multi")
 
     assert len(components) == 3
     formats = {c.metadata["format"] for c in components}
-    assert "ONNX" in formats
-    assert "PyTorch" in formats
-    assert "Safetensors" in formats
+    assert {"ONNX", "PyTorch", "Safetensors"}.issubset(formats)
 
 
-def test_scan_nested_directories(tmp_path, scanner):
+def test_scan_nested_directories(model_tree, scanner):
     """Test scanning nested directories for models."""
-    nested_dir = tmp_path / "models" / "subdir" / "weights"
-    nested_dir.mkdir(parents=True)
+    components = scanner.scan(model_tree / "nested")
 
-    model_file = nested_dir / "model.onnx"
-    model_file.write_bytes(b"nested model" * 1000)
+    assert len(components) == 1
+    comp = components[0]
+    assert "weights" in comp.location.file_path
+
+
+@pytest.mark.parametrize("parallel", ["", "1"])
+def test_scan_wide_tree(tmp_path, scanner, monkeypatch, parallel):
+    """Test that a wide tree yields every model in path order, serial or threaded."""
+    monkeypatch.setenv("AI_BOM_PARALLEL", parallel)
+    for i in range(8):
+        nested_dir = tmp_path / f"team{i}" / "weights"
+        nested_dir.mkdir(parents=True)
+        (nested_dir / f"model{i}.onnx").write_bytes(b"model")
+        (tmp_path / f"team{i}" / "notes.txt").write_bytes(b"notes")
+
+    components = scanner.scan(tmp_path)
+
+    assert [c.name for c in components] == [f"model{i}.onnx" for i in range(8)]
+
+
+def test_supports_directory_stops_at_first_model(tmp_path, scanner):
+    """Test that supports() on a directory does not walk the whole tree."""
+    (tmp_path / "model.onnx").write_bytes(b"model")
+    (tmp_path / "sub").mkdir()
+
+    with patch.object(scanner, "_walk_model_files", side_effect=AssertionError("full walk")):
+        assert scanner.supports(tmp_path)
+
+
+def test_scan_does_not_follow_directory_symlinks(tmp_path, scanner):
+    """Test that symlinked directories are not walked, so models are not reported twice."""
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    (models_dir / "model.pt").write_bytes(b"model")
+    (tmp_path / "models-link").symlink_to(models_dir, target_is_directory=True)
 
     components = scanner.scan(tmp_path)
 
     assert len(components) == 1
-    comp = components[0]
-    assert "weights" in comp.location.file_path
 
 
+@pytest.mark.parametrize(
+    "excluded_path",
+    [".git/objects/pack/xyz.onnx", "node_modules/pkg/model.onnx", ".venv/lib/model.pt"],
+)
+def test_scan_skips_excluded_directories(tmp_path, scanner, excluded_path):
+    """Test that models under excluded directories are neither scanned nor supported."""
+    model_file = tmp_path / excluded_path
+    model_file.parent.mkdir(parents=True)
+    model_file.write_bytes(b"model")
+
+    assert scanner.scan(tmp_path) == []
+    assert not scanner.supports(tmp_path)
+
+    # Models elsewhere in the tree are still found
+    (tmp_path / "model.onnx").write_bytes(b"model")
+    assert [c.name for c in scanner.scan(tmp_path)] == ["model.onnx"]
+
+
+@pytest.mark.slow_fs
 def test_scan_large_model_flag(tmp_path, scanner):
     """Test that large models (>1GB) are flagged."""
     model_file = tmp_path / "large_model.onnx"
     # Create 1.1GB file
-    model_file.write_bytes(b"0" * (1100 * 1024 * 1024))
+    write_sparse_file(model_file, 1100 * 1024 * 1024)
 
     components = scanner.scan(tmp_path)
 
@@ -222,7 +288,7 @@ def test_scan_large_model_flag(tmp_path, scanner):
 def test_scan_small_model_no_flag(tmp_path, scanner):
     """Test that small models are not flagged."""
     model_file = tmp_path / "small_model.onnx"
-    model_file.write_bytes(b"small" * 1000)
+    write_sparse_file(model_file, 5000)
 
     components = scanner.scan(tmp_path)
 
@@ -231,30 +297,18 @@ def test_scan_small_model_no_flag(tmp_path, scanner):
     assert "large_model_file" not in comp.flags
 
 
-def test_guess_provider_huggingface(tmp_path, scanner):
+def test_guess_provider_huggingface(model_tree, scanner):
     """Test provider guessing for HuggingFace paths."""
-    hf_dir = tmp_path / "huggingface" / "models"
-    hf_dir.mkdir(parents=True)
-
-    model_file = hf_dir / "model.bin"
-    model_file.write_bytes(b"0" * (2 * 1024 * 1024))
-
-    components = scanner.scan(tmp_path)
+    components = scanner.scan(model_tree / "huggingface")
 
     assert len(components) == 1
     comp = components[0]
     assert comp.provider == "HuggingFace"
 
 
-def test_guess_provider_llama(tmp_path, scanner):
+def test_guess_provider_llama(model_tree, scanner):
     """Test provider guessing for llama paths."""
-    llama_dir = tmp_path / "llama" / "models"
-    llama_dir.mkdir(parents=True)
-
-    model_file = llama_dir / "model.bin"
-    model_file.write_bytes(b"0" * (2 * 1024 * 1024))
-
-    components = scanner.scan(tmp_path)
+    components = scanner.scan(model_tree / "llama")
 
     assert len(components) == 1
     comp = components[0]
@@ -264,7 +318,7 @@ def test_guess_provider_llama(tmp_path, scanner):
 def test_scan_tflite_model(tmp_path, scanner):
     """Test scanning TensorFlow Lite model."""
     model_file = tmp_path / "model.tflite"
-    model_file.write_bytes(b"tflite model" * 1000)
+    write_sparse_file(model_file, 12_000)
 
     components = scanner.scan(tmp_path)
 
@@ -276,7 +330,7 @@ def test_scan_tflite_model(tmp_path, scanner):
 def test_scan_mlmodel_file(tmp_path, scanner):
     """Test scanning Core ML model."""
     model_file = tmp_path / "model.mlmodel"
-    model_file.write_bytes(b"mlmodel" * 1000)
+    write_sparse_file(model_file, 7000)
 
     components = scanner.scan(tmp_path)
 
@@ -289,7 +343,7 @@ def test_scan_mlmodel_file(tmp_path, scanner):
 def test_scan_ggml_file(tmp_path, scanner):
     """Test scanning GGML model file."""
     model_file = tmp_path / "model.ggml"
-    model_file.write_bytes(b"ggml model" * 1000)
+    write_sparse_file(model_file, 10_000)
 
     components = scanner.scan(tmp_path)
 
@@ -302,7 +356,7 @@ def test_scan_ggml_file(tmp_path, scanner):
 def test_scan_single_file_path(tmp_path, scanner):
     """Test scanning a single file path directly."""
     model_file = tmp_path / "model.onnx"
-    model_file.write_bytes(b"onnx model" * 1000)
+    write_sparse_file(model_file, 10_000)
 
     components = scanner.scan(model_file)
 
@@ -325,7 +379,7 @@ def test_file_size_calculation(tmp_path, scanner):
     model_file = tmp_path / "model.onnx"
     # Create 5MB file
     file_size = 5 * 1024 * 1024
-    model_file.write_bytes(b"0" * file_size)
+    write_sparse_file(model_file, file_size)
 
     components = scanner.scan(tmp_path)
 
@@ -333,3 +387,35 @@ def test_file_size_calculation(tmp_path, scanner):
     comp = components[0]
     assert comp.metadata["file_size_bytes"] == file_size
     assert comp.metadata["file_size_mb"] == 5.0
+
+
+def test_directory_scan_reuses_walk_sizes(tmp_path, scanner, monkeypatch):
+    """Test that sizes come from the directory walk rather than a second stat per file."""
+    write_sparse_file(tmp_path / "model.onnx", 1024)
+    write_sparse_file(tmp_path / "weights.bin", 2 * 1024 * 1024)
+
+    def _no_getsize(path):
+        raise AssertionError(f"unexpected re-stat of {path}")
+
+    monkeypatch.setattr(os.path, "getsize", _no_getsize)
+
+    components = scanner.scan(tmp_path)
+
+    assert {c.name: c.metadata["file_size_bytes"] for c in components} == {
+        "model.onnx": 1024,
+        "weights.bin": 2 * 1024 * 1024,
+    }
+
+
+def test_scan_never_reads_model_contents(model_tree, scanner, monkeypatch):
+    """Test that classification is by extension and size alone, so huge models cost no reads."""
+
+    def _no_open(*args, **kwargs):
+        raise AssertionError(f"unexpected open({args[0]!r})")
+
+    monkeypatch.setattr("builtins.open", _no_open)
+    monkeypatch.setattr(os, "open", _no_open)
+
+    components = scanner.scan(model_tree)
+
+    assert len(components) == len(_MODEL_TREE)
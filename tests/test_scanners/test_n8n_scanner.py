@@ -1,48 +1,80 @@
 """Tests for n8n scanner."""
 
-import pytest
+from unittest.mock import patch
 
-from ai_bom.scanners.n8n_scanner import N8nScanner
+import pytest
 
 
 @pytest.fixture
-def scanner():
-    return N8nScanner()
+def scanner(n8n_scanner):
+    return n8n_scanner
+
+
+@pytest.fixture(scope="module")
+def sample_workflow_path(fixtures_dir):
+    return fixtures_dir / "sample_n8n_workflow.json"
+
+
+@pytest.fixture(scope="module")
+def sample_components(n8n_scanner, sample_workflow_path):
+    """Components from the sample workflow, read and parsed once for the module."""
+    return n8n_scanner.scan_bytes(sample_workflow_path.read_bytes(), sample_workflow_path)
 
 
 class TestN8nScanner:
     def test_name(self, scanner):
         assert scanner.name == "n8n"
 
-    def test_detects_ai_agent(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_n8n_workflow.json")
-        assert len(components) > 0
-        types = [c.type.value for c in components]
+    def test_detects_ai_agent(self, sample_components):
+        assert len(sample_components) > 0
+        types = [c.type.value for c in sample_components]
         assert "agent_framework" in types or "llm_provider" in types
 
-    def test_detects_openai_model(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_n8n_workflow.json")
-        providers = [c.provider for c in components]
+    def test_detects_openai_model(self, sample_components):
+        providers = [c.provider for c in sample_components]
         assert any("OpenAI" in p for p in providers)
 
-    def test_detects_webhook_no_auth(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_n8n_workflow.json")
+    def test_detects_webhook_no_auth(self, sample_components):
         flags = []
-        for c in components:
+        for c in sample_components:
             flags.extend(c.flags)
         assert "webhook_no_auth" in flags
 
-    def test_source_is_n8n(self, scanner, fixtures_dir):
-        components = scanner.scan(fixtures_dir / "sample_n8n_workflow.json")
-        for c in components:
+    def test_source_is_n8n(self, sample_components):
+        for c in sample_components:
             assert c.source == "n8n"
 
+    def test_scan_file_matches_scan_bytes(self, scanner, sample_workflow_path, sample_components):
+        components = scanner.scan(sample_workflow_path)
+        assert [c.model_dump(exclude={"id"}) for c in components] == [
+            c.model_dump(exclude={"id"}) for c in sample_components
+        ]
+
+    def test_scan_bytes_rejects_non_workflow(self, scanner, tmp_path):
+        assert scanner.scan_bytes(b'{"name": "test"}', tmp_path / "package.json") == []
+        assert scanner.scan_bytes(b"{ invalid", tmp_path / "broken.json") == []
+
+    @pytest.mark.parametrize("extra", [b'"pinData": NaN, ', b'"note": "\\ud800", '])
+    def test_scan_bytes_accepts_what_stdlib_json_accepts(
+        self, scanner, sample_workflow_path, sample_components, extra
+    ):
+        """NaN literals and lone surrogates must not depend on the speedups extra."""
+        raw = sample_workflow_path.read_bytes().replace(b"{", b"{" + extra, 1)
+        components = scanner.scan_bytes(raw, sample_workflow_path)
+        assert len(components) == len(sample_components)
+
     def test_skips_non_n8n_json(self, scanner, tmp_path):
         f = tmp_path / "package.json"
         f.write_text('{"name": "test", "version": "1.0.0"}')
         components = scanner.scan(tmp_path)
         assert components == []
 
+    def test_non_n8n_json_is_not_decoded(self, scanner, tmp_path):
+        (tmp_path / "package.json").write_text('{"name": "test", "version": "1.0.0"}')
+        (tmp_path / "graph.json").write_text('{"nodes": [{"id": 1}]}')
+        with patch("ai_bom.utils.fast_json.loads", side_effect=AssertionError("decoded")):
+            assert scanner.scan(tmp_path) == []
+
     def test_empty_directory(self, scanner, tmp_path):
         components = scanner.scan(tmp_path)
         assert components == []
@@ -1,32 +1,34 @@
 """Tests for network scanner."""
 
-from pathlib import Path
-
 import pytest
 
-from ai_bom.scanners.network_scanner import NetworkScanner
+_OPENAI_ENV_LINE = "OPENAI_API_KEY=sk-demo1234567890abcdefghijklmnopqrstuvwxyz0000\n"
 
 
 @pytest.fixture
-def scanner():
-    return NetworkScanner()
+def scanner(network_scanner):
+    return network_scanner
+
+
+@pytest.fixture(scope="session")
+def sample_env_text(fixtures_dir):
+    """Contents of the ``sample_env`` fixture, read once per session."""
+    return (fixtures_dir / "sample_env").read_text()
 
 
 class TestNetworkScanner:
     def test_name(self, scanner):
         assert scanner.name == "network"
 
-    def test_detects_api_keys_in_env(self, scanner, tmp_path):
+    def test_detects_api_keys_in_env(self, scanner, tmp_path, sample_env_text):
         env_file = tmp_path / ".env.example"
-        # Copy fixture content
-        fixtures = Path(__file__).parent.parent / "fixtures" / "sample_env"
-        env_file.write_text(fixtures.read_text())
+        env_file.write_text(sample_env_text)
         components = scanner.scan(tmp_path)
         assert len(components) > 0
 
     def test_detects_openai_key(self, scanner, tmp_path):
         f = tmp_path / ".env"
-        f.write_text("OPENAI_API_KEY=sk-demo1234567890abcdefghijklmnopqrstuvwxyz0000\n")
+        f.write_text(_OPENAI_ENV_LINE)
         components = scanner.scan(tmp_path)
         assert len(components) > 0
         providers = [c.provider for c in components]
@@ -34,7 +36,7 @@ class TestNetworkScanner:
 
     def test_source_is_network(self, scanner, tmp_path):
         env_file = tmp_path / ".env"
-        env_file.write_text("OPENAI_API_KEY=sk-demo1234567890abcdefghijklmnopqrstuvwxyz0000\n")
+        env_file.write_text(_OPENAI_ENV_LINE)
         components = scanner.scan(tmp_path)
         for c in components:
             assert c.source == "network"
@@ -7,14 +7,54 @@ connecting to the Trusera platform. Useful for:
 - Air-gapped environments
 - Proof-of-concept deployments
 - CI/CD pipeline integration
+
+The examples share one ``httpx.Client`` so they reuse a single connection pool.
+The interceptor patches ``httpx.Client.send`` at class level, so requests made
+through an existing client are intercepted too.
 """
 
 import httpx
 
 from trusera_sdk import RequestBlockedError, StandaloneInterceptor
 
+# Policies are passed inline with policy_text, so the examples never write
+# policy files to disk.
+BLOCKLIST_POLICY = """
+// Block requests to DeepSeek API
+forbid (
+    principal,
+    action == Action::"http",
+    resource
+) when {
+    request.hostname contains "deepseek.com"
+};
+
+// Block all DELETE requests
+forbid (
+    principal,
+    action == Action::"http",
+    resource
+) when {
+    request.method == "DELETE"
+};
+
+// Block uploads
+forbid (
+    principal,
+    action == Action::"http",
+    resource
+) when {
+    request.path contains "/upload"
+};
+"""
+
+ADMIN_POLICY = """
+forbid (principal, action == Action::"http", resource)
+when { request.path contains "/admin" };
+"""
+
 
-def example_basic_usage():
+def example_basic_usage(client: httpx.Client):
     """Basic usage with logging only."""
     print("\n=== Basic Usage (log mode) ===")
 
@@ -29,7 +69,6 @@ def example_basic_usage():
 
     try:
         # Make some HTTP requests - they will be logged
-        client = httpx.Client()
         response = client.get("https://httpbin.org/get")
         print(f"Request 1: {response.status_code}")
 
@@ -46,46 +85,13 @@ def example_basic_usage():
         print("Check agent-events.jsonl for logged events")
 
 
-def example_with_policy():
+def example_with_policy(client: httpx.Client):
     """Usage with Cedar policy enforcement."""
     print("\n=== With Policy (block mode) ===")
 
-    # First, create a policy file
-    policy_content = '''
-    // Block requests to DeepSeek API
-    forbid (
-        principal,
-        action == Action::"http",
-        resource
-    ) when {
-        request.hostname contains "deepseek.com"
-    };
-
-    // Block all DELETE requests
-    forbid (
-        principal,
-        action == Action::"http",
-        resource
-    ) when {
-        request.method == "DELETE"
-    };
-
-    // Block uploads
-    forbid (
-        principal,
-        action == Action::"http",
-        resource
-    ) when {
-        request.path contains "/upload"
-    };
-    '''
-
-    with open("example-policy.cedar", "w") as f:
-        f.write(policy_content)
-
     # Create interceptor with policy
     interceptor = StandaloneInterceptor(
-        policy_file="example-policy.cedar",
+        policy_text=BLOCKLIST_POLICY,
         enforcement="block",
         log_file="policy-events.jsonl",
     )
@@ -93,7 +99,6 @@ def example_with_policy():
     interceptor.install()
 
     try:
-        client = httpx.Client()
 
         # This request will be allowed
         print("Making allowed request...")
@@ -115,7 +120,7 @@ def example_with_policy():
         interceptor.uninstall()
 
 
-def example_context_manager():
+def example_context_manager(client: httpx.Client):
     """Using interceptor as a context manager."""
     print("\n=== Context Manager Usage ===")
 
@@ -124,7 +129,6 @@ def example_context_manager():
         enforcement="warn",
         log_file="context-events.jsonl",
     ):
-        client = httpx.Client()
         resp = client.get("https://httpbin.org/get")
         print(f"Request made: {resp.status_code}")
 
@@ -132,7 +136,7 @@ def example_context_manager():
     print("Interceptor uninstalled automatically")
 
 
-def example_exclude_patterns():
+def example_exclude_patterns(client: httpx.Client):
     """Excluding certain URLs from interception."""
     print("\n=== With Exclude Patterns ===")
 
@@ -146,7 +150,6 @@ def example_exclude_patterns():
             r"127\.0\.0\.1",    # Skip loopback
         ],
     ) as iceptor:
-        client = httpx.Client()
 
         # This will be intercepted
         client.get("https://httpbin.org/get")
@@ -164,18 +167,10 @@ def example_enforcement_modes():
     """Demonstrating different enforcement modes."""
     print("\n=== Enforcement Modes ===")
 
-    policy_content = '''
-    forbid (principal, action == Action::"http", resource)
-    when { request.path contains "/admin" };
-    '''
-
-    with open("admin-policy.cedar", "w") as f:
-        f.write(policy_content)
-
     # Mode 1: LOG - logs violations but allows requests
     print("\n1. LOG mode:")
     with StandaloneInterceptor(
-        policy_file="admin-policy.cedar",
+        policy_text=ADMIN_POLICY,
         enforcement="log",
         log_file="log-mode.jsonl",
     ):
@@ -185,7 +180,7 @@ def example_enforcement_modes():
     # Mode 2: WARN - prints warnings and allows requests
     print("\n2. WARN mode:")
     with StandaloneInterceptor(
-        policy_file="admin-policy.cedar",
+        policy_text=ADMIN_POLICY,
         enforcement="warn",
     ):
         # Would print warning but allow the request
@@ -194,7 +189,7 @@ def example_enforcement_modes():
     # Mode 3: BLOCK - raises exception and blocks requests
     print("\n3. BLOCK mode:")
     with StandaloneInterceptor(
-        policy_file="admin-policy.cedar",
+        policy_text=ADMIN_POLICY,
         enforcement="block",
     ):
         print("BLOCK mode: violations raise RequestBlockedError")
@@ -204,14 +199,15 @@ if __name__ == "__main__":
     print("Trusera StandaloneInterceptor Examples")
     print("=" * 50)
 
-    example_basic_usage()
-    example_context_manager()
-    example_exclude_patterns()
-    example_enforcement_modes()
+    with httpx.Client() as http_client:
+        example_basic_usage(http_client)
+        example_context_manager(http_client)
+        example_exclude_patterns(http_client)
+        example_enforcement_modes()
 
-    # Note: example_with_policy() would require actual blocked domains
-    # Uncomment to test with real blocked domains:
-    # example_with_policy()
+        # Note: example_with_policy() would require actual blocked domains
+        # Uncomment to test with real blocked domains:
+        # example_with_policy(http_client)
 
     print("\n" + "=" * 50)
     print("Examples complete!")
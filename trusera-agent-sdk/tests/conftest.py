@@ -2,7 +2,6 @@
 
 from unittest.mock import Mock
 
-import httpx
 import pytest
 
 try:
@@ -16,18 +15,29 @@ from trusera_sdk import TruseraClient
 from trusera_sdk.cedar import EvaluationResult, PolicyDecision
 
 
+class _StubHttpxClient:
+    """Stand-in for ``httpx.Client`` with just the methods the SDK calls.
+
+    ``Mock(spec=httpx.Client)`` introspects the whole client class for every
+    test; plain ``Mock`` attributes on this small class record the same calls
+    (``post``, ``get``, ``close``) for tests to assert on, without that cost.
+    """
+
+    def __init__(self):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"id": "agent_123"}
+        response.raise_for_status = Mock()
+
+        self.post = Mock(return_value=response)
+        self.get = Mock(return_value=response)
+        self.close = Mock()
+
+
 @pytest.fixture
 def mock_httpx_client(monkeypatch):
     """Mock httpx.Client for testing."""
-    mock_client = Mock(spec=httpx.Client)
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"id": "agent_123"}
-    mock_response.raise_for_status = Mock()
-
-    mock_client.post.return_value = mock_response
-    mock_client.get.return_value = mock_response
-    mock_client.close = Mock()
+    mock_client = _StubHttpxClient()
 
     # Patch httpx.Client constructor
     monkeypatch.setattr("httpx.Client", lambda **kwargs: mock_client)
@@ -201,6 +201,17 @@ def test_client_close(trusera_client, mock_httpx_client):
     mock_httpx_client.close.assert_called()
 
 
+def test_client_close_wakes_flush_thread(mock_httpx_client):
+    """Test that close() does not wait out the flush interval."""
+    client = TruseraClient(api_key="tsk_test_key", flush_interval=60.0)
+
+    start = time.monotonic()
+    client.close()
+
+    assert time.monotonic() - start < 5.0
+    assert not client._flush_thread.is_alive()
+
+
 def test_client_close_idempotent(trusera_client):
     """Test that close can be called multiple times safely."""
     trusera_client.close()
@@ -271,6 +271,29 @@ def test_interceptor_missing_policy_file():
         StandaloneInterceptor(policy_file="/nonexistent/policy.cedar")
 
 
+def test_interceptor_policy_text():
+    """Test that an inline policy is enforced without a policy file."""
+    interceptor = StandaloneInterceptor(
+        policy_text="""
+        forbid (principal, action == Action::"http", resource)
+        when { request.hostname == "blocked.com" };
+        """,
+        enforcement="block",
+    )
+
+    should_allow, _ = interceptor._evaluate_and_enforce("GET", "https://blocked.com/api")
+    assert should_allow is False
+
+    should_allow, _ = interceptor._evaluate_and_enforce("GET", "https://allowed.com/api")
+    assert should_allow is True
+
+
+def test_interceptor_policy_file_and_text_raises():
+    """Test that passing both policy_file and policy_text raises error."""
+    with pytest.raises(ValueError, match="not both"):
+        StandaloneInterceptor(policy_file="policy.cedar", policy_text="")
+
+
 def test_interceptor_install_uninstall():
     """Test install and uninstall of interceptor."""
     interceptor = StandaloneInterceptor(enforcement="log")
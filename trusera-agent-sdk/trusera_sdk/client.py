@@ -3,7 +3,6 @@
 import atexit
 import logging
 import threading
-import time
 from queue import Empty, Queue
 from typing import Any, Optional
 
@@ -178,10 +177,10 @@ class TruseraClient:
 
     def _flush_loop(self) -> None:
         """Background thread that periodically flushes events."""
-        while not self._shutdown.is_set():
-            time.sleep(self.flush_interval)
-            if not self._shutdown.is_set():
-                self.flush()
+        # Waiting on the shutdown event rather than sleeping lets close() wake
+        # the thread at once instead of blocking for up to flush_interval
+        while not self._shutdown.wait(self.flush_interval):
+            self.flush()
 
     def close(self) -> None:
         """
@@ -69,6 +69,7 @@ class StandaloneInterceptor:
         log_file: str | None = None,
         exclude_patterns: list[str] | None = None,
         debug: bool = False,
+        policy_text: str | None = None,
     ) -> None:
         """
         Initialize the standalone interceptor.
@@ -79,15 +80,19 @@ class StandaloneInterceptor:
             log_file: Path to JSONL log file (optional)
             exclude_patterns: List of regex patterns for URLs to skip interception
             debug: Enable debug logging
+            policy_text: Cedar policy source to use instead of policy_file (optional)
 
         Raises:
-            ValueError: If enforcement mode is invalid
+            ValueError: If enforcement mode is invalid or both policy_file and
+                policy_text are given
             FileNotFoundError: If policy_file is specified but doesn't exist
         """
         if enforcement not in ("block", "warn", "log"):
             raise ValueError(
                 f"Invalid enforcement mode: {enforcement}. Must be 'block', 'warn', or 'log'"
             )
+        if policy_file and policy_text is not None:
+            raise ValueError("Pass either policy_file or policy_text, not both")
 
         self.enforcement = enforcement
         self.log_file = Path(log_file) if log_file else None
@@ -102,6 +107,8 @@ class StandaloneInterceptor:
                 raise FileNotFoundError(f"Policy file not found: {policy_file}")
             self.evaluator = CedarEvaluator.from_file(str(policy_path))
             logger.info(f"Loaded Cedar policy from {policy_file}")
+        elif policy_text is not None:
+            self.evaluator = CedarEvaluator.from_text(policy_text)
 
         # Track original methods for uninstall
         self._original_sync_send: Callable[..., Any] | None = None